@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Compare rows/sec of the ``dict`` and ``fast`` CSV parser engines."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from gpt_fusion.analysis import CSV_ENGINES, load_numbers_from_csv  # noqa: E402
+
+
+def write_sample(path: Path, rows: int) -> None:
+    """Write a CSV with a few text columns around the ``value`` column."""
+    rng = random.Random(0)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("id,customer,region,value,note\n")
+        for i in range(rows):
+            f.write(f"{i},cust{i % 977},r{i % 13},{rng.uniform(0, 1000):.4f},ok\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.csv"
+        write_sample(path, args.rows)
+        for engine in CSV_ENGINES:
+            best = min(
+                _time(lambda: load_numbers_from_csv(path, engine=engine))
+                for _ in range(args.repeat)
+            )
+            print(f"{engine:>5}: {args.rows / best:>12,.0f} rows/sec ({best:.2f}s)")
+
+
+def _time(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Compare pages/sec of the HTML parser backends on generated fixture pages."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from gpt_fusion.html_backends import HTML_PARSERS, parse_html  # noqa: E402
+
+
+def listing_page(items: int) -> str:
+    """Return a product listing with nested markup around each item."""
+    rows = "".join(
+        f'<li class="item"><a href="/p/{i}">Product {i}</a>'
+        f'<span class="price">{i * 1.5:.2f}</span><p>Description {i}</p></li>'
+        for i in range(items)
+    )
+    return (
+        "<html><head><title>Listing</title></head><body>"
+        f'<nav><a href="/">Home</a></nav><ul id="items">{rows}</ul></body></html>'
+    )
+
+
+def article_page(paragraphs: int) -> str:
+    """Return a long article with inline formatting."""
+    body = "".join(
+        f"<p>Paragraph {i} with <b>bold</b>, <i>italic</i> and "
+        f'<a href="#n{i}">a link</a>.</p>'
+        for i in range(paragraphs)
+    )
+    return f"<html><head><title>Article</title></head><body>{body}</body></html>"
+
+
+FIXTURES = {
+    "listing": (listing_page(2_000), "span.price"),
+    "article": (article_page(2_000), "p"),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, (html, selector) in FIXTURES.items():
+        print(f"{name} ({len(html) / 1024:.0f} KiB, selector {selector!r})")
+        for backend in HTML_PARSERS:
+            for strain in (False, True):
+                if strain and backend not in ("html.parser", "lxml"):
+                    continue
+                selectors = [selector] if strain else None
+                try:
+                    best = min(
+                        _time(lambda: _extract(html, backend, selector, selectors))
+                        for _ in range(args.repeat)
+                    )
+                except ImportError:
+                    print(f"  {backend:>11}: not installed")
+                    break
+                label = f"{backend}{' +strain' if strain else ''}"
+                print(
+                    f"  {label:>18}: {1 / best:>8,.1f} pages/sec ({best * 1000:.1f} ms)"
+                )
+
+
+def _extract(html: str, backend: str, selector: str, selectors) -> list[str]:
+    document = parse_html(html, backend, selectors)
+    return [document.text(element) for element in document.select(selector)]
+
+
+def _time(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
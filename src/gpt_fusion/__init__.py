@@ -5,9 +5,30 @@ from __future__ import annotations
 import importlib
 from typing import Any
 
-from .analysis import average_from_csv, load_numbers_from_csv, median_from_csv
+from .analysis import (
+    CSVAggregate,
+    CSVColumns,
+    CSVGroup,
+    CSVHistogram,
+    CSVStats,
+    CSVTailAggregator,
+    aggregate_csvs,
+    average_from_csv,
+    describe_csv,
+    group_by_csv,
+    histogram_from_csv,
+    iter_group_by_csv,
+    load_column_from_arrow,
+    load_columns_from_csv,
+    load_numbers_from_csv,
+    median_from_csv,
+    percentiles_from_csv,
+    sketch_from_csv,
+)
 from .config import config, get_config, update_config
 from .core import greet
+from .search_index import InvertedIndex
+from .sketches import HeavyHitters, HyperLogLog, QuantileSketch
 from .exceptions import (
     ConfigurationError,
     DataError,
@@ -25,18 +46,35 @@ from .utils import (
     subtract_numbers,
 )
 from .text_utils import (
+    TextStats,
+    analyze_text,
     is_palindrome,
+    iter_words,
     most_common_word,
+    most_common_word_batch,
     remove_punctuation,
     reverse_words,
+    stream_top_words,
     to_title_case,
+    top_words,
     unique_words,
+    unique_words_batch,
+    unique_words_sketch,
     word_count,
+    word_count_batch,
+    word_frequencies,
     count_characters,
+    count_characters_batch,
 )
 
 _OPTIONAL_ATTRS: dict[str, tuple[str, str]] = {
     "scrape": ("web_scraper", "scrape"),
+    "scrape_fields": ("web_scraper", "scrape_fields"),
+    "scrape_many": ("web_scraper", "scrape_many"),
+    "scrape_many_sync": ("web_scraper", "scrape_many_sync"),
+    "ScrapeResult": ("web_scraper", "ScrapeResult"),
+    "get_response_cache": ("web_scraper", "get_response_cache"),
+    "parse_html": ("html_backends", "parse_html"),
     "backend_app": ("backend", "app"),
     "TwitterBot": ("twitter_bot", "TwitterBot"),
     "TwitchClient": ("twitch", "TwitchClient"),
@@ -69,15 +107,51 @@ __all__ = [
     "average_from_csv",
     "load_numbers_from_csv",
     "median_from_csv",
+    "describe_csv",
+    "CSVStats",
+    "load_columns_from_csv",
+    "CSVColumns",
+    "CSVTailAggregator",
+    "aggregate_csvs",
+    "CSVAggregate",
+    "group_by_csv",
+    "iter_group_by_csv",
+    "CSVGroup",
+    "histogram_from_csv",
+    "CSVHistogram",
+    "load_column_from_arrow",
+    "percentiles_from_csv",
+    "sketch_from_csv",
+    "QuantileSketch",
+    "HeavyHitters",
+    "HyperLogLog",
+    "InvertedIndex",
     "is_palindrome",
     "most_common_word",
+    "top_words",
     "word_count",
     "unique_words",
+    "unique_words_sketch",
     "reverse_words",
     "count_characters",
+    "word_count_batch",
+    "unique_words_batch",
+    "most_common_word_batch",
+    "count_characters_batch",
+    "TextStats",
+    "analyze_text",
+    "iter_words",
+    "word_frequencies",
+    "stream_top_words",
     "remove_punctuation",
     "to_title_case",
     "scrape",
+    "scrape_fields",
+    "scrape_many",
+    "scrape_many_sync",
+    "ScrapeResult",
+    "get_response_cache",
+    "parse_html",
     "minify_dir",
     "TwitterBot",
     "TwitchClient",
@@ -1,11 +1,48 @@
 from __future__ import annotations
 
+import bz2
 import csv
+import glob
+import gzip
+import hashlib
+import heapq
+import io
+import json
+import logging
+import lzma
+import math
+import os
+import pickle
+import random
+import tempfile
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from statistics import mean, median
-from typing import Iterator
+from statistics import fmean, mean
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Sequence
 
+from .config import get_config
+from .csv_cache import load_cached_values, store_cached_values
 from .exceptions import DataError, SecurityError
+from .sketches import QuantileSketch, _blend, _extreme, _quantile_position
+
+logger = logging.getLogger(__name__)
+
+CSV_ENGINES = ("dict", "fast")
+
+# Byte ranges handed to parallel workers are at least this large
+_MIN_RANGE_BYTES = 1 << 20
+_RANGE_BLOCK_BYTES = 1 << 20
+
+# Smallest sorted run (in values) written by the external quantile sort
+_MIN_RUN_VALUES = 1024
+
+# Number of hash partitions used when group-by tables spill to disk
+_GROUP_SPILL_PARTITIONS = 16
 
 
 def _validate_csv_path(path: str | Path) -> Path:
@@ -33,16 +70,320 @@ def _validate_csv_path(path: str | Path) -> Path:
     return path
 
 
+# Leading bytes identifying compressed inputs
+_COMPRESSION_MAGIC = {
+    b"\x1f\x8b": "gzip",
+    b"BZh": "bz2",
+    b"\xfd7zXZ\x00": "xz",
+    b"\x28\xb5\x2f\xfd": "zstd",
+}
+
+
+def _detect_compression(path: Path) -> str | None:
+    """Return the compression format of *path* from its magic bytes, if any.
+
+    Content is checked rather than the extension so that a misnamed
+    ``.csv.gz`` (or an uncompressed file with that name) is still read.
+    """
+    with open(path, "rb") as f:
+        head = f.read(6)
+    for magic, name in _COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def _open_csv_binary(path: Path) -> BinaryIO:
+    """Open *path* for binary reading, decompressing gzip/bz2/xz/zstd inputs.
+
+    Decompression is streamed in chunks, so memory use does not depend on
+    the file size.
+    """
+    compression = _detect_compression(path)
+    if compression == "gzip":
+        return gzip.open(path, "rb")  # type: ignore[return-value]
+    if compression == "bz2":
+        return bz2.open(path, "rb")  # type: ignore[return-value]
+    if compression == "xz":
+        return lzma.open(path, "rb")  # type: ignore[return-value]
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(
+                "Reading zstd-compressed CSV files requires the 'zstandard' "
+                "package. Install with: pip install 'gpt-fusion[zstd]'"
+            ) from e
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"))
+        return io.BufferedReader(reader)  # type: ignore[arg-type]
+    return open(path, "rb")
+
+
+def _open_csv_text(path: Path) -> io.TextIOWrapper:
+    """Open *path* as text for the ``csv`` module, decompressing if needed."""
+    return io.TextIOWrapper(_open_csv_binary(path), encoding="utf-8", newline="")
+
+
+class _PrefixedReader(io.RawIOBase):
+    """Raw stream serving *prefix* before the rest of *stream*."""
+
+    def __init__(self, prefix: bytes, stream: BinaryIO) -> None:
+        self._prefix = memoryview(prefix)
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        if self._prefix:
+            size = min(len(buffer), len(self._prefix))
+            buffer[:size] = self._prefix[:size]
+            self._prefix = self._prefix[size:]
+            return size
+        data = self._stream.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _read_header(path: Path) -> tuple[list[str], int] | None:
+    """Return the parsed header row of *path* and the byte offset after it.
+
+    Returns ``None`` when the first ``\\n``-terminated line is not a complete
+    header record (bare ``\\r`` line endings or a quoted line break), in
+    which case only ``csv`` itself can find the header.
+    """
+    with _open_csv_binary(path) as f:
+        line = f.readline()
+    if line.count(b"\r") != line.count(b"\r\n") or line.count(b'"') % 2:
+        return None
+    header = next(csv.reader([line.decode("utf-8")]), [])
+    return header, len(line)
+
+
+def _column_index(header: list[str], column: str) -> int | None:
+    """Return the index ``csv.DictReader`` would use for *column*, if any."""
+    if column not in header:
+        return None
+    # DictReader keeps the last of duplicated field names
+    return len(header) - 1 - header[::-1].index(column)
+
+
+def _parse_field(field: str | bytes) -> float | None:
+    """Return *field* as a float, or ``None`` if it is not numeric."""
+    try:
+        return float(field)
+    except ValueError:
+        if isinstance(field, bytes):
+            # float() only accepts ASCII digits and spaces in bytes
+            return _parse_field(field.decode("utf-8"))
+        return None
+
+
+def _iter_row_values(
+    rows: Iterable[list[str]], index: int | None
+) -> Iterator[float | None]:
+    """Yield the field at *index* of each non-blank ``csv.reader`` row."""
+    for row in rows:
+        if not row:
+            continue
+        if index is None or index >= len(row):
+            yield None
+            continue
+        yield _parse_field(row[index])
+
+
+def _is_plain_block(data: bytes) -> bool:
+    """Return True if *data* can be split on commas and ``\\n`` directly."""
+    return b'"' not in data and data.count(b"\r") == data.count(b"\r\n")
+
+
+def _check_utf8(data: bytes) -> None:
+    """Raise ``UnicodeDecodeError`` if *data* is not valid UTF-8.
+
+    Splitting at the bytes level only decodes the fields it reads; checking
+    the whole block keeps invalid input an error, as with ``csv.DictReader``.
+    """
+    if not data.isascii():
+        data.decode("utf-8")
+
+
+def _parse_row_block(data: bytes, index: int | None) -> Iterator[float | None]:
+    """Yield parsed values from a block of complete CSV lines.
+
+    Unquoted blocks are split at the bytes level, reading only the field at
+    *index*; anything else goes through ``csv.reader``.
+    """
+    if not _is_plain_block(data):
+        text = io.StringIO(data.decode("utf-8"), newline="")
+        yield from _iter_row_values(csv.reader(text), index)
+        return
+
+    _check_utf8(data)
+    for line in data.split(b"\n"):
+        if line.endswith(b"\r"):
+            line = line[:-1]
+        if not line:
+            continue
+        if index is None:
+            yield None
+            continue
+        fields = line.split(b",", index + 1)
+        if len(fields) <= index:
+            yield None
+            continue
+        try:
+            yield float(fields[index])
+        except ValueError:
+            yield _parse_field(fields[index])
+
+
+def _iter_dict_values(path: Path, column: str) -> Iterator[float | None]:
+    """Yield parsed *column* values using ``csv.DictReader``."""
+    with _open_csv_text(path) as f:
+        for row in csv.DictReader(f):
+            value = row.get(column)
+            if value is None:
+                yield None
+                continue
+            yield _parse_field(value)
+
+
+def _iter_fast_blocks(path: Path, offset: int) -> Iterator[bytes | io.TextIOBase]:
+    """Yield blocks of complete lines of *path* starting at byte *offset*.
+
+    Unquoted blocks are yielded as ``bytes`` ready to be split directly. As
+    soon as a block contains quotes or bare carriage returns the rest of the
+    file is yielded once as a text stream for ``csv.reader``, so quoted
+    fields spanning lines keep the ``csv`` semantics.
+    """
+    with _open_csv_binary(path) as f:
+        f.read(offset)  # Skip the header; decompressors may not be seekable
+        tail = b""
+        while True:
+            data = f.read(_RANGE_BLOCK_BYTES)
+            if data:
+                data = tail + data
+                cut = data.rfind(b"\n") + 1
+                block, tail = data[:cut], data[cut:]
+            else:
+                # Last line without a trailing newline
+                block, tail = tail, b""
+            if not _is_plain_block(block):
+                # Replay the unparsed bytes in front of the rest of the stream
+                # instead of seeking back, which compressed streams can't do
+                rest = io.BufferedReader(_PrefixedReader(block + tail, f))
+                yield io.TextIOWrapper(rest, encoding="utf-8", newline="")
+                return
+            if block:
+                yield block
+            if not data:
+                return
+
+
+def _iter_fast_values(path: Path, column: str) -> Iterator[float | None]:
+    """Yield parsed *column* values without building a dict per row.
+
+    The column index is resolved once from the header and each unquoted
+    block of lines is split at the bytes level (see :func:`_iter_fast_blocks`).
+    """
+    parsed = _read_header(path)
+    if parsed is None:
+        yield from _iter_dict_values(path, column)
+        return
+    header, offset = parsed
+    index = _column_index(header, column)
+
+    for block in _iter_fast_blocks(path, offset):
+        if isinstance(block, bytes):
+            yield from _parse_row_block(block, index)
+        else:
+            yield from _iter_row_values(csv.reader(block), index)
+
+
+def _resolve_engine(engine: str | None) -> str:
+    """Return *engine*, falling back to ``Config.CSV_ENGINE``."""
+    engine = engine or get_config().CSV_ENGINE
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"Unknown CSV engine: {engine!r}")
+    return engine
+
+
+def _iter_csv_rows(path: Path, engine: str | None = None) -> Iterator[list[Any]]:
+    """Yield the header row of *path*, then every non-blank data row.
+
+    The fast engine yields ``bytes`` fields for unquoted blocks and ``str``
+    fields elsewhere; both are accepted by :func:`_parse_field`.
+
+    Raises:
+        DataError: If *path* is a Parquet or Arrow IPC file, which has no
+            CSV rows to read
+    """
+    if _arrow_format(path):
+        raise DataError(
+            f"{path} is a Parquet/Arrow file; read its columns with "
+            "load_column_from_arrow"
+        )
+    parsed = _read_header(path) if _resolve_engine(engine) == "fast" else None
+    if parsed is None:
+        with _open_csv_text(path) as f:
+            reader = csv.reader(f)
+            yield next(reader, [])
+            yield from (row for row in reader if row)
+        return
+
+    header, offset = parsed
+    yield header
+    for block in _iter_fast_blocks(path, offset):
+        if not isinstance(block, bytes):
+            yield from (row for row in csv.reader(block) if row)
+            continue
+        _check_utf8(block)
+        for line in block.split(b"\n"):
+            if line.endswith(b"\r"):
+                line = line[:-1]
+            if line:
+                yield line.split(b",")
+
+
+def _iter_csv_values(
+    path: Path, engine: str | None = None, column: str = "value"
+) -> Iterator[float | None]:
+    """Yield the parsed *column* field of each row in *path*.
+
+    Rows without the field or with a non-numeric value yield ``None`` so
+    callers can count them as skipped. Parquet and Arrow IPC files are read
+    one row group at a time through pyarrow, whatever the *engine*.
+
+    Args:
+        path: Validated path of the CSV file
+        engine: ``"fast"`` to read only the *column* field of each line, or
+            ``"dict"`` for ``csv.DictReader`` (default: ``Config.CSV_ENGINE``)
+        column: Name of the column to read
+    """
+    if _arrow_format(path):
+        yield from _iter_arrow_values(path, column)
+    elif _resolve_engine(engine) == "fast":
+        yield from _iter_fast_values(path, column)
+    else:
+        yield from _iter_dict_values(path, column)
+
+
 def load_numbers_from_csv_stream(
-    path: str | Path, chunk_size: int = 1000
+    path: str | Path,
+    chunk_size: int = 1000,
+    engine: str | None = None,
+    column: str = "value",
 ) -> Iterator[float]:
     """Stream numbers from a CSV file with a ``value`` column.
 
     Memory-efficient alternative to load_numbers_from_csv for large files.
 
     Args:
-        path: Path to the CSV file to load
+        path: Path to the CSV file to load (or a Parquet/Arrow IPC file)
         chunk_size: Number of rows to process at once
+        engine: Parser engine, ``"fast"`` or ``"dict"``
+            (default: ``Config.CSV_ENGINE``)
+        column: Name of the numeric column to read (default: ``value``)
 
     Yields:
         Float values from the 'value' column
@@ -52,41 +393,67 @@ def load_numbers_from_csv_stream(
         SecurityError: If path attempts directory traversal
     """
     path = _validate_csv_path(path)
+    chunk = []
 
-    with open(path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        chunk = []
+    for value in _iter_csv_values(path, engine, column):
+        # Ignore rows that are missing or cannot be converted to float
+        if value is None:
+            continue
 
-        for row in reader:
-            value = row.get("value")
-            if value is None:
-                continue
+        chunk.append(value)
+        if len(chunk) >= chunk_size:
+            yield from chunk
+            chunk = []
 
-            try:
-                chunk.append(float(value))
-            except ValueError:
-                # Ignore rows that cannot be converted to float
-                continue
+    # Yield remaining values
+    if chunk:
+        yield from chunk
 
-            if len(chunk) >= chunk_size:
-                yield from chunk
-                chunk = []
 
-        # Yield remaining values
-        if chunk:
-            yield from chunk
+def _load_cached_numbers(path: str | Path, column: str = "value") -> Sequence[float]:
+    """Return *column* of *path* through the sidecar cache.
+
+    A valid cache entry is memory-mapped; otherwise the CSV is parsed once
+    and the packed values are written to the cache for the next call. A
+    cache that cannot be written (read-only or full disk) is logged and the
+    parsed values are returned anyway.
+    """
+    path = _validate_csv_path(path)
+    cached = load_cached_values(path, column)
+    if cached is not None:
+        return cached
+
+    # Key the entry by the file as it was before parsing, so an append
+    # during the parse invalidates it instead of caching stale values
+    stat = path.stat()
+    values = array("d", load_numbers_from_csv_stream(path, column=column))
+    try:
+        store_cached_values(path, values, column, source_stat=stat)
+    except OSError as e:
+        logger.warning(f"Could not write CSV cache for {path}: {e}")
+    return values
 
 
 def load_numbers_from_csv(
-    path: str | Path, use_streaming: bool = False, chunk_size: int = 1000
+    path: str | Path,
+    use_streaming: bool = False,
+    chunk_size: int = 1000,
+    use_cache: bool = False,
+    engine: str | None = None,
+    column: str = "value",
 ) -> list[float]:
     """Load numbers from a CSV file with a ``value`` column.
 
     Args:
-        path: Path to the CSV file to load
+        path: Path to the CSV file to load (or a Parquet/Arrow IPC file)
         use_streaming: If True, use streaming for large files
             (default: False for compatibility)
         chunk_size: Number of rows to process at once when streaming
+        use_cache: If True, read the parsed column from the float64 sidecar
+            cache keyed by path, size and mtime (see ``Config.CSV_CACHE_DIR``)
+        engine: Parser engine, ``"fast"`` or ``"dict"``
+            (default: ``Config.CSV_ENGINE``)
+        column: Name of the numeric column to read (default: ``value``)
 
     Returns:
         List of float values from the 'value' column
@@ -96,33 +463,273 @@ def load_numbers_from_csv(
         SecurityError: If path attempts directory traversal
         DataError: If CSV file has no valid data
     """
+    if use_cache:
+        return _load_cached_numbers(path, column).tolist()
+
     if use_streaming:
-        return list(load_numbers_from_csv_stream(path, chunk_size))
+        return list(load_numbers_from_csv_stream(path, chunk_size, engine, column))
 
     path = _validate_csv_path(path)
+    # Ignore rows that are missing or cannot be converted to float
+    values = _iter_csv_values(path, engine, column)
+    return [value for value in values if value is not None]
+
+
+@dataclass
+class CSVColumns:
+    """Numeric columns collected from a CSV file in a single pass.
+
+    Each column keeps its valid values in a packed ``array('d')``; rows whose
+    field is missing or non-numeric are counted in :attr:`invalid`.
+    """
+
+    values: dict[str, array] = field(default_factory=dict)
+    invalid: dict[str, int] = field(default_factory=dict)
+
+    def __getitem__(self, column: str) -> array:
+        return self.values[column]
+
+    def __contains__(self, column: object) -> bool:
+        return column in self.values
+
+    @property
+    def columns(self) -> list[str]:
+        """Return the names of the loaded columns."""
+        return list(self.values)
+
+
+def load_columns_from_csv(
+    path: str | Path,
+    columns: Sequence[str] | None = None,
+    engine: str | None = None,
+) -> CSVColumns:
+    """Load several numeric columns from *path* in one pass.
+
+    Args:
+        path: Path to the CSV file to load
+        columns: Column names to load, or ``None`` for every column where at
+            least half of the rows hold a number
+        engine: Parser engine, ``"fast"`` or ``"dict"``
+            (default: ``Config.CSV_ENGINE``)
+
+    Returns:
+        One float64 array and one invalid-row count per column
 
-    with open(path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        values: list[float] = []
-        for row in reader:
-            value = row.get("value")
+    Raises:
+        FileNotFoundError: If the CSV file doesn't exist
+        SecurityError: If path attempts directory traversal
+    """
+    path = _validate_csv_path(path)
+    rows = _iter_csv_rows(path, engine)
+    header = next(rows)
+    names = list(dict.fromkeys(header if columns is None else columns))
+
+    result = CSVColumns(
+        values={name: array("d") for name in names},
+        invalid=dict.fromkeys(names, 0),
+    )
+    targets = [
+        (name, index, result.values[name].append)
+        for name in names
+        if (index := _column_index(header, name)) is not None
+    ]
+    invalid = result.invalid
+    row_count = 0
+    for row in rows:
+        row_count += 1
+        width = len(row)
+        for name, index, append in targets:
+            value = _parse_field(row[index]) if index < width else None
             if value is None:
-                continue
-            try:
-                values.append(float(value))
-            except ValueError:
-                # Ignore rows that cannot be converted to float
-                continue
-        return values
+                invalid[name] += 1
+            else:
+                append(value)
+
+    # Columns absent from the header are invalid in every row
+    for name in names:
+        if _column_index(header, name) is None:
+            invalid[name] = row_count
+
+    if columns is None:
+        for name in names:
+            if not result.values[name] or len(result.values[name]) < invalid[name]:
+                del result.values[name], result.invalid[name]
+    return result
+
 
+# File suffixes read through pyarrow instead of the CSV parser
+ARROW_FORMATS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "ipc",
+    ".feather": "ipc",
+    ".ipc": "ipc",
+}
 
-def average_from_csv(path: str | Path, use_streaming: bool = False) -> float:
-    """Return the average of the ``value`` column in *path*.
+
+def _arrow_format(path: str | Path) -> str | None:
+    """Return ``"parquet"`` or ``"ipc"`` for Arrow-backed files, else ``None``."""
+    return ARROW_FORMATS.get(Path(path).suffix.lower())
+
+
+def _import_numpy() -> Any:
+    """Import NumPy lazily, returning ``None`` when it is not installed.
+
+    NumPy is optional and only speeds up the buffer, exact-quantile and
+    Arrow helpers, so ``import gpt_fusion`` doesn't pay for loading it.
+    """
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - exercised when numpy is missing
+        return None
+    return numpy
+
+
+def _import_pyarrow() -> Any:
+    """Import pyarrow lazily so it stays an optional dependency."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Reading Parquet and Arrow files requires the 'pyarrow' package. "
+            "Install with: pip install 'gpt-fusion[arrow]'"
+        ) from e
+    return pyarrow
+
+
+def load_column_from_arrow(
+    path: str | Path,
+    column: str = "value",
+    row_groups: Sequence[int] | None = None,
+) -> Any:
+    """Read one numeric column of a Parquet or Arrow IPC file as float64.
+
+    The file is memory-mapped and only *column* (and, for Parquet, only the
+    requested row groups) is decoded. Nulls are dropped. For a single-chunk
+    float64 column of an IPC file the result is a zero-copy, read-only view
+    of the mapped data.
 
     Args:
-        path: Path to the CSV file
+        path: Path to a ``.parquet``/``.pq`` or ``.arrow``/``.feather``/
+            ``.ipc`` (Arrow IPC file format) file
+        column: Name of the numeric column to read (default: ``value``)
+        row_groups: Parquet row groups (or IPC record batches) to read
+            (default: all)
+
+    Returns:
+        NumPy float64 array when NumPy is installed, otherwise ``array('d')``
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        SecurityError: If path attempts directory traversal
+        DataError: If the column is missing or not numeric
+        ImportError: If pyarrow is not installed
+    """
+    path = _validate_csv_path(path)
+    read_groups, group_count = _open_arrow_column(path, column)
+    if row_groups is None:
+        row_groups = range(group_count)
+    return _arrow_to_float64(read_groups(row_groups), column, path)
+
+
+def _open_arrow_column(path: Path, column: str) -> tuple[Any, int]:
+    """Memory-map an Arrow-backed file for reading *column*.
+
+    Returns a function reading the column of a sequence of row groups (or
+    IPC record batches) as a ``pyarrow.ChunkedArray``, and the group count.
+    """
+    pa = _import_pyarrow()
+    if _arrow_format(path) == "parquet":
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(path, memory_map=True)
+        if column not in parquet.schema_arrow.names:
+            raise DataError(f"Column {column!r} not found in {path}")
+
+        def read_parquet(groups: Sequence[int]) -> Any:
+            return parquet.read_row_groups(groups, columns=[column]).column(column)
+
+        return read_parquet, parquet.num_row_groups
+
+    reader = pa.ipc.open_file(pa.memory_map(str(path)))
+    if column not in reader.schema.names:
+        raise DataError(f"Column {column!r} not found in {path}")
+
+    def read_ipc(groups: Sequence[int]) -> Any:
+        batches = [reader.get_batch(i) for i in groups]
+        return pa.Table.from_batches(batches, schema=reader.schema).column(column)
+
+    return read_ipc, reader.num_record_batches
+
+
+def _iter_arrow_values(path: Path, column: str) -> Iterator[float]:
+    """Yield *column* of an Arrow-backed file one row group at a time."""
+    read_groups, group_count = _open_arrow_column(path, column)
+    for group in range(group_count):
+        yield from _arrow_to_float64(read_groups([group]), column, path).tolist()
+
+
+def _arrow_to_float64(chunked: Any, column: str, path: Path) -> Any:
+    """Return a ``pyarrow.ChunkedArray`` without nulls as a float64 buffer."""
+    pa = _import_pyarrow()
+    try:
+        chunked = chunked.drop_null().cast(pa.float64())
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+        raise DataError(f"Column {column!r} in {path} is not numeric: {e}") from e
+
+    np = _import_numpy()
+    if np is not None:
+        chunks = [chunk.to_numpy() for chunk in chunked.chunks]
+        if len(chunks) == 1:
+            return chunks[0]
+        return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.float64)
+    values = array("d")
+    for chunk in chunked.chunks:
+        data = memoryview(chunk.buffers()[1])
+        values.frombytes(data[chunk.offset * 8 : (chunk.offset + len(chunk)) * 8])
+    return values
+
+
+def _stats_from_buffer(values: Any) -> CSVStats:
+    """Summarise a packed float64 buffer without a per-value Python loop.
+
+    With NumPy every reduction is vectorised (the sum is NumPy's pairwise
+    sum); without it the values go through :meth:`CSVStats.add_many`.
+    """
+    stats = CSVStats()
+    np = _import_numpy()
+    if np is None or not len(values) or not np.isfinite(values).all():
+        stats.add_many(values)
+        return stats
+    total = float(values.sum())
+    stats.count = len(values)
+    stats.minimum = float(values.min())
+    stats.maximum = float(values.max())
+    stats._mean = total / stats.count
+    stats._m2 = float(np.square(values - stats._mean).sum())
+    stats._partials = [total]
+    return stats
+
+
+def average_from_csv(
+    path: str | Path,
+    use_streaming: bool = False,
+    use_cache: bool = False,
+    parallel: bool = False,
+    column: str = "value",
+) -> float:
+    """Return the average of the ``value`` column (or *column*) in *path*.
+
+    Args:
+        path: Path to the CSV file (or a Parquet/Arrow IPC file, see
+            :func:`load_column_from_arrow`)
         use_streaming: If True, calculate average without loading entire file
             into memory
+        use_cache: If True, average the memory-mapped sidecar cache instead of
+            reparsing the CSV
+        parallel: If True, parse byte ranges of the file in a process pool
+            (see :func:`describe_csv`)
+        column: Name of the numeric column to read (default: ``value``)
 
     Returns:
         Average of numeric values in the 'value' column
@@ -130,12 +737,27 @@ def average_from_csv(path: str | Path, use_streaming: bool = False) -> float:
     Raises:
         DataError: If no valid numeric values found
     """
+    if _arrow_format(path):
+        values = load_column_from_arrow(path, column)
+        if not len(values):
+            raise DataError(f"No valid numeric values found in {path}")
+        return fmean(values) if isinstance(values, array) else float(values.mean())
+
+    if use_cache:
+        cached = _load_cached_numbers(path, column)
+        if not cached:
+            raise DataError(f"No valid numeric values found in {path}")
+        return fmean(cached)
+
+    if parallel:
+        return describe_csv(path, parallel=True, column=column).mean
+
     if use_streaming:
         # Memory-efficient streaming calculation
         total = 0.0
         count = 0
 
-        for value in load_numbers_from_csv_stream(path):
+        for value in load_numbers_from_csv_stream(path, column=column):
             total += value
             count += 1
 
@@ -144,19 +766,196 @@ def average_from_csv(path: str | Path, use_streaming: bool = False) -> float:
 
         return total / count
 
-    values = load_numbers_from_csv(path)
+    values = load_numbers_from_csv(path, column=column)
     if not values:
         raise DataError(f"No valid numeric values found in {path}")
     return mean(values)
 
 
-def median_from_csv(path: str | Path, use_streaming: bool = False) -> float:
-    """Return the median of the ``value`` column in *path*.
+def _load_compact_numbers(
+    path: str | Path, use_cache: bool = False, column: str = "value"
+) -> Any:
+    """Collect *column* of *path* into a packed float64 buffer.
+
+    Returns a writable NumPy array when NumPy is installed, otherwise an
+    ``array('d')`` (or the memory-mapped cache view when *use_cache* is set).
+    Parquet and Arrow files are read through :func:`load_column_from_arrow`.
+    """
+    np = _import_numpy()
+    if _arrow_format(path):
+        values = load_column_from_arrow(path, column)
+        if np is not None and not values.flags.writeable:
+            values = values.copy()
+        return values
+    if use_cache:
+        values: Any = _load_cached_numbers(path, column)
+        return np.array(values, dtype=np.float64) if np is not None else values
+    stream = load_numbers_from_csv_stream(path, column=column)
+    if np is not None:
+        return np.fromiter(stream, dtype=np.float64)
+    return array("d", stream)
+
+
+def _select_ranks(values: Sequence[float], ranks: Iterable[int]) -> dict[int, float]:
+    """Return the order statistics of *values* at the 0-based *ranks*.
+
+    Uses multi-rank quickselect: each round partitions the current buffer
+    around a pivot with C-level ``filter`` calls into compact arrays and only
+    recurses into the sides that still contain wanted ranks, giving expected
+    O(n) work for any number of ranks. *values* itself is never modified.
+    """
+    rng = random.Random(0)
+    result: dict[int, float] = {}
+    pending = [(values, 0, sorted(set(ranks)))]
+    while pending:
+        buffer, base, wanted = pending.pop()
+        if len(buffer) <= 64:
+            ordered = sorted(buffer)
+            for rank in wanted:
+                result[rank] = ordered[rank - base]
+            continue
+
+        sample = sorted(buffer[rng.randrange(len(buffer))] for _ in range(3))
+        pivot = sample[1]
+        lows = array("d", filter(pivot.__gt__, buffer))
+        highs = array("d", filter(pivot.__lt__, buffer))
+        equal_end = len(buffer) - len(highs)
+
+        low_ranks, high_ranks = [], []
+        for rank in wanted:
+            local = rank - base
+            if local < len(lows):
+                low_ranks.append(rank)
+            elif local < equal_end:
+                result[rank] = pivot
+            else:
+                high_ranks.append(rank)
+        if low_ranks:
+            pending.append((lows, base, low_ranks))
+        if high_ranks:
+            pending.append((highs, base + equal_end, high_ranks))
+    return result
+
+
+def _exact_quantiles(values: Any, qs: Sequence[float]) -> list[float]:
+    """Return the interpolated *qs*-quantiles of unsorted *values*.
+
+    All requested quantiles share one selection over the same buffer.
+    """
+    positions = [_quantile_position(len(values), q) for q in qs]
+    ranks = {rank for lower, upper, _ in positions for rank in (lower, upper)}
+
+    np = _import_numpy()
+    if np is not None and isinstance(values, np.ndarray):
+        kth = sorted(ranks)
+        values.partition(kth)
+        selected = {rank: float(values[rank]) for rank in kth}
+    else:
+        selected = _select_ranks(values, ranks)
+    return [
+        _blend(selected[lower], selected[upper], fraction)
+        for lower, upper, fraction in positions
+    ]
+
+
+def _write_sorted_run(values: array, directory: str, index: int) -> BinaryIO:
+    """Sort *values* and write them as raw float64 to a new run file."""
+    np = _import_numpy()
+    if np is not None:
+        # Sort the buffer in place so a run never needs a second copy
+        ordered: Any = np.frombuffer(values, dtype=np.float64)
+        ordered.sort()
+    else:
+        ordered = array("d", sorted(values))
+    run = open(os.path.join(directory, f"run{index}.f64"), "w+b")
+    ordered.tofile(run)
+    run.seek(0)
+    return run
+
+
+def _iter_sorted_run(run: BinaryIO, block_values: int) -> Iterator[float]:
+    """Yield the values of a sorted run file, reading *block_values* at a time."""
+    while True:
+        data = run.read(block_values * 8)
+        if not data:
+            return
+        yield from array("d", data)
+
+
+def _external_quantiles(
+    path: str | Path, qs: Sequence[float], column: str = "value"
+) -> list[float]:
+    """Return exact *qs*-quantiles of *column* in *path* using bounded memory.
+
+    Values are buffered up to ``Config.CSV_SORT_MEMORY_BYTES``; each full
+    buffer is sorted and written to disk as a run of raw float64. A k-way
+    merge over the runs then walks the sorted order up to the highest wanted
+    rank. If everything fits in one buffer no file is written and the ranks
+    are selected in memory. Run files live in a temporary directory (under
+    ``Config.CSV_SORT_TEMP_DIR`` if set) that is removed afterwards.
+    """
+    config = get_config()
+    run_values = max(_MIN_RUN_VALUES, config.CSV_SORT_MEMORY_BYTES // 8)
+    stream = load_numbers_from_csv_stream(path, column=column)
+    buffer = array("d", islice(stream, run_values))
+    if not buffer:
+        raise DataError(f"No valid numeric values found in {path}")
+    if len(buffer) < run_values:
+        np = _import_numpy()
+        if np is not None:
+            return _exact_quantiles(np.frombuffer(buffer, dtype=np.float64), qs)
+        return _exact_quantiles(buffer, qs)
+
+    with tempfile.TemporaryDirectory(dir=config.CSV_SORT_TEMP_DIR or None) as tmp:
+        runs: list[BinaryIO] = []
+        count = 0
+        try:
+            while buffer:
+                count += len(buffer)
+                runs.append(_write_sorted_run(buffer, tmp, len(runs)))
+                buffer = array("d", islice(stream, run_values))
+
+            positions = [_quantile_position(count, q) for q in qs]
+            wanted = {rank for lower, upper, _ in positions for rank in (lower, upper)}
+            last = max(wanted, default=-1)
+            block_values = max(_MIN_RUN_VALUES, run_values // len(runs))
+            merged = heapq.merge(*(_iter_sorted_run(r, block_values) for r in runs))
+            selected: dict[int, float] = {}
+            for rank, value in enumerate(islice(merged, last + 1)):
+                if rank in wanted:
+                    selected[rank] = value
+        finally:
+            for run in runs:
+                run.close()
+    return [
+        _blend(selected[lower], selected[upper], fraction)
+        for lower, upper, fraction in positions
+    ]
+
+
+def median_from_csv(
+    path: str | Path,
+    use_streaming: bool = False,
+    use_cache: bool = False,
+    approximate: bool = False,
+    error: float = 0.01,
+    column: str = "value",
+    external: bool = False,
+) -> float:
+    """Return the median of the ``value`` column (or *column*) in *path*.
 
     Args:
-        path: Path to the CSV file
-        use_streaming: If True, use streaming (still loads all values for
-            median calculation)
+        path: Path to the CSV file (or a Parquet/Arrow IPC file, see
+            :func:`load_column_from_arrow`)
+        use_streaming: Kept for compatibility; values are always streamed
+            into a packed float64 buffer
+        use_cache: If True, read values from the memory-mapped sidecar cache
+        approximate: If True, estimate the median with a fixed-memory
+            quantile sketch in a single streaming pass
+        error: Normalised rank error of the sketch when *approximate* is True
+        column: Name of the numeric column to read (default: ``value``)
+        external: If True, compute the exact median with an external sort
+            whose memory is bounded by ``Config.CSV_SORT_MEMORY_BYTES``
 
     Returns:
         Median of numeric values in the 'value' column
@@ -165,12 +964,1083 @@ def median_from_csv(path: str | Path, use_streaming: bool = False) -> float:
         DataError: If no valid numeric values found
 
     Note:
-        Median calculation requires all values in memory regardless of streaming mode.
-        For very large files, consider using average_from_csv with streaming instead.
+        The exact median holds every value in memory (8 bytes each) and is
+        found by selection in expected O(n). For files larger than memory
+        use ``external=True`` for an exact result or ``approximate=True`` /
+        :func:`sketch_from_csv` for a fixed-memory estimate.
     """
-    # Note: Median requires all values to be loaded for sorting
-    # Streaming doesn't provide memory benefits for median calculation
-    values = load_numbers_from_csv(path, use_streaming=use_streaming)
-    if not values:
+    if approximate:
+        return sketch_from_csv(path, error=error, column=column).quantile(0.5)
+    return percentiles_from_csv(
+        path, [50], use_cache=use_cache, column=column, external=external
+    )[0]
+
+
+def percentiles_from_csv(
+    path: str | Path,
+    percentiles: Sequence[float],
+    use_cache: bool = False,
+    approximate: bool = False,
+    error: float = 0.01,
+    column: str = "value",
+    external: bool = False,
+) -> list[float]:
+    """Return the requested *percentiles* of the ``value`` column in *path*.
+
+    Exact results use linear interpolation between order statistics (the
+    50th percentile equals :func:`statistics.median`).
+
+    Args:
+        path: Path to the CSV file (or a Parquet/Arrow IPC file, see
+            :func:`load_column_from_arrow`)
+        percentiles: Percentiles to compute, each between 0 and 100
+        use_cache: If True, read values from the memory-mapped sidecar cache
+        approximate: If True, estimate with a fixed-memory quantile sketch
+        error: Normalised rank error of the sketch when *approximate* is True
+        column: Name of the numeric column to read (default: ``value``)
+        external: If True, sort values into bounded-size runs on disk and
+            merge them instead of holding the whole column in memory
+
+    Returns:
+        One value per requested percentile, in the same order
+
+    Raises:
+        DataError: If no valid numeric values found
+        ValueError: If a percentile is outside ``[0, 100]``
+    """
+    for p in percentiles:
+        if not 0 <= p <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, got {p}")
+    qs = [p / 100 for p in percentiles]
+    if approximate:
+        return sketch_from_csv(path, error=error, column=column).quantiles(qs)
+    if external and not _arrow_format(path):
+        return _external_quantiles(path, qs, column)
+
+    values = _load_compact_numbers(path, use_cache=use_cache, column=column)
+    if not len(values):
+        raise DataError(f"No valid numeric values found in {path}")
+    return _exact_quantiles(values, qs)
+
+
+def sketch_from_csv(
+    path: str | Path,
+    error: float = 0.01,
+    chunk_size: int = 1000,
+    column: str = "value",
+) -> QuantileSketch:
+    """Build a quantile sketch of the ``value`` column in *path*.
+
+    Memory stays fixed regardless of file size. Sketches of several files
+    can be combined with :meth:`QuantileSketch.merge`.
+
+    Args:
+        path: Path to the CSV file (or a Parquet/Arrow IPC file, see
+            :func:`load_column_from_arrow`)
+        error: Normalised rank error of the sketch (e.g. ``0.01`` for 1%)
+        chunk_size: Number of rows to process at once
+        column: Name of the numeric column to read (default: ``value``)
+
+    Returns:
+        Sketch answering ``quantile(q)`` / ``quantiles(qs)`` queries
+
+    Raises:
+        DataError: If no valid numeric values found
+    """
+    sketch = QuantileSketch.with_error(error)
+    sketch.update_many(load_numbers_from_csv_stream(path, chunk_size, column=column))
+    if not sketch:
+        raise DataError(f"No valid numeric values found in {path}")
+    return sketch
+
+
+HISTOGRAM_BINNINGS = ("auto", "linear", "log")
+
+
+@dataclass
+class CSVHistogram:
+    """Mergeable fixed-bin histogram over ``[low, high]``.
+
+    Bins are equally wide on a linear or logarithmic *scale*. Values below
+    or above the range are counted in :attr:`underflow` / :attr:`overflow`
+    (non-positive values underflow a log histogram) and NaN is ignored, so
+    histograms with the same layout can be combined exactly with
+    :meth:`merge`.
+    """
+
+    low: float
+    high: float
+    counts: list[int]
+    scale: str = "linear"
+    underflow: int = 0
+    overflow: int = 0
+
+    def __post_init__(self) -> None:
+        if self.scale not in ("linear", "log"):
+            raise ValueError(f"Unknown histogram scale {self.scale!r}")
+        if not self.counts:
+            raise ValueError("A histogram needs at least one bin")
+        if not self.low < self.high:
+            raise ValueError("Histogram low bound must be below the high bound")
+        if self.scale == "log" and self.low <= 0:
+            raise ValueError("Log-scale histogram bounds must be positive")
+
+    @classmethod
+    def empty(
+        cls, low: float, high: float, bins: int = 50, scale: str = "linear"
+    ) -> CSVHistogram:
+        """Return a histogram with *bins* zero counts spanning ``[low, high]``."""
+        return cls(low, high, [0] * bins, scale)
+
+    @property
+    def edges(self) -> list[float]:
+        """Return the ``len(counts) + 1`` bin edges."""
+        bins = len(self.counts)
+        if self.scale == "log":
+            start = math.log10(self.low)
+            step = (math.log10(self.high) - start) / bins
+            inner = [10 ** (start + step * i) for i in range(1, bins)]
+        else:
+            width = (self.high - self.low) / bins
+            inner = [self.low + width * i for i in range(1, bins)]
+        return [self.low, *inner, self.high]
+
+    @property
+    def total(self) -> int:
+        """Return the number of values counted, including out-of-range ones."""
+        return sum(self.counts) + self.underflow + self.overflow
+
+    def add_many(self, values: Iterable[float]) -> None:
+        """Count every number in *values* into its bin."""
+        counts = self.counts
+        last = len(counts) - 1
+        if self.scale == "log":
+            # log10 keeps decade edges such as 10 or 1000 exactly on a boundary
+            start, stop = math.log10(self.low), math.log10(self.high)
+            log = math.log10
+            values = (-math.inf if v <= 0 else log(v) for v in values)
+        else:
+            start, stop = self.low, self.high
+        factor = len(counts) / (stop - start)
+        underflow = overflow = 0
+        for x in values:
+            if start <= x < stop:
+                counts[min(int((x - start) * factor), last)] += 1
+            elif x < start:
+                underflow += 1
+            elif x == stop:
+                counts[last] += 1
+            elif x > stop:
+                overflow += 1
+        self.underflow += underflow
+        self.overflow += overflow
+
+    def _layout(self) -> tuple[float, float, int, str]:
+        return self.low, self.high, len(self.counts), self.scale
+
+    def merge(self, other: CSVHistogram) -> CSVHistogram:
+        """Return a histogram combining *self* and *other*.
+
+        Raises:
+            ValueError: If the two histograms have different bins
+        """
+        if self._layout() != other._layout():
+            raise ValueError("Cannot merge histograms with different bins")
+        return CSVHistogram(
+            self.low,
+            self.high,
+            [a + b for a, b in zip(self.counts, other.counts)],
+            self.scale,
+            self.underflow + other.underflow,
+            self.overflow + other.overflow,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable representation of the histogram."""
+        return {
+            "low": self.low,
+            "high": self.high,
+            "counts": list(self.counts),
+            "scale": self.scale,
+            "underflow": self.underflow,
+            "overflow": self.overflow,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CSVHistogram:
+        """Rebuild a histogram from the output of :meth:`to_dict`."""
+        return cls(
+            low=data["low"],
+            high=data["high"],
+            counts=list(data["counts"]),
+            scale=data["scale"],
+            underflow=data["underflow"],
+            overflow=data["overflow"],
+        )
+
+
+def _sample_bounds(sample: Sequence[float], log: bool) -> tuple[float, float]:
+    """Return histogram bounds covering the finite values of *sample*."""
+    finite = [v for v in sample if math.isfinite(v) and (v > 0 or not log)]
+    if not finite:
+        raise DataError("No values usable for histogram bounds in the sample")
+    low, high = min(finite), max(finite)
+    if low == high:
+        return (low / 2, low * 2) if log else (low - 0.5, high + 0.5)
+    return low, high
+
+
+def histogram_from_csv(
+    path: str | Path,
+    bins: int = 50,
+    binning: str = "auto",
+    bounds: tuple[float, float] | None = None,
+    sample_size: int = 10_000,
+    chunk_size: int = 1000,
+    column: str = "value",
+) -> CSVHistogram:
+    """Build a histogram of the ``value`` column in *path* in one pass.
+
+    Memory is O(*bins*) plus the initial bounds sample. ``"linear"`` and
+    ``"log"`` use equally wide bins on that scale between *bounds*. When
+    *bounds* is omitted they are taken from the first *sample_size* values,
+    and later values outside them land in ``underflow`` / ``overflow``.
+    ``"auto"`` also picks the scale from that sample: log when every sampled
+    value is positive and they span at least three orders of magnitude.
+
+    Args:
+        path: Path to the CSV file (or a Parquet/Arrow IPC file, see
+            :func:`load_column_from_arrow`)
+        bins: Number of bins
+        binning: ``"auto"``, ``"linear"`` or ``"log"``
+        bounds: ``(low, high)`` range of the bins (default: from the sample)
+        sample_size: Number of leading values used to derive bounds
+        chunk_size: Number of rows to process at once
+        column: Name of the numeric column to read (default: ``value``)
+
+    Returns:
+        :class:`CSVHistogram` that can be merged with histograms of other
+        files built with the same bins
+
+    Raises:
+        DataError: If no valid numeric values found
+        ValueError: If *binning*, *bins* or *bounds* is invalid
+    """
+    if binning not in HISTOGRAM_BINNINGS:
+        raise ValueError(
+            f"Unknown binning {binning!r}; expected one of {HISTOGRAM_BINNINGS}"
+        )
+    if bins < 1:
+        raise ValueError("bins must be at least 1")
+
+    stream = load_numbers_from_csv_stream(path, chunk_size, column=column)
+    sample: list[float] = []
+    if bounds is None or binning == "auto":
+        sample = list(islice(stream, sample_size))
+        if not sample:
+            raise DataError(f"No valid numeric values found in {path}")
+
+    scale = binning
+    if binning == "auto":
+        positive = all(v > 0 for v in sample)
+        low, high = bounds or _sample_bounds(sample, positive)
+        scale = "log" if positive and low > 0 and high / low >= 1000 else "linear"
+    if bounds is None:
+        bounds = _sample_bounds(sample, scale == "log")
+
+    histogram = CSVHistogram.empty(bounds[0], bounds[1], bins, scale)
+    histogram.add_many(sample)
+    histogram.add_many(stream)
+    if not histogram.total:
+        raise DataError(f"No valid numeric values found in {path}")
+    return histogram
+
+
+def _add_partial(partials: list[float], x: float) -> None:
+    """Add finite *x* to Shewchuk *partials* so that ``fsum`` stays exact."""
+    i = 0
+    for y in partials:
+        if abs(x) < abs(y):
+            x, y = y, x
+        hi = x + y
+        lo = y - (hi - x)
+        if lo:
+            partials[i] = lo
+            i += 1
+        x = hi
+    partials[i:] = [x]
+
+
+@dataclass
+class CSVStats:
+    """Mergeable summary statistics for a stream of numbers.
+
+    Variance is tracked with Welford's online algorithm and the sum with
+    exact partials, so merging the stats of several chunks or files gives
+    the same count, sum, min and max as a single pass over all values.
+    """
+
+    count: int = 0
+    skipped: int = 0
+    minimum: float | None = None
+    maximum: float | None = None
+    _mean: float = 0.0
+    _m2: float = 0.0
+    _partials: list[float] = field(default_factory=list, repr=False)
+    _special: float = field(default=0.0, repr=False)
+
+    def add(self, value: float) -> None:
+        """Add a single *value* to the running statistics."""
+        self.add_many((value,))
+
+    def add_many(self, values: Iterable[float]) -> None:
+        """Add every number in *values* to the running statistics."""
+        count, mean_, m2 = self.count, self._mean, self._m2
+        minimum, maximum = self.minimum, self.maximum
+        partials = self._partials
+        isfinite = math.isfinite
+        for value in values:
+            count += 1
+            delta = value - mean_
+            mean_ += delta / count
+            m2 += delta * (value - mean_)
+            if minimum is None or value < minimum:
+                minimum = value
+            if maximum is None or value > maximum:
+                maximum = value
+            if isfinite(value):
+                _add_partial(partials, value)
+            else:
+                self._special += value
+        self.count, self._mean, self._m2 = count, mean_, m2
+        self.minimum, self.maximum = minimum, maximum
+
+    def add_skipped(self, rows: int = 1) -> None:
+        """Record *rows* rows that had no valid numeric value."""
+        self.skipped += rows
+
+    @property
+    def total(self) -> float:
+        """Return the correctly rounded sum of all values."""
+        return math.fsum(self._partials) + self._special
+
+    @property
+    def mean(self) -> float:
+        """Return the arithmetic mean (``nan`` when empty)."""
+        return self.total / self.count if self.count else math.nan
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance (``nan`` with fewer than two values)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def stddev(self) -> float:
+        """Return the sample standard deviation."""
+        return math.sqrt(self.variance)
+
+    def merge(self, other: CSVStats) -> CSVStats:
+        """Return new stats combining *self* and *other* (Chan et al.)."""
+        count = self.count + other.count
+        merged = CSVStats(count=count, skipped=self.skipped + other.skipped)
+        if count:
+            delta = other._mean - self._mean
+            merged._mean = self._mean + delta * other.count / count
+            merged._m2 = (
+                self._m2 + other._m2 + delta * delta * self.count * other.count / count
+            )
+        merged.minimum = _extreme(min, self.minimum, other.minimum)
+        merged.maximum = _extreme(max, self.maximum, other.maximum)
+        merged._partials = list(self._partials)
+        for term in other._partials:
+            _add_partial(merged._partials, term)
+        merged._special = self._special + other._special
+        return merged
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable representation of the running state."""
+        return {
+            "count": self.count,
+            "skipped": self.skipped,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "mean": self._mean,
+            "m2": self._m2,
+            "partials": list(self._partials),
+            "special": self._special,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CSVStats:
+        """Rebuild stats from the output of :meth:`to_dict`."""
+        return cls(
+            count=data["count"],
+            skipped=data["skipped"],
+            minimum=data["minimum"],
+            maximum=data["maximum"],
+            _mean=data["mean"],
+            _m2=data["m2"],
+            _partials=list(data["partials"]),
+            _special=data["special"],
+        )
+
+
+def _accumulate(values: Iterable[float | None], chunk_size: int) -> CSVStats:
+    """Fold parsed row *values* into :class:`CSVStats`, counting ``None`` rows."""
+    stats = CSVStats()
+    chunk: list[float] = []
+
+    for value in values:
+        if value is None:
+            stats.skipped += 1
+            continue
+        chunk.append(value)
+        if len(chunk) >= chunk_size:
+            stats.add_many(chunk)
+            chunk = []
+    stats.add_many(chunk)
+    return stats
+
+
+def _resolve_workers(workers: int | None) -> int:
+    """Return *workers*, falling back to ``Config.CSV_WORKERS`` and CPU count."""
+    if workers is None:
+        workers = get_config().CSV_WORKERS
+    return max(1, workers or os.cpu_count() or 1)
+
+
+def _split_byte_ranges(path: Path, start: int, parts: int) -> list[tuple[int, int]]:
+    """Split *path* from *start* into up to *parts* newline-aligned ranges."""
+    size = path.stat().st_size
+    step = max(1, (size - start) // parts)
+    bounds = [start]
+    with open(path, "rb") as f:
+        for guess in range(start + step, size, step):
+            # Move each boundary to the first line starting at or after it
+            f.seek(guess - 1)
+            f.readline()
+            bound = f.tell()
+            if bound > bounds[-1] and bound < size:
+                bounds.append(bound)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _iter_range_blocks(path: str, start: int, end: int) -> Iterator[bytes]:
+    """Yield blocks of complete lines stored in bytes ``[start, end)``."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        tail = b""
+        while remaining > 0:
+            data = f.read(min(_RANGE_BLOCK_BYTES, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            data = tail + data
+            # Only hand complete lines to the parser until the range ends
+            cut = data.rfind(b"\n") + 1 if remaining > 0 else len(data)
+            tail = data[cut:]
+            if cut:
+                yield data[:cut]
+        if tail:
+            yield tail
+
+
+def _describe_byte_range(
+    path: str, start: int, end: int, index: int | None, chunk_size: int
+) -> CSVStats | None:
+    """Process-pool worker: summarise the rows in bytes ``[start, end)``.
+
+    Returns ``None`` as soon as a block contains quotes or bare carriage
+    returns: a quoted field may then span a range boundary, so only a serial
+    parse gives the right rows.
+    """
+    stats = CSVStats()
+    for block in _iter_range_blocks(path, start, end):
+        if not _is_plain_block(block):
+            return None
+        stats = stats.merge(_accumulate(_parse_row_block(block, index), chunk_size))
+    return stats
+
+
+def _describe_parallel(
+    path: Path,
+    header: list[str],
+    body_start: int,
+    column: str,
+    chunk_size: int,
+    workers: int,
+) -> CSVStats | None:
+    """Summarise *path* by parsing newline-aligned byte ranges in parallel.
+
+    Returns ``None`` if any range is not plain CSV (see
+    :func:`_describe_byte_range`), in which case the caller parses serially.
+    """
+    index = _column_index(header, column)
+    parts = max(1, (path.stat().st_size - body_start) // _MIN_RANGE_BYTES)
+    ranges = _split_byte_ranges(path, body_start, min(workers * 4, parts))
+
+    stats = CSVStats()
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        futures = [
+            pool.submit(_describe_byte_range, str(path), start, end, index, chunk_size)
+            for start, end in ranges
+        ]
+        for future in futures:
+            part = future.result()
+            if part is None:
+                for pending in futures:
+                    pending.cancel()
+                return None
+            stats = stats.merge(part)
+    return stats
+
+
+def describe_csv(
+    path: str | Path,
+    chunk_size: int = 1000,
+    parallel: bool = False,
+    workers: int | None = None,
+    engine: str | None = None,
+    column: str = "value",
+) -> CSVStats:
+    """Summarise the ``value`` column (or *column*) in *path* in one pass.
+
+    Parquet and Arrow IPC files (recognised by their suffix, see
+    :data:`ARROW_FORMATS`) are memory-mapped and summarised with vectorised
+    NumPy reductions instead of being parsed row by row.
+
+    Args:
+        path: Path to the CSV file
+        chunk_size: Number of values handed to the accumulator at once
+        parallel: If True, split the file into newline-aligned byte ranges
+            and parse them in a process pool. Results match the serial path:
+            files with quoted fields or bare carriage returns, and
+            compressed files, are parsed serially.
+        workers: Number of worker processes (default: ``Config.CSV_WORKERS``,
+            or the CPU count when that is 0)
+        engine: Parser engine for the serial path, ``"fast"`` or ``"dict"``
+            (default: ``Config.CSV_ENGINE``)
+        column: Name of the numeric column to read (default: ``value``)
+
+    Returns:
+        Mergeable statistics with count, sum, mean, variance, standard
+        deviation, min, max and the number of skipped rows
+
+    Raises:
+        FileNotFoundError: If the CSV file doesn't exist
+        SecurityError: If path attempts directory traversal
+        DataError: If no valid numeric values found
+    """
+    path = _validate_csv_path(path)
+    if _arrow_format(path):
+        stats = _stats_from_buffer(load_column_from_arrow(path, column))
+        if stats.count == 0:
+            raise DataError(f"No valid numeric values found in {path}")
+        return stats
+    workers = _resolve_workers(workers)
+
+    # Compressed files, and files whose header ends in a bare CR or quoted
+    # newline, can't be split into byte ranges and are parsed serially
+    parallel = parallel and workers > 1 and _detect_compression(path) is None
+    parsed = _read_header(path) if parallel else None
+    stats = None
+    if parsed is not None:
+        stats = _describe_parallel(path, *parsed, column, chunk_size, workers)
+    if stats is None:
+        stats = _accumulate(_iter_csv_values(path, engine, column), chunk_size)
+
+    if stats.count == 0:
         raise DataError(f"No valid numeric values found in {path}")
-    return median(values)
+    return stats
+
+
+@dataclass
+class CSVAggregate:
+    """Per-file and combined statistics from :func:`aggregate_csvs`."""
+
+    total: CSVStats = field(default_factory=CSVStats)
+    files: dict[str, CSVStats] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+
+def _expand_csv_paths(paths: str | Path | Iterable[str | Path]) -> list[str]:
+    """Return *paths* as a list, expanding a single glob pattern."""
+    if isinstance(paths, (str, Path)):
+        pattern = str(paths)
+        if glob.has_magic(pattern):
+            return sorted(glob.glob(pattern, recursive=True))
+        return [pattern]
+    return [str(path) for path in paths]
+
+
+def _aggregate_file(
+    path: str, column: str, engine: str | None, chunk_size: int
+) -> tuple[str, CSVStats | None, Exception | None]:
+    """Process-pool worker: summarise one file, returning errors as values."""
+    try:
+        values = _iter_csv_values(_validate_csv_path(path), engine, column)
+        return path, _accumulate(values, chunk_size), None
+    except Exception as e:  # Collected per file instead of aborting the batch
+        return path, None, e
+
+
+def aggregate_csvs(
+    paths: str | Path | Iterable[str | Path],
+    column: str = "value",
+    workers: int | None = None,
+    engine: str | None = None,
+    chunk_size: int = 1000,
+    progress: Callable[[int, int, str], None] | None = None,
+) -> CSVAggregate:
+    """Summarise many CSV files in a process pool.
+
+    Each file is reduced to mergeable :class:`CSVStats` in a worker process
+    and the partial results are merged into a global summary. Files that
+    fail (missing, unreadable, malformed) are recorded in ``errors`` and do
+    not abort the batch; files without numeric values contribute empty stats.
+
+    Args:
+        paths: Iterable of paths, or a single path or glob pattern
+            (``**`` is recursive)
+        column: Name of the numeric column to aggregate (default: ``value``)
+        workers: Number of worker processes (default: ``Config.CSV_WORKERS``,
+            or the CPU count when that is 0)
+        engine: Parser engine, ``"fast"`` or ``"dict"``
+            (default: ``Config.CSV_ENGINE``)
+        chunk_size: Number of values handed to the accumulator at once
+        progress: Optional ``progress(done, total, path)`` callback invoked
+            after each file
+
+    Returns:
+        Global statistics, per-file statistics and per-file errors, with
+        files listed in input order
+    """
+    files = _expand_csv_paths(paths)
+    workers = min(_resolve_workers(workers), max(1, len(files)))
+    worker = partial(
+        _aggregate_file, column=column, engine=engine, chunk_size=chunk_size
+    )
+
+    result = CSVAggregate()
+    if workers == 1:
+        outcomes: Iterable[Any] = map(worker, files)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        # Batch small files per task to amortise inter-process overhead
+        batch = max(1, len(files) // (workers * 4))
+        outcomes = pool.map(worker, files, chunksize=batch)
+
+    try:
+        for done, (path, stats, error) in enumerate(outcomes, start=1):
+            if error is not None:
+                result.errors[path] = error
+            else:
+                result.files[path] = stats
+                result.total = result.total.merge(stats)
+            if progress is not None:
+                progress(done, len(files), path)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return result
+
+
+@dataclass
+class CSVGroup:
+    """Running statistics (and optional quantile sketch) for one group."""
+
+    stats: CSVStats = field(default_factory=CSVStats)
+    sketch: QuantileSketch | None = None
+
+    def merge(self, other: CSVGroup) -> CSVGroup:
+        """Return a new group combining *self* and *other*, leaving both as is."""
+        sketch = self.sketch
+        if sketch is not None and other.sketch is not None:
+            # QuantileSketch.merge folds in place, so merge into a copy
+            sketch = QuantileSketch.from_dict(sketch.to_dict()).merge(other.sketch)
+        return CSVGroup(self.stats.merge(other.stats), sketch)
+
+
+def _group_key_field(row: list[Any], index: int) -> str | None:
+    """Return the key field at *index* as text (``None`` if the row is short)."""
+    if index >= len(row):
+        return None
+    value = row[index]
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _spill_groups(
+    groups: dict[Any, CSVGroup], spill_files: list[BinaryIO], level: int = 0
+) -> None:
+    """Append *groups* to hash-partitioned *spill_files* and clear them.
+
+    The partition hash is salted with *level* so that re-partitioning a
+    spilled partition spreads its keys over every sub-partition.
+    """
+    partitions: list[list[tuple[Any, CSVGroup]]] = [[] for _ in spill_files]
+    for item in groups.items():
+        partitions[hash((level, item[0])) % len(spill_files)].append(item)
+    for spill_file, items in zip(spill_files, partitions):
+        if items:
+            pickle.dump(items, spill_file, protocol=pickle.HIGHEST_PROTOCOL)
+    groups.clear()
+
+
+def _iter_spilled(
+    spill_files: list[BinaryIO], max_groups: int, spill_dir: str, level: int
+) -> Iterator[tuple[Any, CSVGroup]]:
+    """Merge each partition file by key and yield its groups.
+
+    A partition still holding more than *max_groups* keys is spilled again
+    into sub-partitions at the next *level* and merged recursively, so at
+    most *max_groups* merged groups are held in memory at a time.
+    """
+    try:
+        for spill_file in spill_files:
+            spill_file.seek(0)
+            merged: dict[Any, CSVGroup] = {}
+            sub_files: list[BinaryIO] = []
+            while True:
+                try:
+                    items = pickle.load(spill_file)
+                except EOFError:
+                    break
+                for key, group in items:
+                    current = merged.get(key)
+                    if current is None and len(merged) >= max_groups:
+                        if not sub_files:
+                            sub_files = _open_spill_files(spill_dir)
+                        _spill_groups(merged, sub_files, level + 1)
+                    merged[key] = group if current is None else current.merge(group)
+            if not sub_files:
+                yield from merged.items()
+                continue
+            _spill_groups(merged, sub_files, level + 1)
+            yield from _iter_spilled(sub_files, max_groups, spill_dir, level + 1)
+    finally:
+        for spill_file in spill_files:
+            spill_file.close()
+
+
+def _open_spill_files(spill_dir: str) -> list[BinaryIO]:
+    """Open one anonymous temporary file per spill partition in *spill_dir*."""
+    return [
+        tempfile.TemporaryFile(dir=spill_dir) for _ in range(_GROUP_SPILL_PARTITIONS)
+    ]
+
+
+def iter_group_by_csv(
+    path: str | Path,
+    keys: str | Sequence[str],
+    column: str = "value",
+    engine: str | None = None,
+    sketch_error: float | None = None,
+    max_groups: int | None = None,
+    spill_dir: str | Path | None = None,
+) -> Iterator[tuple[Any, CSVGroup]]:
+    """Stream ``(key, group)`` statistics of *column* grouped by *keys*.
+
+    Rows are aggregated into a hash table in a single pass. When the table
+    holds more than *max_groups* groups its partial results are spilled to
+    hash-partitioned temporary files. At the end each partition is merged
+    separately, and a partition that still holds more than *max_groups*
+    keys is re-partitioned recursively, so no more than *max_groups* groups
+    are aggregated in memory at once, whatever the cardinality. Groups are
+    yielded in first-seen order unless a spill happened, in which case they
+    come partition by partition.
+
+    Args:
+        path: Path to the CSV file
+        keys: Key column name, or a sequence of names for composite keys
+        column: Name of the numeric column to aggregate (default: ``value``)
+        engine: Parser engine, ``"fast"`` or ``"dict"``
+            (default: ``Config.CSV_ENGINE``)
+        sketch_error: If set, also keep a quantile sketch per group with this
+            rank error
+        max_groups: In-memory group cap before spilling
+            (default: ``Config.CSV_GROUPBY_MAX_GROUPS``)
+        spill_dir: Directory for spill files (default: system temp dir)
+
+    Yields:
+        The key (a string, or a tuple of strings for composite keys; missing
+        fields are ``None``) and its :class:`CSVGroup`
+
+    Raises:
+        FileNotFoundError: If the CSV file doesn't exist
+        SecurityError: If path attempts directory traversal
+        DataError: If a key column is not in the header
+        ValueError: If *max_groups* is less than 1
+    """
+    path = _validate_csv_path(path)
+    if max_groups is None:
+        max_groups = get_config().CSV_GROUPBY_MAX_GROUPS
+    if max_groups < 1:
+        raise ValueError("max_groups must be at least 1")
+    composite = not isinstance(keys, str)
+    key_names = list(keys) if composite else [keys]  # type: ignore[list-item]
+
+    rows = _iter_csv_rows(path, engine)
+    header = next(rows)
+    key_indices = []
+    for name in key_names:
+        index = _column_index(header, name)
+        if index is None:
+            raise DataError(f"Key column {name!r} not found in {path}")
+        key_indices.append(index)
+    value_index = _column_index(header, column)
+
+    def new_group() -> CSVGroup:
+        if sketch_error is None:
+            return CSVGroup()
+        return CSVGroup(sketch=QuantileSketch.with_error(sketch_error))
+
+    groups: dict[Any, CSVGroup] = {}
+    with tempfile.TemporaryDirectory(dir=spill_dir) as tmp:
+        spill_files: list[BinaryIO] = []
+        for row in rows:
+            if composite:
+                key: Any = tuple(_group_key_field(row, i) for i in key_indices)
+            else:
+                key = _group_key_field(row, key_indices[0])
+            group = groups.get(key)
+            if group is None:
+                if len(groups) >= max_groups:
+                    if not spill_files:
+                        spill_files = _open_spill_files(tmp)
+                    _spill_groups(groups, spill_files)
+                group = groups[key] = new_group()
+
+            if value_index is None or value_index >= len(row):
+                value = None
+            else:
+                value = _parse_field(row[value_index])
+            if value is None:
+                group.stats.add_skipped()
+                continue
+            group.stats.add(value)
+            if group.sketch is not None:
+                group.sketch.update(value)
+
+        if not spill_files:
+            yield from groups.items()
+            return
+
+        _spill_groups(groups, spill_files)
+        yield from _iter_spilled(spill_files, max_groups, tmp, level=0)
+
+
+def group_by_csv(
+    path: str | Path,
+    keys: str | Sequence[str],
+    column: str = "value",
+    engine: str | None = None,
+    sketch_error: float | None = None,
+    max_groups: int | None = None,
+    spill_dir: str | Path | None = None,
+) -> dict[Any, CSVGroup]:
+    """Return per-group statistics of *column* grouped by *keys*.
+
+    Convenience wrapper collecting :func:`iter_group_by_csv` into a dict;
+    use the iterator directly when the number of groups is too large to
+    hold in memory at once.
+    """
+    return dict(
+        iter_group_by_csv(
+            path, keys, column, engine, sketch_error, max_groups, spill_dir
+        )
+    )
+
+
+class CSVTailAggregator:
+    """Incrementally summarise a CSV file that only ever grows.
+
+    Each :meth:`update` parses just the complete lines appended since the
+    previous call and folds them into running :class:`CSVStats` (and an
+    optional :class:`QuantileSketch`). The byte offset and running state can
+    be checkpointed with :meth:`save` / :meth:`load`. When the file is
+    truncated or replaced (rotation) the aggregator restarts from byte zero.
+
+    Args:
+        path: Path to the CSV file to follow
+        column: Name of the numeric column to aggregate (default: ``value``)
+        sketch_error: Rank error of the quantile sketch, or ``None`` to skip it
+    """
+
+    _FINGERPRINT_BYTES = 4096
+
+    def __init__(
+        self,
+        path: str | Path,
+        column: str = "value",
+        sketch_error: float | None = 0.01,
+    ) -> None:
+        self.path = _validate_csv_path(path)
+        if _detect_compression(self.path) is not None:
+            raise ValueError(f"Cannot follow a compressed CSV file: {self.path}")
+        self.column = column
+        self.sketch_error = sketch_error
+        self.restarts = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard the running state and start again from byte zero."""
+        self.offset = 0
+        self.stats = CSVStats()
+        self.sketch = (
+            QuantileSketch.with_error(self.sketch_error)
+            if self.sketch_error is not None
+            else None
+        )
+        self._index: int | None = None
+        self._file_id: tuple[int, int] | None = None
+        self._fingerprint = ""
+        self._fingerprint_len = 0
+
+    @staticmethod
+    def _hash_prefix(f: Any, length: int) -> str:
+        """Hash the first *length* bytes of open file *f*."""
+        f.seek(0)
+        return hashlib.sha256(f.read(length)).hexdigest()
+
+    def _rotated(self, f: Any, stat: os.stat_result) -> bool:
+        """Return True if the file was truncated or replaced since last update."""
+        if not self.offset:
+            return False
+        return (
+            (stat.st_dev, stat.st_ino) != self._file_id
+            or stat.st_size < self.offset
+            or self._hash_prefix(f, self._fingerprint_len) != self._fingerprint
+        )
+
+    def _consume_header(self, f: Any) -> bool:
+        """Parse the header line; return False while it is still incomplete."""
+        f.seek(0)
+        line = f.readline()
+        if not line.endswith(b"\n"):
+            return False
+        header = next(csv.reader([line.decode("utf-8")]), [])
+        self._index = _column_index(header, self.column)
+        self.offset = len(line)
+        return True
+
+    def _consume(self, block: bytes) -> None:
+        """Fold the complete lines in *block* into the running state."""
+        values = []
+        for value in _parse_row_block(block, self._index):
+            if value is None:
+                self.stats.skipped += 1
+            else:
+                values.append(value)
+        self.stats.add_many(values)
+        if self.sketch is not None:
+            self.sketch.update_many(values)
+
+    def update(self) -> CSVStats:
+        """Process rows appended since the last call and return the stats.
+
+        A trailing line without a newline is left for the next call, since
+        the writer may still be in the middle of it.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist (e.g. mid-rotation)
+        """
+        with open(self.path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if self._rotated(f, stat):
+                self.reset()
+                self.restarts += 1
+            if not self.offset and not self._consume_header(f):
+                return self.stats
+            self._file_id = (stat.st_dev, stat.st_ino)
+
+            f.seek(self.offset)
+            tail = b""
+            while True:
+                data = f.read(_RANGE_BLOCK_BYTES)
+                if not data:
+                    break
+                data = tail + data
+                cut = data.rfind(b"\n") + 1
+                if cut:
+                    self._consume(data[:cut])
+                    self.offset += cut
+                tail = data[cut:]
+
+            # Remember the start of the processed data to detect rotation
+            length = min(self.offset, self._FINGERPRINT_BYTES)
+            if length != self._fingerprint_len:
+                self._fingerprint = self._hash_prefix(f, length)
+                self._fingerprint_len = length
+        return self.stats
+
+    def follow(
+        self,
+        poll_interval: float = 1.0,
+        stop: Callable[[], bool] | None = None,
+    ) -> Iterator[CSVStats]:
+        """Yield updated stats whenever new rows arrive or the file rotates.
+
+        Args:
+            poll_interval: Seconds to sleep between checks for new data
+            stop: Optional callable; following ends once it returns True
+
+        Yields:
+            The running statistics after each change
+        """
+        while stop is None or not stop():
+            before = (self.offset, self.restarts)
+            try:
+                self.update()
+            except FileNotFoundError:
+                # The file is being rotated; try again on the next poll
+                pass
+            else:
+                if (self.offset, self.restarts) != before:
+                    yield self.stats
+            time.sleep(poll_interval)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable checkpoint of the aggregator."""
+        return {
+            "path": str(self.path),
+            "column": self.column,
+            "sketch_error": self.sketch_error,
+            "offset": self.offset,
+            "restarts": self.restarts,
+            "index": self._index,
+            "file_id": list(self._file_id) if self._file_id else None,
+            "fingerprint": self._fingerprint,
+            "fingerprint_len": self._fingerprint_len,
+            "stats": self.stats.to_dict(),
+            "sketch": self.sketch.to_dict() if self.sketch is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CSVTailAggregator:
+        """Restore an aggregator from the output of :meth:`to_dict`."""
+        aggregator = cls(data["path"], data["column"], data["sketch_error"])
+        aggregator.offset = data["offset"]
+        aggregator.restarts = data["restarts"]
+        aggregator._index = data["index"]
+        aggregator._file_id = tuple(data["file_id"]) if data["file_id"] else None
+        aggregator._fingerprint = data["fingerprint"]
+        aggregator._fingerprint_len = data["fingerprint_len"]
+        aggregator.stats = CSVStats.from_dict(data["stats"])
+        if data["sketch"] is not None:
+            aggregator.sketch = QuantileSketch.from_dict(data["sketch"])
+        return aggregator
+
+    def save(self, state_path: str | Path) -> None:
+        """Atomically write a JSON checkpoint to *state_path*."""
+        state_path = Path(state_path)
+        tmp_path = state_path.with_name(state_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        os.replace(tmp_path, state_path)
+
+    @classmethod
+    def load(cls, state_path: str | Path) -> CSVTailAggregator:
+        """Restore an aggregator from a checkpoint written by :meth:`save`."""
+        return cls.from_dict(json.loads(Path(state_path).read_text(encoding="utf-8")))
@@ -16,13 +16,33 @@ class Config:
     HTTP_POOL_MAXSIZE: int = 20
     HTTP_MAX_RETRIES: int = 3
 
+    # Scraper response cache (empty dir: ~/.cache/gpt-fusion/http)
+    HTTP_CACHE_ENABLED: bool = False
+    HTTP_CACHE_DIR: str = ""
+    HTTP_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    HTTP_CACHE_MEMORY_BYTES: int = 32 * 1024 * 1024
+
+    # Scraper HTML parser: "html.parser", "lxml", "html5lib" or "selectolax"
+    HTML_PARSER: str = "html.parser"
+
     # Social media limits
     TWITTER_CHAR_LIMIT: int = 280
 
     # File processing settings
     CSV_CHUNK_SIZE: int = 1000
+    CSV_WORKERS: int = 0  # Parallel CSV parsing processes (0: CPU count)
+    CSV_ENGINE: str = "fast"  # "fast" (single-column splitter) or "dict"
+    CSV_GROUPBY_MAX_GROUPS: int = 250_000  # In-memory groups before spilling
     BUILD_BATCH_SIZE: int = 50
 
+    # Sidecar cache for parsed CSV columns (empty dir: ~/.cache/gpt-fusion/csv)
+    CSV_CACHE_DIR: str = ""
+    CSV_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+
+    # External sort for exact quantiles (empty dir: system temp directory)
+    CSV_SORT_MEMORY_BYTES: int = 256 * 1024 * 1024
+    CSV_SORT_TEMP_DIR: str = ""
+
     # User agent for web requests
     USER_AGENT: str = "gpt-fusion/0.0.1a0 (https://github.com/costasford/gpt-fusion)"
 
@@ -43,15 +63,44 @@ class Config:
             HTTP_MAX_RETRIES=int(
                 os.getenv("GPT_FUSION_MAX_RETRIES", cls.HTTP_MAX_RETRIES)
             ),
+            HTTP_CACHE_ENABLED=os.getenv("GPT_FUSION_HTTP_CACHE", "").lower()
+            in ("1", "true", "yes"),
+            HTTP_CACHE_DIR=os.getenv("GPT_FUSION_HTTP_CACHE_DIR", cls.HTTP_CACHE_DIR),
+            HTTP_CACHE_MAX_BYTES=int(
+                os.getenv("GPT_FUSION_HTTP_CACHE_MAX_BYTES", cls.HTTP_CACHE_MAX_BYTES)
+            ),
+            HTTP_CACHE_MEMORY_BYTES=int(
+                os.getenv(
+                    "GPT_FUSION_HTTP_CACHE_MEMORY_BYTES", cls.HTTP_CACHE_MEMORY_BYTES
+                )
+            ),
+            HTML_PARSER=os.getenv("GPT_FUSION_HTML_PARSER", cls.HTML_PARSER),
             TWITTER_CHAR_LIMIT=int(
                 os.getenv("GPT_FUSION_TWITTER_LIMIT", cls.TWITTER_CHAR_LIMIT)
             ),
             CSV_CHUNK_SIZE=int(
                 os.getenv("GPT_FUSION_CSV_CHUNK_SIZE", cls.CSV_CHUNK_SIZE)
             ),
+            CSV_WORKERS=int(os.getenv("GPT_FUSION_CSV_WORKERS", cls.CSV_WORKERS)),
+            CSV_ENGINE=os.getenv("GPT_FUSION_CSV_ENGINE", cls.CSV_ENGINE),
+            CSV_GROUPBY_MAX_GROUPS=int(
+                os.getenv(
+                    "GPT_FUSION_CSV_GROUPBY_MAX_GROUPS", cls.CSV_GROUPBY_MAX_GROUPS
+                )
+            ),
             BUILD_BATCH_SIZE=int(
                 os.getenv("GPT_FUSION_BUILD_BATCH_SIZE", cls.BUILD_BATCH_SIZE)
             ),
+            CSV_CACHE_DIR=os.getenv("GPT_FUSION_CSV_CACHE_DIR", cls.CSV_CACHE_DIR),
+            CSV_CACHE_MAX_BYTES=int(
+                os.getenv("GPT_FUSION_CSV_CACHE_MAX_BYTES", cls.CSV_CACHE_MAX_BYTES)
+            ),
+            CSV_SORT_MEMORY_BYTES=int(
+                os.getenv("GPT_FUSION_CSV_SORT_MEMORY_BYTES", cls.CSV_SORT_MEMORY_BYTES)
+            ),
+            CSV_SORT_TEMP_DIR=os.getenv(
+                "GPT_FUSION_CSV_SORT_TEMP_DIR", cls.CSV_SORT_TEMP_DIR
+            ),
             USER_AGENT=os.getenv("GPT_FUSION_USER_AGENT", cls.USER_AGENT),
             LOG_LEVEL=os.getenv("GPT_FUSION_LOG_LEVEL", cls.LOG_LEVEL),
         )
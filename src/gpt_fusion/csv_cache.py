@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+"""Sidecar cache of parsed CSV columns stored as packed float64 files."""
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .config import get_config
+
+__all__ = [
+    "load_cached_values",
+    "store_cached_values",
+    "clear_csv_cache",
+]
+
+# Header: magic, source size, source mtime (ns), number of values.
+# 32 bytes keeps the float64 payload 8-byte aligned for ``memoryview.cast``.
+_MAGIC = b"GFC1\0\0\0\0"
+_HEADER = struct.Struct("<8sqqq")
+_SUFFIX = ".f64"
+_WRITE_BATCH = 8192
+
+
+def _cache_dir(cache_dir: str | Path | None = None) -> Path:
+    """Return the cache directory, falling back to the configured location."""
+    if cache_dir is None:
+        cache_dir = get_config().CSV_CACHE_DIR or (
+            Path.home() / ".cache" / "gpt-fusion" / "csv"
+        )
+    return Path(cache_dir)
+
+
+def _entry_path(source: Path, column: str, cache_dir: Path) -> Path:
+    """Return the cache file used for *column* of *source*."""
+    digest = hashlib.sha256(f"{source}\0{column}".encode("utf-8")).hexdigest()
+    return cache_dir / f"{digest}{_SUFFIX}"
+
+
+def load_cached_values(
+    source: Path, column: str = "value", cache_dir: str | Path | None = None
+) -> Optional[memoryview]:
+    """Return a memory-mapped float64 view of the cached *column* of *source*.
+
+    Args:
+        source: Resolved path of the CSV file
+        column: Name of the cached column
+        cache_dir: Cache directory (default: ``Config.CSV_CACHE_DIR``)
+
+    Returns:
+        Read-only ``memoryview`` of doubles, or ``None`` when there is no
+        entry or the entry no longer matches the size and mtime of *source*
+    """
+    entry = _entry_path(source, column, _cache_dir(cache_dir))
+    try:
+        stat = source.stat()
+        with open(entry, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                return None
+            magic, size, mtime_ns, count = _HEADER.unpack(header)
+            if (
+                magic != _MAGIC
+                or size != stat.st_size
+                or mtime_ns != stat.st_mtime_ns
+                or os.fstat(f.fileno()).st_size != _HEADER.size + 8 * count
+            ):
+                return None
+            if count == 0:
+                values = memoryview(array("d"))
+            else:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                values = memoryview(mapped)[_HEADER.size :].cast("d")
+    except OSError:
+        return None
+
+    # Mark the entry as recently used for eviction purposes
+    try:
+        os.utime(entry)
+    except OSError:
+        pass
+    return values
+
+
+def store_cached_values(
+    source: Path,
+    values: Iterable[float],
+    column: str = "value",
+    cache_dir: str | Path | None = None,
+    max_bytes: int | None = None,
+    source_stat: os.stat_result | None = None,
+) -> bool:
+    """Write *values* as the cached *column* of *source*.
+
+    Values are written in batches so an iterator can be cached without
+    holding it in memory. Entries are replaced atomically, and the least
+    recently used entries are evicted once the cache exceeds *max_bytes*.
+
+    Args:
+        source: Resolved path of the CSV file
+        values: Parsed values of *column*
+        column: Name of the cached column
+        cache_dir: Cache directory (default: ``Config.CSV_CACHE_DIR``)
+        max_bytes: Size bound of the cache (default: ``Config.CSV_CACHE_MAX_BYTES``)
+        source_stat: ``os.stat`` of *source* taken before *values* were
+            parsed (default: taken now). The entry is keyed by its size and
+            mtime, so a file that changed during parsing never matches it.
+
+    Returns:
+        ``True`` if the entry was stored, ``False`` if it was larger than the
+        whole cache and therefore discarded
+    """
+    directory = _cache_dir(cache_dir)
+    if max_bytes is None:
+        max_bytes = get_config().CSV_CACHE_MAX_BYTES
+    directory.mkdir(parents=True, exist_ok=True)
+    stat = source.stat() if source_stat is None else source_stat
+
+    fd, tmp_name = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, 0, 0, 0))
+            count = 0
+            batch = array("d")
+            for value in values:
+                batch.append(value)
+                if len(batch) >= _WRITE_BATCH:
+                    batch.tofile(f)
+                    count += len(batch)
+                    batch = array("d")
+            batch.tofile(f)
+            count += len(batch)
+            f.seek(0)
+            f.write(_HEADER.pack(_MAGIC, stat.st_size, stat.st_mtime_ns, count))
+
+        if _HEADER.size + 8 * count > max_bytes:
+            os.unlink(tmp_name)
+            return False
+        os.replace(tmp_name, _entry_path(source, column, directory))
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+    _evict(directory, max_bytes)
+    return True
+
+
+def _evict(directory: Path, max_bytes: int) -> None:
+    """Delete least recently used entries until *directory* fits *max_bytes*."""
+    entries = []
+    total = 0
+    for entry in directory.glob(f"*{_SUFFIX}"):
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        total += stat.st_size
+
+    entries.sort()
+    for _, size, entry in entries:
+        if total <= max_bytes:
+            break
+        try:
+            entry.unlink()
+        except OSError:
+            # Still mapped elsewhere (Windows) or already removed
+            continue
+        total -= size
+
+
+def clear_csv_cache(cache_dir: str | Path | None = None) -> None:
+    """Remove every entry from the CSV cache directory."""
+    directory = _cache_dir(cache_dir)
+    if not directory.is_dir():
+        return
+    for entry in directory.glob(f"*{_SUFFIX}"):
+        try:
+            entry.unlink()
+        except OSError:
+            continue
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+"""Pluggable HTML parser backends behind a small CSS-selection interface."""
+
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Optional, Sequence
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+from .config import get_config
+from .exceptions import ValidationError
+
+__all__ = ["HTML_PARSERS", "HTMLDocument", "parse_html"]
+
+HTML_PARSERS = ("html.parser", "lxml", "html5lib", "selectolax")
+
+# Parsers that honour BeautifulSoup's ``parse_only`` (html5lib ignores it)
+_STRAINABLE = ("html.parser", "lxml")
+
+# A compound selector without combinators or pseudo-classes, such as
+# ``p.msg``, ``a[href]`` or ``#main``. Matching it never depends on an
+# element's ancestors or siblings, so the tree can be pruned to its tag.
+_SIMPLE_SELECTOR = re.compile(r"^\s*([a-zA-Z][\w-]*)((?:[.#][\w-]+|\[[^\]\[]+\])*)\s*$")
+
+
+@lru_cache(maxsize=256)
+def _strainer_for(selectors: tuple[str, ...]) -> Optional[SoupStrainer]:
+    """Return a strainer keeping only tags *selectors* can match, if safe.
+
+    Cached per selector tuple, so repeated scrapes with the same selectors
+    skip re-parsing them. (Compiled CSS selectors are already cached by
+    soupsieve itself.)
+    """
+    names = set()
+    for selector in selectors:
+        for part in selector.split(","):
+            match = _SIMPLE_SELECTOR.match(part)
+            if match is None:
+                return None
+            names.add(match.group(1).lower())
+    return SoupStrainer(list(names)) if names else None
+
+
+class HTMLDocument(ABC):
+    """Parsed page that answers CSS selector queries.
+
+    Created by :func:`parse_html`; the same interface is offered whichever
+    backend parsed the page.
+    """
+
+    @abstractmethod
+    def select(self, css_selector: str) -> list[Any]:
+        """Return the elements matching *css_selector* in document order."""
+
+    @abstractmethod
+    def text(self, element: Any) -> str:
+        """Return the stripped text of *element* and its descendants."""
+
+    @abstractmethod
+    def attribute(self, element: Any, name: str) -> Optional[str]:
+        """Return attribute *name* of *element*, or ``None`` if missing."""
+
+
+class _SoupDocument(HTMLDocument):
+    def __init__(self, soup: BeautifulSoup) -> None:
+        self.soup = soup
+
+    def select(self, css_selector: str) -> list[Any]:
+        return list(self.soup.select(css_selector))
+
+    def text(self, element: Any) -> str:
+        return element.get_text(strip=True)
+
+    def attribute(self, element: Any, name: str) -> Optional[str]:
+        value = element.get(name)
+        # Multi-valued attributes such as ``class`` come back as lists
+        return " ".join(value) if isinstance(value, list) else value
+
+
+class _SelectolaxDocument(HTMLDocument):
+    def __init__(self, tree: Any) -> None:
+        self.tree = tree
+
+    def select(self, css_selector: str) -> list[Any]:
+        return list(self.tree.css(css_selector))
+
+    def text(self, element: Any) -> str:
+        return element.text(deep=True, separator="", strip=True)
+
+    def attribute(self, element: Any, name: str) -> Optional[str]:
+        return element.attributes.get(name)
+
+
+def _selectolax_parser() -> Any:
+    """Import the selectolax parser class (lexbor where available)."""
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+
+        return LexborHTMLParser
+    except ImportError:
+        pass
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError as e:
+        raise ImportError(
+            "The 'selectolax' HTML parser requires the 'selectolax' package. "
+            "Install with: pip install 'gpt-fusion[html]'"
+        ) from e
+    return HTMLParser
+
+
+def parse_html(
+    html: str,
+    parser: str | None = None,
+    selectors: Sequence[str] | None = None,
+) -> HTMLDocument:
+    """Parse *html* with the chosen backend.
+
+    Args:
+        html: Page source
+        parser: ``"html.parser"``, ``"lxml"``, ``"html5lib"`` or
+            ``"selectolax"`` (default: ``Config.HTML_PARSER``)
+        selectors: CSS selectors that will be queried. When they are all
+            simple compounds (tag plus classes, ids or attributes), the
+            ``html.parser`` and ``lxml`` backends only build the matching
+            subtrees.
+
+    Returns:
+        :class:`HTMLDocument` for selector queries
+
+    Raises:
+        ValidationError: If *parser* is not a supported backend
+        ImportError: If the backend's package is not installed
+    """
+    parser = parser or get_config().HTML_PARSER
+    if parser not in HTML_PARSERS:
+        raise ValidationError(
+            f"Unknown HTML parser {parser!r}; expected one of {HTML_PARSERS}"
+        )
+    if parser == "selectolax":
+        return _SelectolaxDocument(_selectolax_parser()(html))
+
+    strainer = None
+    if selectors and parser in _STRAINABLE:
+        strainer = _strainer_for(tuple(selectors))
+    try:
+        soup = BeautifulSoup(html, parser, parse_only=strainer)
+    except FeatureNotFound as e:
+        raise ImportError(
+            f"The {parser!r} HTML parser is not installed. "
+            "Install with: pip install 'gpt-fusion[html]'"
+        ) from e
+    return _SoupDocument(soup)
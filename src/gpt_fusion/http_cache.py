@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+"""HTTP response cache with conditional revalidation for the scraper."""
+
+import hashlib
+import json
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .config import get_config
+
+__all__ = ["CachedResponse", "CachingAdapter", "ResponseCache"]
+
+# Entry file: metadata length, JSON metadata, then the raw body
+_META_LEN = struct.Struct("<I")
+_SUFFIX = ".http"
+
+# Describe the body as it was sent, not the decoded bytes we store
+_DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+_MAX_AGE = re.compile(r"max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+
+@dataclass
+class CachedResponse:
+    """A stored ``200`` response and the validators needed to revalidate it."""
+
+    url: str
+    headers: dict[str, str]
+    body: bytes
+    stored_at: float = field(default_factory=time.time)
+
+    @property
+    def cache_control(self) -> str:
+        """Return the lowercased ``Cache-Control`` header (empty if absent)."""
+        return CaseInsensitiveDict(self.headers).get("Cache-Control", "").lower()
+
+    @property
+    def max_age(self) -> int:
+        """Seconds the response stays fresh (0: revalidate on every use)."""
+        if "no-cache" in self.cache_control:
+            return 0
+        match = _MAX_AGE.search(self.cache_control)
+        return int(match.group(1)) if match else 0
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Return ``True`` if the response can be used without revalidation."""
+        now = time.time() if now is None else now
+        return now - self.stored_at < self.max_age
+
+    @property
+    def reusable(self) -> bool:
+        """Return ``True`` if the response can ever be served from the cache.
+
+        That needs a positive ``max-age`` or a validator to revalidate with.
+        """
+        return self.max_age > 0 or bool(self.validators())
+
+    def validators(self) -> dict[str, str]:
+        """Return ``If-None-Match`` / ``If-Modified-Since`` request headers."""
+        headers = CaseInsensitiveDict(self.headers)
+        conditional = {}
+        if "ETag" in headers:
+            conditional["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            conditional["If-Modified-Since"] = headers["Last-Modified"]
+        return conditional
+
+    def to_response(self, request: requests.PreparedRequest) -> requests.Response:
+        """Build a ``requests`` response serving the stored body."""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = self.url
+        response.request = request
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self.body
+        response.from_cache = True  # type: ignore[attr-defined]
+        return response
+
+
+class ResponseCache:
+    """Two-level (memory LRU, then disk) store of :class:`CachedResponse`.
+
+    The in-memory level holds recently used responses up to *memory_bytes*
+    of body; every response is also written to *cache_dir*, which is
+    trimmed to *max_bytes* by evicting the least recently used entries.
+    :attr:`hits`, :attr:`revalidations` and :attr:`misses` count how
+    requests were served.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        max_bytes: int | None = None,
+        memory_bytes: int | None = None,
+    ) -> None:
+        config = get_config()
+        self.cache_dir = Path(
+            cache_dir
+            or config.HTTP_CACHE_DIR
+            or Path.home() / ".cache" / "gpt-fusion" / "http"
+        )
+        self.max_bytes = config.HTTP_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.memory_bytes = (
+            config.HTTP_CACHE_MEMORY_BYTES if memory_bytes is None else memory_bytes
+        )
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._memory_size = 0
+        # Running size of the disk level; rescanned when it exceeds max_bytes
+        self._disk_size: int | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return the hit, revalidation and miss counters."""
+        return {
+            "hits": self.hits,
+            "revalidations": self.revalidations,
+            "misses": self.misses,
+        }
+
+    def record(self, outcome: str) -> None:
+        """Increment the ``hits``, ``revalidations`` or ``misses`` counter."""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def _entry_path(self, url: str) -> Path:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}{_SUFFIX}"
+
+    def _remember(self, entry: CachedResponse) -> None:
+        """Put *entry* at the front of the memory LRU, evicting as needed."""
+        with self._lock:
+            previous = self._memory.pop(entry.url, None)
+            if previous is not None:
+                self._memory_size -= len(previous.body)
+            if len(entry.body) > self.memory_bytes:
+                return
+            self._memory[entry.url] = entry
+            self._memory_size += len(entry.body)
+            while self._memory_size > self.memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_size -= len(evicted.body)
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the stored response for *url*, or ``None``."""
+        with self._lock:
+            entry = self._memory.get(url)
+            if entry is not None:
+                self._memory.move_to_end(url)
+                return entry
+
+        path = self._entry_path(url)
+        try:
+            with open(path, "rb") as f:
+                (meta_len,) = _META_LEN.unpack(f.read(_META_LEN.size))
+                meta = json.loads(f.read(meta_len).decode("utf-8"))
+                body = f.read()
+            os.utime(path)
+        except (OSError, ValueError, struct.error):
+            return None
+        if meta.get("url") != url:
+            return None
+        entry = CachedResponse(url, meta["headers"], body, meta["stored_at"])
+        self._remember(entry)
+        return entry
+
+    def store(self, entry: CachedResponse) -> None:
+        """Save *entry* in memory and atomically on disk."""
+        self._remember(entry)
+        meta = json.dumps(
+            {"url": entry.url, "headers": entry.headers, "stored_at": entry.stored_at}
+        ).encode("utf-8")
+        size = _META_LEN.size + len(meta) + len(entry.body)
+        if size > self.max_bytes:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_META_LEN.pack(len(meta)))
+                f.write(meta)
+                f.write(entry.body)
+            os.replace(tmp_name, self._entry_path(entry.url))
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+        with self._lock:
+            if self._disk_size is not None:
+                self._disk_size += size
+        if self._disk_size is None or self._disk_size > self.max_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used files until the cache fits ``max_bytes``."""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob(f"*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        self._disk_size = total
+
+    def clear(self) -> None:
+        """Drop every cached response from memory and disk."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            self._disk_size = None
+        if not self.cache_dir.is_dir():
+            return
+        for path in self.cache_dir.glob(f"*{_SUFFIX}"):
+            try:
+                path.unlink()
+            except OSError:
+                continue
+
+
+class CachingAdapter(HTTPAdapter):
+    """``HTTPAdapter`` answering GET requests from a :class:`ResponseCache`.
+
+    Fresh responses (within ``Cache-Control: max-age``) are served without
+    a request. Stale ones are revalidated with ``If-None-Match`` /
+    ``If-Modified-Since``; a ``304`` refreshes the entry and serves the
+    stored body. Responses marked ``no-store``, and responses with neither
+    a positive ``max-age`` nor an ``ETag``/``Last-Modified`` validator, are
+    never stored.
+    """
+
+    def __init__(self, cache: ResponseCache, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        conditional = {"If-None-Match", "If-Modified-Since"} & set(request.headers)
+        if request.method != "GET" or request.body or conditional or not request.url:
+            return super().send(request, **kwargs)
+
+        cache = self.cache
+        entry = cache.get(request.url)
+        if entry is not None:
+            if entry.is_fresh():
+                cache.record("hits")
+                return entry.to_response(request)
+            request.headers.update(entry.validators())
+
+        response = super().send(request, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            cache.record("revalidations")
+            headers = dict(entry.headers)
+            headers.update(
+                (name, value)
+                for name, value in response.headers.items()
+                if name.lower() not in _DROPPED_HEADERS
+            )
+            entry = CachedResponse(entry.url, headers, entry.body)
+            cache.store(entry)
+            response.content  # Drain the empty body to release the connection
+            return entry.to_response(request)
+
+        cache.record("misses")
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if response.status_code == 200 and "no-store" not in cache_control:
+            headers = {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in _DROPPED_HEADERS
+            }
+            entry = CachedResponse(request.url, headers, response.content)
+            if entry.reusable:
+                cache.store(entry)
+        return response
@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+"""In-process inverted index with ranked, term and phrase search."""
+
+import heapq
+import json
+import math
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .exceptions import DataError
+from .text_utils import remove_punctuation
+
+__all__ = ["InvertedIndex", "tokenize"]
+
+# Header: magic, then byte lengths of the metadata, doc-length and postings
+# sections that follow it in that order.
+_MAGIC = b"GFIDX001"
+_HEADER = struct.Struct("<8sqqq")
+
+SCORING_METHODS = ("bm25", "tfidf")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split *text* into lowercased, punctuation-free search terms."""
+    return remove_punctuation(text).lower().split()
+
+
+def _append_varint(out: bytearray, value: int) -> None:
+    """Append non-negative *value* to *out* as a LEB128 varint."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_varints(data: bytes) -> list[int]:
+    """Decode a buffer of concatenated LEB128 varints."""
+    values = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    return values
+
+
+class InvertedIndex:
+    """Inverted index over documents tokenized with :func:`tokenize`.
+
+    Each term's postings are one compact byte string: for every document
+    containing the term, the doc-id delta from the previous posting, the term
+    frequency and the delta-encoded token positions, all as varints. Adding
+    a document only appends to the postings of its terms.
+
+    :meth:`save` writes the index to a single file; :meth:`load` memory-maps
+    it and decodes a term's postings only when a query touches it, so a
+    large index is usable immediately on startup. Documents added after
+    loading copy just the postings of the terms they contain into memory.
+    :meth:`close` (or leaving a ``with`` block) releases the map; call
+    :meth:`materialize` first to keep using the index afterwards.
+
+    Example:
+        >>> index = InvertedIndex()
+        >>> index.add("the quick brown fox", key="a")
+        0
+        >>> index.add("the lazy dog", key="b")
+        1
+        >>> index.phrase_query("quick brown")
+        [0]
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self._keys: list[str | None] = []
+        self._lengths = array("I")
+        self._total_length = 0
+        # term -> [document frequency, last doc id]
+        self._terms: dict[str, list[int]] = {}
+        self._postings: dict[str, bytearray] = {}
+        # Postings still living in the memory-mapped file: term -> (start, end)
+        self._mapped: dict[str, tuple[int, int]] = {}
+        self._mmap: mmap.mmap | None = None
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def __contains__(self, term: object) -> bool:
+        return term in self._terms
+
+    def __enter__(self) -> InvertedIndex:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def key(self, doc_id: int) -> str | None:
+        """Return the key given to document *doc_id* when it was added."""
+        return self._keys[doc_id]
+
+    def add(self, text: str, key: str | None = None) -> int:
+        """Index *text* and return its document id.
+
+        Args:
+            text: Document text
+            key: Optional identifier (e.g. a URL) returned by :meth:`key`
+
+        Returns:
+            Sequential id of the new document
+        """
+        doc_id = len(self._lengths)
+        tokens = tokenize(text)
+        positions: dict[str, list[int]] = defaultdict(list)
+        for position, term in enumerate(tokens):
+            positions[term].append(position)
+
+        for term, term_positions in positions.items():
+            info = self._terms.get(term)
+            if info is None:
+                info = self._terms[term] = [0, 0]
+            postings = self._writable_postings(term)
+            _append_varint(postings, doc_id - info[1])
+            _append_varint(postings, len(term_positions))
+            previous = 0
+            for position in term_positions:
+                _append_varint(postings, position - previous)
+                previous = position
+            info[0] += 1
+            info[1] = doc_id
+
+        self._keys.append(key)
+        self._lengths.append(len(tokens))
+        self._total_length += len(tokens)
+        return doc_id
+
+    def add_many(self, texts: Iterable[str]) -> list[int]:
+        """Index every document in *texts* and return their ids."""
+        return [self.add(text) for text in texts]
+
+    def _writable_postings(self, term: str) -> bytearray:
+        """Return the in-memory postings of *term*, copying them off the map."""
+        postings = self._postings.get(term)
+        if postings is None:
+            postings = bytearray(self._raw_postings(term))
+            self._mapped.pop(term, None)
+            self._postings[term] = postings
+        return postings
+
+    def _raw_postings(self, term: str) -> bytes:
+        postings = self._postings.get(term)
+        if postings is not None:
+            return postings
+        span = self._mapped.get(term)
+        if span is None:
+            return b""
+        if self._mmap is None:
+            raise ValueError(
+                "Index file is closed; call materialize() before close() to "
+                "keep using a loaded index"
+            )
+        return self._mmap[span[0] : span[1]]
+
+    def _iter_postings(self, term: str) -> Iterator[tuple[int, int, list[int]]]:
+        """Yield ``(doc_id, term_frequency, positions)`` for *term*."""
+        values = _decode_varints(self._raw_postings(term))
+        doc_id = i = 0
+        while i < len(values):
+            doc_id += values[i]
+            frequency = values[i + 1]
+            deltas = values[i + 2 : i + 2 + frequency]
+            position = 0
+            positions = []
+            for delta in deltas:
+                position += delta
+                positions.append(position)
+            yield doc_id, frequency, positions
+            i += 2 + frequency
+
+    def document_frequency(self, term: str) -> int:
+        """Return the number of documents containing *term*."""
+        info = self._terms.get(term)
+        return info[0] if info else 0
+
+    def term_query(self, query: str) -> list[int]:
+        """Return ids of documents containing every term of *query*."""
+        terms = sorted(set(tokenize(query)), key=self.document_frequency)
+        if not terms:
+            return []
+        matches: set[int] | None = None
+        for term in terms:
+            docs = {doc_id for doc_id, _, _ in self._iter_postings(term)}
+            matches = docs if matches is None else matches & docs
+            if not matches:
+                return []
+        return sorted(matches or ())
+
+    def phrase_query(self, phrase: str) -> list[int]:
+        """Return ids of documents containing the terms of *phrase* in order."""
+        terms = tokenize(phrase)
+        if not terms:
+            return []
+        candidates: dict[int, set[int]] | None = None
+        for offset, term in enumerate(terms):
+            shifted = {
+                doc_id: {position - offset for position in positions}
+                for doc_id, _, positions in self._iter_postings(term)
+                if candidates is None or doc_id in candidates
+            }
+            if candidates is not None:
+                shifted = {
+                    doc_id: starts & candidates[doc_id]
+                    for doc_id, starts in shifted.items()
+                }
+            candidates = {
+                doc_id: starts for doc_id, starts in shifted.items() if starts
+            }
+            if not candidates:
+                return []
+        return sorted(candidates or ())
+
+    def search(
+        self, query: str, k: int = 10, method: str = "bm25"
+    ) -> list[tuple[int, float]]:
+        """Return the *k* best-matching documents for *query*.
+
+        Args:
+            query: Free-text query; documents matching any term are ranked
+            k: Number of results
+            method: ``"bm25"`` (Okapi BM25 with :attr:`k1` and :attr:`b`) or
+                ``"tfidf"`` (log-scaled term frequency times IDF)
+
+        Returns:
+            ``(doc_id, score)`` pairs, best first; ties go to the lower id
+
+        Raises:
+            ValueError: If *method* is not supported
+        """
+        if method not in SCORING_METHODS:
+            raise ValueError(
+                f"Unknown scoring method {method!r}; expected one of "
+                f"{SCORING_METHODS}"
+            )
+        count = len(self._lengths)
+        if not count or k <= 0:
+            return []
+        average_length = self._total_length / count or 1.0
+        lengths, k1, b = self._lengths, self.k1, self.b
+
+        scores: dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            df = self.document_frequency(term)
+            if not df:
+                continue
+            if method == "bm25":
+                idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+                for doc_id, tf, _ in self._iter_postings(term):
+                    norm = k1 * (1 - b + b * lengths[doc_id] / average_length)
+                    scores[doc_id] += idf * tf * (k1 + 1) / (tf + norm)
+            else:
+                idf = math.log(1 + count / df)
+                for doc_id, tf, _ in self._iter_postings(term):
+                    scores[doc_id] += (1 + math.log(tf)) * idf
+        return heapq.nsmallest(k, scores.items(), key=lambda hit: (-hit[1], hit[0]))
+
+    def save(self, path: str | Path) -> None:
+        """Write the index to *path* atomically."""
+        path = Path(path)
+        postings_blob = bytearray()
+        terms: dict[str, list[int]] = {}
+        for term, (df, last_doc) in self._terms.items():
+            start = len(postings_blob)
+            postings_blob += self._raw_postings(term)
+            terms[term] = [start, len(postings_blob), df, last_doc]
+        meta = json.dumps(
+            {"k1": self.k1, "b": self.b, "keys": self._keys, "terms": terms},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        lengths = self._lengths.tobytes()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(
+                    _HEADER.pack(_MAGIC, len(meta), len(lengths), len(postings_blob))
+                )
+                f.write(meta)
+                f.write(lengths)
+                f.write(postings_blob)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    @classmethod
+    def load(cls, path: str | Path) -> InvertedIndex:
+        """Open an index written by :meth:`save`, memory-mapping its postings.
+
+        Raises:
+            DataError: If *path* is not a valid index file
+        """
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) != _HEADER.size or header[:8] != _MAGIC:
+                raise DataError(f"Not a gpt-fusion search index: {path}")
+            _, meta_len, lengths_len, postings_len = _HEADER.unpack(header)
+            size = os.fstat(f.fileno()).st_size
+            if size != _HEADER.size + meta_len + lengths_len + postings_len:
+                raise DataError(f"Truncated search index: {path}")
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        meta_end = _HEADER.size + meta_len
+        meta = json.loads(mapped[_HEADER.size : meta_end].decode("utf-8"))
+        index = cls(k1=meta["k1"], b=meta["b"])
+        index._keys = meta["keys"]
+        index._lengths = array("I", mapped[meta_end : meta_end + lengths_len])
+        index._total_length = sum(index._lengths)
+        base = meta_end + lengths_len
+        for term, (start, end, df, last_doc) in meta["terms"].items():
+            index._terms[term] = [df, last_doc]
+            index._mapped[term] = (base + start, base + end)
+        index._mmap = mapped
+        return index
+
+    def materialize(self) -> None:
+        """Copy every posting still in the memory map into memory.
+
+        The index then no longer depends on its file, which can be
+        overwritten or closed. This reads the whole postings section.
+        """
+        for term in list(self._mapped):
+            self._writable_postings(term)
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory map of a loaded index without reading it.
+
+        Postings already copied into memory (by :meth:`add` or
+        :meth:`materialize`) stay usable; querying or saving a term whose
+        postings were only in the map raises :class:`ValueError`.
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
@@ -0,0 +1,477 @@
+from __future__ import annotations
+
+"""Fixed-memory, mergeable sketches for summarising large streams."""
+
+import base64
+import hashlib
+import heapq
+import math
+import random
+from bisect import bisect_left
+from collections import Counter
+from itertools import accumulate, islice
+from typing import Any, Iterable, Mapping, Sequence
+
+__all__ = ["HeavyHitters", "HyperLogLog", "QuantileSketch"]
+
+
+class QuantileSketch:
+    """KLL quantile sketch with a fixed memory footprint.
+
+    The sketch keeps a hierarchy of compactors: when a level fills up it is
+    sorted and every other item is promoted to the next level with twice the
+    weight. Memory stays around ``3 * k`` values regardless of stream length
+    and the normalised rank error is roughly :attr:`rank_error`.
+
+    Sketches built from different shards can be combined with :meth:`merge`
+    and round-tripped through :meth:`to_dict` / :meth:`from_dict`.
+    """
+
+    _C = 2 / 3
+
+    def __init__(self, k: int = 200, seed: int | None = 0) -> None:
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.count = 0
+        self.minimum: float | None = None
+        self.maximum: float | None = None
+        self._seed = seed
+        self._rng = random.Random(seed)
+        self._levels: list[list[float]] = [[]]
+        self._size = 0
+        self._max_size = self._capacity(0)
+
+    @classmethod
+    def with_error(cls, error: float, seed: int | None = 0) -> QuantileSketch:
+        """Return a sketch sized for a normalised rank *error* (e.g. ``0.01``)."""
+        if not 0 < error < 1:
+            raise ValueError("error must be between 0 and 1")
+        return cls(k=max(8, math.ceil((2.446 / error) ** (1 / 0.9433))), seed=seed)
+
+    @property
+    def rank_error(self) -> float:
+        """Return the approximate normalised rank error (99% confidence)."""
+        return 2.446 / self.k**0.9433
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return math.ceil(self.k * self._C**depth) + 1
+
+    def _grow(self) -> None:
+        self._levels.append([])
+        self._max_size = sum(self._capacity(h) for h in range(len(self._levels)))
+
+    def update(self, value: float) -> None:
+        """Add a single *value* to the sketch."""
+        self.update_many((value,))
+
+    def update_many(self, values: Iterable[float]) -> None:
+        """Add every number in *values* to the sketch."""
+        level0 = self._levels[0]
+        size, max_size = self._size, self._max_size
+        count, minimum, maximum = self.count, self.minimum, self.maximum
+        for value in values:
+            level0.append(value)
+            count += 1
+            if minimum is None or value < minimum:
+                minimum = value
+            if maximum is None or value > maximum:
+                maximum = value
+            size += 1
+            if size >= max_size:
+                self._size = size
+                self._compress()
+                size, max_size = self._size, self._max_size
+        self._size = size
+        self.count, self.minimum, self.maximum = count, minimum, maximum
+
+    def _compress(self) -> None:
+        for h in range(len(self._levels)):
+            level = self._levels[h]
+            if len(level) < self._capacity(h):
+                continue
+            if h + 1 >= len(self._levels):
+                self._grow()
+            level.sort()
+            # Keep an odd leftover in place and promote one item of each pair
+            keep = len(level) % 2
+            offset = keep + self._rng.getrandbits(1)
+            self._levels[h + 1].extend(level[offset::2])
+            del level[keep:]
+            self._size = sum(len(lvl) for lvl in self._levels)
+            if self._size < self._max_size:
+                break
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        """Fold *other* into this sketch and return ``self``."""
+        while len(self._levels) < len(other._levels):
+            self._grow()
+        for h, level in enumerate(other._levels):
+            self._levels[h].extend(level)
+        self.count += other.count
+        self.minimum = _extreme(min, self.minimum, other.minimum)
+        self.maximum = _extreme(max, self.maximum, other.maximum)
+        self._size = sum(len(lvl) for lvl in self._levels)
+        while self._size >= self._max_size:
+            self._compress()
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Return the approximate *q*-quantile (``0 <= q <= 1``)."""
+        return self.quantiles((q,))[0]
+
+    def quantiles(self, qs: Sequence[float]) -> list[float]:
+        """Return the approximate quantiles for each fraction in *qs*.
+
+        While the stream still fits in the first compactor the result is
+        exact and linearly interpolated, matching :func:`statistics.median`
+        for ``q = 0.5``.
+        """
+        if not self.count:
+            raise ValueError("Cannot compute quantiles of an empty sketch")
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError(f"Quantile must be between 0 and 1, got {q}")
+
+        if len(self._levels) == 1:
+            values = sorted(self._levels[0])
+            return [_interpolate(values, q) for q in qs]
+
+        weighted = sorted(
+            (value, 1 << h) for h, level in enumerate(self._levels) for value in level
+        )
+        items = [value for value, _ in weighted]
+        cumulative = list(accumulate(weight for _, weight in weighted))
+        result = []
+        for q in qs:
+            if q == 0:
+                result.append(self.minimum)
+            elif q == 1:
+                result.append(self.maximum)
+            else:
+                result.append(items[bisect_left(cumulative, q * self.count)])
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable representation of the sketch."""
+        return {
+            "k": self.k,
+            "seed": self._seed,
+            "count": self.count,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "levels": [list(level) for level in self._levels],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> QuantileSketch:
+        """Rebuild a sketch from the output of :meth:`to_dict`."""
+        sketch = cls(k=data["k"], seed=data.get("seed", 0))
+        for _ in range(len(data["levels"]) - 1):
+            sketch._grow()
+        sketch._levels = [list(level) for level in data["levels"]]
+        sketch._size = sum(len(level) for level in sketch._levels)
+        sketch.count = data["count"]
+        sketch.minimum = data["minimum"]
+        sketch.maximum = data["maximum"]
+        return sketch
+
+
+class HeavyHitters:
+    """Item frequencies, exact or bounded by the Space-Saving algorithm.
+
+    With ``capacity=None`` every item is counted exactly. With a capacity
+    at most that many items are tracked: a new item replaces the one with
+    the smallest count and inherits that count as its :meth:`error`, so a
+    reported count overestimates the true one by at most ``error(item)``
+    (itself at most ``total / capacity``). Any item occurring more than
+    ``total / capacity`` times is guaranteed to be tracked.
+
+    Summaries from different shards combine with :meth:`merge` and
+    round-trip through :meth:`to_dict` / :meth:`from_dict`.
+    """
+
+    def __init__(self, capacity: int | None = None) -> None:
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.total = 0
+        self._counts: Counter[str] = Counter()
+        self._errors: dict[str, int] = {}
+        # Lazy min-heap of (count, item); entries go stale as counts grow
+        self._heap: list[tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._counts
+
+    def count(self, item: str) -> int:
+        """Return the (possibly overestimated) count of *item*."""
+        return self._counts.get(item, 0)
+
+    def error(self, item: str) -> int:
+        """Return the maximum overestimate included in ``count(item)``."""
+        return self._errors.get(item, 0)
+
+    def update(self, item: str, weight: int = 1) -> None:
+        """Add *weight* occurrences of *item*."""
+        self.update_counts({item: weight})
+
+    def update_many(self, items: Iterable[str]) -> None:
+        """Add one occurrence of every item in *items*."""
+        self.update_counts(Counter(items))
+
+    def update_counts(self, counts: Mapping[str, int]) -> None:
+        """Add pre-aggregated *counts* (item to number of occurrences)."""
+        tracked = self._counts
+        self.total += sum(counts.values())
+        if self.capacity is None:
+            tracked.update(counts)
+            return
+        heap = self._heap
+        for item, weight in counts.items():
+            if item in tracked:
+                tracked[item] += weight
+            elif len(tracked) < self.capacity:
+                tracked[item] = weight
+                heapq.heappush(heap, (weight, item))
+            else:
+                floor = self._pop_minimum()
+                tracked[item] = floor + weight
+                self._errors[item] = floor
+                heapq.heappush(heap, (floor + weight, item))
+        if len(heap) > 4 * self.capacity:
+            self._rebuild_heap()
+
+    def _pop_minimum(self) -> int:
+        """Evict the item with the smallest count and return that count."""
+        heap, tracked = self._heap, self._counts
+        while True:
+            count, item = heapq.heappop(heap)
+            current = tracked.get(item)
+            if current == count:
+                del tracked[item]
+                self._errors.pop(item, None)
+                return count
+            if current is not None:
+                heapq.heappush(heap, (current, item))
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [(count, item) for item, count in self._counts.items()]
+        heapq.heapify(self._heap)
+
+    def _floor(self) -> int:
+        """Return the count an untracked item may have had (0 if not full)."""
+        if self.capacity is None or len(self._counts) < self.capacity:
+            return 0
+        return min(self._counts.values())
+
+    def merge(self, other: HeavyHitters) -> HeavyHitters:
+        """Fold *other* into this summary and return ``self``.
+
+        Items missing from one full summary are credited with that
+        summary's minimum count (and error), which keeps the overestimate
+        bound of the combined stream.
+        """
+        if self.capacity is None and other.capacity is None:
+            self._counts.update(other._counts)
+            self.total += other.total
+            return self
+        # An exact summary saw every item, so its floor is 0 even if it holds
+        # more items than the capacity it is about to take on
+        floor, other_floor = self._floor(), other._floor()
+        if self.capacity is None or (
+            other.capacity is not None and other.capacity < self.capacity
+        ):
+            self.capacity = other.capacity
+        counts: Counter[str] = Counter()
+        errors: dict[str, int] = {}
+        for item in self._counts.keys() | other._counts.keys():
+            mine = self._counts.get(item)
+            theirs = other._counts.get(item)
+            counts[item] = (floor if mine is None else mine) + (
+                other_floor if theirs is None else theirs
+            )
+            error = (floor if mine is None else self.error(item)) + (
+                other_floor if theirs is None else other.error(item)
+            )
+            if error:
+                errors[item] = error
+        kept = heapq.nsmallest(
+            self.capacity, counts.items(), key=lambda entry: (-entry[1], entry[0])
+        )
+        self._counts = Counter(dict(kept))
+        self._errors = {item: errors[item] for item, _ in kept if item in errors}
+        self.total += other.total
+        self._rebuild_heap()
+        return self
+
+    def top(self, k: int) -> list[tuple[str, int]]:
+        """Return the *k* most frequent ``(item, count)`` pairs.
+
+        Ties are broken alphabetically, so the result is deterministic.
+        """
+        return heapq.nsmallest(
+            k, self._counts.items(), key=lambda entry: (-entry[1], entry[0])
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable representation of the summary."""
+        return {
+            "capacity": self.capacity,
+            "total": self.total,
+            "counts": dict(self._counts),
+            "errors": dict(self._errors),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> HeavyHitters:
+        """Rebuild a summary from the output of :meth:`to_dict`."""
+        summary = cls(capacity=data["capacity"])
+        summary.total = data["total"]
+        summary._counts = Counter(data["counts"])
+        summary._errors = dict(data["errors"])
+        if summary.capacity is not None:
+            summary._rebuild_heap()
+        return summary
+
+
+# Bias-correction constants for register counts below 128
+_HLL_SMALL_ALPHA = {16: 0.673, 32: 0.697, 64: 0.709}
+
+# Items deduplicated at a time by HyperLogLog.update_many
+_HLL_BATCH = 65_536
+
+
+class HyperLogLog:
+    """HyperLogLog sketch estimating the number of distinct strings.
+
+    Uses ``2 ** precision`` one-byte registers (16 KiB at the default
+    precision of 14) and has a relative standard error of about
+    ``1.04 / sqrt(2 ** precision)``. Items are hashed with 64-bit BLAKE2b,
+    which is stable across processes, so sketches of different shards
+    built with the same precision can be combined with :meth:`merge`.
+    """
+
+    def __init__(self, precision: int = 14) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self._registers = bytearray(1 << precision)
+
+    @property
+    def relative_error(self) -> float:
+        """Return the relative standard error of :meth:`estimate`."""
+        return 1.04 / math.sqrt(len(self._registers))
+
+    def __len__(self) -> int:
+        return self.estimate()
+
+    def update(self, item: str) -> None:
+        """Add *item* to the sketch."""
+        self.update_many((item,))
+
+    def update_many(self, items: Iterable[str]) -> None:
+        """Add every string in *items* to the sketch."""
+        registers = self._registers
+        shift = 64 - self.precision
+        low_mask = (1 << shift) - 1
+        blake2b = hashlib.blake2b
+        iterator = iter(items)
+        # Duplicates cannot change a register, so hash each item once per
+        # bounded batch; deduplicating the whole stream would cost memory
+        # proportional to its cardinality.
+        while batch := set(islice(iterator, _HLL_BATCH)):
+            for item in batch:
+                h = int.from_bytes(
+                    blake2b(
+                        item.encode("utf-8", "surrogatepass"), digest_size=8
+                    ).digest(),
+                    "little",
+                )
+                index = h >> shift
+                rank = shift - (h & low_mask).bit_length() + 1
+                if rank > registers[index]:
+                    registers[index] = rank
+
+    def estimate(self) -> int:
+        """Return the estimated number of distinct items added."""
+        m = len(self._registers)
+        alpha = _HLL_SMALL_ALPHA.get(m, 0.7213 / (1 + 1.079 / m))
+        registers = self._registers
+        harmonic = math.fsum(registers.count(r) * 2.0**-r for r in set(registers))
+        raw = alpha * m * m / harmonic
+        zeros = registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            return round(m * math.log(m / zeros))
+        return round(raw)
+
+    def merge(self, other: HyperLogLog) -> HyperLogLog:
+        """Fold *other* into this sketch and return ``self``.
+
+        Raises:
+            ValueError: If the sketches use different precisions
+        """
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        self._registers = bytearray(map(max, self._registers, other._registers))
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable representation of the sketch."""
+        return {
+            "precision": self.precision,
+            "registers": base64.b64encode(self._registers).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> HyperLogLog:
+        """Rebuild a sketch from the output of :meth:`to_dict`."""
+        sketch = cls(precision=data["precision"])
+        registers = base64.b64decode(data["registers"])
+        if len(registers) != len(sketch._registers):
+            raise ValueError("Register count does not match the precision")
+        sketch._registers = bytearray(registers)
+        return sketch
+
+
+def _extreme(func: Any, a: float | None, b: float | None) -> float | None:
+    """Apply *func* to *a* and *b*, ignoring whichever is ``None``."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return func(a, b)
+
+
+def _quantile_position(count: int, q: float) -> tuple[int, int, float]:
+    """Return the ranks bracketing the *q*-quantile of *count* sorted values.
+
+    The result is ``(lower, upper, fraction)`` for linear interpolation
+    between the two order statistics.
+    """
+    position = q * (count - 1)
+    lower = math.floor(position)
+    return lower, min(lower + 1, count - 1), position - lower
+
+
+def _blend(lower: float, upper: float, fraction: float) -> float:
+    """Interpolate between two order statistics like :func:`statistics.median`."""
+    if not fraction:
+        return lower
+    if fraction == 0.5:
+        return (lower + upper) / 2
+    return lower + (upper - lower) * fraction
+
+
+def _interpolate(values: Sequence[float], q: float) -> float:
+    """Return the linearly interpolated *q*-quantile of sorted *values*."""
+    lower, upper, fraction = _quantile_position(len(values), q)
+    return _blend(values[lower], values[upper], fraction)
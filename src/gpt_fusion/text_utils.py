@@ -2,24 +2,149 @@ from __future__ import annotations
 
 """Utility functions for basic text manipulation."""
 
+import heapq
+import os
 import re
 import string
-from collections import Counter
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import cached_property, partial
+from itertools import islice
+from pathlib import Path
+from typing import IO, Callable, Iterable, Iterator, TypeVar, Union
+
+from .sketches import HeavyHitters, HyperLogLog
+
+T = TypeVar("T")
+
+# Smallest text worth splitting across worker processes
+_PARALLEL_MIN_CHARS = 1 << 20
+
+# Matches exactly the characters str.split() treats as whitespace
+_WHITESPACE = re.compile(r"\s")
+
+# Input of the streaming functions: the text itself (a ``str``, read in
+# slices), a file path (``os.PathLike`` such as :class:`pathlib.Path`; a plain
+# ``str`` is always text, never a path), an open text file, or an iterable of
+# text chunks whose boundaries may fall inside words.
+TextSource = Union[str, os.PathLike, IO[str], Iterable[str]]
 
 __all__ = [
+    "TextStats",
+    "analyze_text",
     "word_count",
     "unique_words",
+    "unique_words_sketch",
     "reverse_words",
     "count_characters",
     "remove_punctuation",
     "most_common_word",
+    "top_words",
     "to_title_case",
     "is_palindrome",
+    "word_count_batch",
+    "unique_words_batch",
+    "most_common_word_batch",
+    "count_characters_batch",
+    "iter_words",
+    "word_frequencies",
+    "stream_top_words",
 ]
 
 
-def word_count(text: str) -> int:
-    """Return the number of whitespace-separated words in *text*."""
+def _rank_key(item: tuple[str, int]) -> tuple[int, str]:
+    """Order ``(word, count)`` pairs by count descending, then alphabetically."""
+    return -item[1], item[0]
+
+
+def _top_counts(counts: Counter[str], k: int) -> list[tuple[str, int]]:
+    """Return the *k* highest-ranked ``(word, count)`` pairs of *counts*.
+
+    Uses heap selection (O(u log k)) rather than sorting every distinct
+    word; the single-result case is a plain linear scan.
+    """
+    if k <= 0 or not counts:
+        return []
+    if k == 1:
+        return [min(counts.items(), key=_rank_key)]
+    return heapq.nsmallest(k, counts.items(), key=_rank_key)
+
+
+class TextStats:
+    """Text metrics computed from a single shared tokenization.
+
+    *text* is split on whitespace once, on first use; every metric is then
+    derived lazily from that token list and cached, so asking for several
+    of them costs one ``split`` instead of one per metric. Results match the
+    corresponding module-level functions.
+
+    Example:
+        >>> stats = TextStats("the cat and the hat")
+        >>> stats.word_count, stats.most_common_word()
+        (5, 'the')
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    @cached_property
+    def words(self) -> list[str]:
+        """Whitespace-separated tokens of the text."""
+        return self.text.split()
+
+    @property
+    def word_count(self) -> int:
+        """Number of words (see :func:`word_count`)."""
+        return len(self.words)
+
+    @cached_property
+    def unique_words(self) -> set[str]:
+        """Set of distinct words (see :func:`unique_words`)."""
+        return set(self.frequencies)
+
+    @cached_property
+    def frequencies(self) -> Counter[str]:
+        """Occurrences of each word, case-sensitive."""
+        return Counter(self.words)
+
+    @cached_property
+    def _folded_frequencies(self) -> Counter[str]:
+        folded: Counter[str] = Counter()
+        for word, count in self.frequencies.items():
+            folded[word.lower()] += count
+        return folded
+
+    def top_words(
+        self, k: int = 10, case_sensitive: bool = True
+    ) -> list[tuple[str, int]]:
+        """Return the *k* most frequent words (see :func:`top_words`)."""
+        counts = self.frequencies if case_sensitive else self._folded_frequencies
+        return _top_counts(counts, k)
+
+    def most_common_word(self, case_sensitive: bool = True) -> str:
+        """Return the top word (see :func:`most_common_word`)."""
+        top = self.top_words(1, case_sensitive)
+        return top[0][0] if top else ""
+
+    @property
+    def char_count(self) -> int:
+        """Number of characters (see :func:`count_characters`)."""
+        return len(self.text)
+
+
+def analyze_text(text: str) -> TextStats:
+    """Return a :class:`TextStats` for *text*."""
+    return TextStats(text)
+
+
+def word_count(text: str, workers: int = 1) -> int:
+    """Return the number of whitespace-separated words in *text*.
+
+    With *workers* other than ``1`` (``0`` uses every CPU) a large text is
+    split at whitespace and counted in a process pool.
+    """
+    if workers != 1:
+        return sum(_map_text_chunks(word_count, text, workers))
     if not text or not text.strip():
         return 0
     return len(text.split())
@@ -30,6 +155,39 @@ def unique_words(text: str) -> set[str]:
     return set(text.split())
 
 
+def unique_words_sketch(
+    text: TextSource,
+    precision: int = 14,
+    case_sensitive: bool = True,
+    chunk_size: int = 1 << 20,
+    encoding: str = "utf-8",
+) -> HyperLogLog:
+    """Estimate the number of unique words in *text* with bounded memory.
+
+    Unlike :func:`unique_words` no set of every word is kept; the result is
+    a :class:`~gpt_fusion.sketches.HyperLogLog` sketch whose
+    :meth:`~gpt_fusion.sketches.HyperLogLog.estimate` is typically within
+    ``1.04 / sqrt(2 ** precision)`` (under 1% by default) of
+    ``len(unique_words(text))``. Sketches of several shards built with the
+    same precision can be merged.
+
+    Args:
+        text: The text itself, a ``Path``, an open text file or an iterable of
+            chunks (see :func:`iter_words`)
+        precision: Sketch precision; memory is ``2 ** precision`` bytes
+        case_sensitive: Whether to treat words with different cases as different
+        chunk_size: Characters split into words at a time
+        encoding: Encoding used when *text* is a path
+
+    Returns:
+        Mergeable, serialisable cardinality sketch
+    """
+    sketch = HyperLogLog(precision)
+    for words in _iter_word_chunks(text, case_sensitive, chunk_size, encoding):
+        sketch.update_many(words)
+    return sketch
+
+
 def reverse_words(text: str) -> str:
     """Return *text* with the order of whitespace-separated words reversed."""
     return " ".join(reversed(text.split()))
@@ -40,17 +198,23 @@ def count_characters(text: str) -> int:
     return len(text)
 
 
-def remove_punctuation(text: str) -> str:
-    """Return *text* with ASCII punctuation characters removed."""
+def remove_punctuation(text: str, workers: int = 1) -> str:
+    """Return *text* with ASCII punctuation characters removed.
+
+    *workers* parallelises large texts as in :func:`word_count`.
+    """
+    if workers != 1:
+        return "".join(_map_text_chunks(remove_punctuation, text, workers))
     return text.translate(str.maketrans("", "", string.punctuation))
 
 
-def most_common_word(text: str, case_sensitive: bool = True) -> str:
+def most_common_word(text: str, case_sensitive: bool = True, workers: int = 1) -> str:
     """Return the most frequently occurring whitespace-separated word.
 
     Args:
         text: Input text to analyze
         case_sensitive: Whether to treat words with different cases as different
+        workers: Worker processes for large texts (see :func:`word_count`)
 
     Returns:
         Most common word, or empty string if no words found
@@ -59,17 +223,33 @@ def most_common_word(text: str, case_sensitive: bool = True) -> str:
         If multiple words have the same highest frequency, returns the first one
         encountered in alphabetical order for deterministic behavior.
     """
-    if not text or not text.strip():
-        return ""
+    top = top_words(text, 1, case_sensitive, workers)
+    return top[0][0] if top else ""
+
 
-    words = text.split()
-    if not case_sensitive:
-        words = [word.lower() for word in words]
+def top_words(
+    text: str, k: int = 10, case_sensitive: bool = True, workers: int = 1
+) -> list[tuple[str, int]]:
+    """Return the *k* most frequent whitespace-separated words in *text*.
 
-    counts = Counter(words)
-    # Sort by count (descending) then alphabetically for deterministic results
-    most_common = sorted(counts.items(), key=lambda x: (-x[1], x[0]))
-    return most_common[0][0]
+    Args:
+        text: Input text to analyze
+        k: Number of words to return
+        case_sensitive: Whether to treat words with different cases as different
+        workers: Worker processes for large texts (see :func:`word_count`);
+            per-chunk word counts are summed before selecting the top *k*
+
+    Returns:
+        Up to *k* ``(word, count)`` pairs ordered by count (descending), ties
+        broken alphabetically as in :func:`most_common_word`
+    """
+    if workers != 1:
+        counts: Counter[str] = Counter()
+        count_chunk = partial(_chunk_frequencies, case_sensitive=case_sensitive)
+        for chunk_counts in _map_text_chunks(count_chunk, text, workers):
+            counts.update(chunk_counts)
+        return _top_counts(counts, k)
+    return TextStats(text).top_words(k, case_sensitive)
 
 
 def to_title_case(text: str) -> str:
@@ -84,3 +264,253 @@ def is_palindrome(text: str) -> bool:
     """
     cleaned = re.sub(r"[^A-Za-z0-9]", "", text).lower()
     return cleaned == cleaned[::-1]
+
+
+def _split_at_whitespace(text: str, parts: int) -> list[str]:
+    """Split *text* into about *parts* pieces, each cut before a whitespace.
+
+    No word straddles two pieces, so per-piece word results combine into
+    exactly the result for the whole text.
+    """
+    bounds = [0]
+    for i in range(1, parts):
+        match = _WHITESPACE.search(text, max(bounds[-1], len(text) * i // parts))
+        if match is None:
+            break
+        bounds.append(match.start())
+    bounds.append(len(text))
+    return [text[start:end] for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def _map_text_chunks(func: Callable[[str], T], text: str, workers: int) -> list[T]:
+    """Apply *func* to whitespace-aligned pieces of *text* in a process pool.
+
+    Texts shorter than ``_PARALLEL_MIN_CHARS`` are processed in-process in
+    one piece, where the pool start-up would dominate.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(text) < _PARALLEL_MIN_CHARS:
+        return [func(text)]
+    pieces = _split_at_whitespace(text, workers)
+    if len(pieces) <= 1:
+        return [func(text)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(pieces))) as pool:
+        return list(pool.map(func, pieces))
+
+
+def _chunk_frequencies(text: str, case_sensitive: bool = True) -> Counter[str]:
+    stats = TextStats(text)
+    return stats.frequencies if case_sensitive else stats._folded_frequencies
+
+
+def _iter_chunks(texts: Iterable[str], chunk_size: int) -> Iterator[list[str]]:
+    """Yield consecutive lists of at most *chunk_size* documents."""
+    iterator = iter(texts)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _apply_chunk(func: Callable[[str], T], chunk: list[str]) -> list[T]:
+    return [func(text) for text in chunk]
+
+
+def _map_batch(
+    func: Callable[[str], T],
+    texts: Iterable[str],
+    workers: int,
+    chunk_size: int,
+) -> list[T]:
+    """Apply *func* to every document, optionally across worker processes.
+
+    Documents are shipped to workers in chunks of *chunk_size* so the
+    pickling and scheduling cost is paid once per chunk, not per document.
+    At most ``2 * workers`` chunks are in flight, so *texts* is consumed only
+    as fast as the workers keep up.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return list(map(func, texts))
+
+    results: list[T] = []
+    apply = partial(_apply_chunk, func)
+    pending: deque[Future[list[T]]] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in _iter_chunks(texts, chunk_size):
+            if len(pending) >= 2 * workers:
+                results.extend(pending.popleft().result())
+            pending.append(pool.submit(apply, chunk))
+        while pending:
+            results.extend(pending.popleft().result())
+    return results
+
+
+def word_count_batch(
+    texts: Iterable[str], workers: int = 1, chunk_size: int = 10_000
+) -> list[int]:
+    """Return :func:`word_count` for every document in *texts*.
+
+    Args:
+        texts: Iterable of documents
+        workers: Number of worker processes (``1`` runs in-process, ``0``
+            uses every CPU)
+        chunk_size: Documents sent to a worker at once
+
+    Returns:
+        One result per document, in input order
+    """
+    return _map_batch(word_count, texts, workers, chunk_size)
+
+
+def unique_words_batch(
+    texts: Iterable[str], workers: int = 1, chunk_size: int = 10_000
+) -> list[set[str]]:
+    """Return :func:`unique_words` for every document in *texts*.
+
+    Takes the same *workers* and *chunk_size* arguments as
+    :func:`word_count_batch`.
+    """
+    return _map_batch(unique_words, texts, workers, chunk_size)
+
+
+def most_common_word_batch(
+    texts: Iterable[str],
+    case_sensitive: bool = True,
+    workers: int = 1,
+    chunk_size: int = 10_000,
+) -> list[str]:
+    """Return :func:`most_common_word` for every document in *texts*.
+
+    Takes the same *workers* and *chunk_size* arguments as
+    :func:`word_count_batch`.
+    """
+    func = partial(most_common_word, case_sensitive=case_sensitive)
+    return _map_batch(func, texts, workers, chunk_size)
+
+
+def count_characters_batch(
+    texts: Iterable[str], workers: int = 1, chunk_size: int = 10_000
+) -> list[int]:
+    """Return :func:`count_characters` for every document in *texts*.
+
+    Takes the same *workers* and *chunk_size* arguments as
+    :func:`word_count_batch`.
+    """
+    return _map_batch(count_characters, texts, workers, chunk_size)
+
+
+def _iter_text_chunks(
+    source: TextSource, chunk_size: int, encoding: str
+) -> Iterator[str]:
+    """Yield text chunks of at most *chunk_size* from a :data:`TextSource`."""
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_size):
+            yield source[start : start + chunk_size]
+    elif isinstance(source, os.PathLike):
+        with open(Path(source), encoding=encoding) as f:
+            yield from iter(partial(f.read, chunk_size), "")
+    elif hasattr(source, "read"):
+        yield from iter(partial(source.read, chunk_size), "")  # type: ignore
+    else:
+        yield from source  # type: ignore[misc]
+
+
+def _iter_word_chunks(
+    source: TextSource,
+    case_sensitive: bool = True,
+    chunk_size: int = 1 << 20,
+    encoding: str = "utf-8",
+) -> Iterator[list[str]]:
+    """Yield the words of *source* chunk by chunk.
+
+    A word cut by a chunk boundary is held back and joined with the start of
+    the next chunk, so the words are exactly those of ``text.split()`` on
+    the concatenated text.
+    """
+    carry = ""
+    for chunk in _iter_text_chunks(source, chunk_size, encoding):
+        if not chunk:
+            continue
+        if not case_sensitive:
+            chunk = chunk.lower()
+        words = (carry + chunk).split() if carry else chunk.split()
+        carry = words.pop() if words and not chunk[-1].isspace() else ""
+        if words:
+            yield words
+    if carry:
+        yield [carry]
+
+
+def iter_words(
+    source: TextSource,
+    case_sensitive: bool = True,
+    chunk_size: int = 1 << 20,
+    encoding: str = "utf-8",
+) -> Iterator[str]:
+    """Yield the whitespace-separated words of a text, file or stream of text.
+
+    Args:
+        source: The text itself, a ``Path`` to a text file, an open text
+            file, or an iterable of text chunks (chunk boundaries may fall
+            inside words). A ``str`` is always treated as text; pass file
+            names as :class:`pathlib.Path`.
+        case_sensitive: If False, words are lowercased
+        chunk_size: Characters split into words at a time
+        encoding: Encoding used when *source* is a path
+
+    Yields:
+        The same words as ``text.split()`` on the whole text
+    """
+    for words in _iter_word_chunks(source, case_sensitive, chunk_size, encoding):
+        yield from words
+
+
+def word_frequencies(
+    source: TextSource,
+    case_sensitive: bool = True,
+    capacity: int | None = None,
+    chunk_size: int = 1 << 20,
+    encoding: str = "utf-8",
+) -> HeavyHitters:
+    """Count word occurrences in a file or stream of text in one pass.
+
+    Args:
+        source: Text, ``Path``, open text file or iterable of chunks (see
+            :func:`iter_words`)
+        case_sensitive: Whether to treat words with different cases as different
+        capacity: ``None`` counts every word exactly; an integer bounds memory
+            to that many tracked words using the Space-Saving algorithm
+        chunk_size: Characters split into words at a time
+        encoding: Encoding used when *source* is a path
+
+    Returns:
+        :class:`~gpt_fusion.sketches.HeavyHitters` summary that can be merged
+        with the summaries of other shards
+    """
+    summary = HeavyHitters(capacity)
+    for words in _iter_word_chunks(source, case_sensitive, chunk_size, encoding):
+        summary.update_many(words)
+    return summary
+
+
+def stream_top_words(
+    source: TextSource,
+    k: int = 10,
+    case_sensitive: bool = True,
+    capacity: int | None = None,
+    chunk_size: int = 1 << 20,
+    encoding: str = "utf-8",
+) -> list[tuple[str, int]]:
+    """Return the *k* most frequent words of a file or stream of text.
+
+    Takes the same arguments as :func:`word_frequencies`. Ties are broken
+    alphabetically, like :func:`most_common_word`. In approximate mode
+    (*capacity* set) use a capacity well above *k*; counts may then be
+    overestimated by at most ``total_words / capacity``.
+
+    Returns:
+        Up to *k* ``(word, count)`` pairs, most frequent first
+    """
+    summary = word_frequencies(source, case_sensitive, capacity, chunk_size, encoding)
+    return summary.top(k)
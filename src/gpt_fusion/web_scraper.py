@@ -1,25 +1,36 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from urllib.parse import urlparse
-from typing import Optional
+from typing import AsyncIterator, Iterable, Mapping, Optional, Tuple, Union
 
 import requests
 from requests.exceptions import RequestException
-from bs4 import BeautifulSoup
 
 from .exceptions import ValidationError
 from .config import get_config
+from .html_backends import parse_html
+from .http_cache import CachingAdapter, ResponseCache
 
 logger = logging.getLogger(__name__)
 
 # Global session for connection pooling
 _session: Optional[requests.Session] = None
 
+# Response cache used by the session when Config.HTTP_CACHE_ENABLED is set
+_response_cache: Optional[ResponseCache] = None
+
 
 def _get_session() -> requests.Session:
     """Get or create a requests session with connection pooling.
 
+    When ``Config.HTTP_CACHE_ENABLED`` is set, GET responses go through the
+    :class:`~gpt_fusion.http_cache.ResponseCache` returned by
+    :func:`get_response_cache`.
+
     Returns:
         Configured requests session with connection pooling
     """
@@ -28,12 +39,16 @@ def _get_session() -> requests.Session:
         _session = requests.Session()
         # Configure connection pooling using centralized config
         config = get_config()
-        adapter = requests.adapters.HTTPAdapter(
+        pool_options = dict(
             pool_connections=config.HTTP_POOL_CONNECTIONS,
             pool_maxsize=config.HTTP_POOL_MAXSIZE,
             max_retries=config.HTTP_MAX_RETRIES,
             pool_block=False,
         )
+        if config.HTTP_CACHE_ENABLED:
+            adapter = CachingAdapter(get_response_cache(), **pool_options)
+        else:
+            adapter = requests.adapters.HTTPAdapter(**pool_options)
         _session.mount("http://", adapter)
         _session.mount("https://", adapter)
 
@@ -43,6 +58,17 @@ def _get_session() -> requests.Session:
     return _session
 
 
+def get_response_cache() -> ResponseCache:
+    """Return the shared response cache, creating it on first use.
+
+    Its ``stats`` property exposes the hit, revalidation and miss counters.
+    """
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
+
+
 def close_session() -> None:
     """Close the global session and clean up connections.
 
@@ -54,24 +80,8 @@ def close_session() -> None:
         _session = None
 
 
-def scrape(
-    url: str, css_selector: str = "*", timeout: Optional[int] = None
-) -> list[str]:
-    """Return text content of elements matching *css_selector* from *url*.
-
-    Args:
-        url: The URL to scrape content from (must be HTTP/HTTPS)
-        css_selector: CSS selector for elements to extract (default: all elements)
-        timeout: Request timeout in seconds (default: from config)
-
-    Returns:
-        List of text content from matching elements
-
-    Raises:
-        ValidationError: If URL is invalid or uses unsupported scheme
-        RequestException: If the HTTP request fails
-    """
-    # Validate URL
+def _validate_url(url: str) -> str:
+    """Return *url* stripped, raising :class:`ValidationError` if unusable."""
     if not url or not isinstance(url, str):
         raise ValidationError("URL must be a non-empty string")
 
@@ -84,8 +94,11 @@ def scrape(
 
     if not parsed.netloc:
         raise ValidationError(f"Invalid URL format: {url}")
+    return url.strip()
+
 
-    # Use session with connection pooling
+def _fetch(url: str, timeout: Optional[int]) -> requests.Response:
+    """GET *url* through the pooled session, raising on HTTP errors."""
     session = _get_session()
 
     # Use timeout from config if not specified
@@ -99,13 +112,253 @@ def scrape(
     except RequestException as e:
         logger.error(f"Failed to scrape {url}: {e}")
         raise
+    return response
+
 
+# A field is a CSS selector, or ``(selector, attribute)`` to read an attribute
+FieldSpec = Union[str, Tuple[str, str]]
+
+
+def _field_selectors(
+    fields: Mapping[str, FieldSpec]
+) -> dict[str, tuple[str, str | None]]:
+    """Normalise *fields* to ``name -> (selector, attribute or None)``."""
+    if not fields:
+        raise ValidationError("At least one field must be given")
+    normalised: dict[str, tuple[str, str | None]] = {}
+    for name, spec in fields.items():
+        if isinstance(spec, str):
+            normalised[name] = (spec, None)
+        elif (
+            isinstance(spec, tuple)
+            and len(spec) == 2
+            and all(isinstance(part, str) for part in spec)
+        ):
+            normalised[name] = (spec[0], spec[1])
+        else:
+            raise ValidationError(
+                f"Field {name!r} must be a CSS selector or a "
+                f"(selector, attribute) tuple, got {spec!r}"
+            )
+    return normalised
+
+
+def _extract_fields(
+    html: str,
+    fields: Mapping[str, FieldSpec],
+    url: str,
+    parser: Optional[str] = None,
+) -> dict[str, list[str]]:
+    """Return the values of every field in *fields* from one parse of *html*."""
+    selectors = _field_selectors(fields)
     try:
-        soup = BeautifulSoup(response.text, "html.parser")
-        elements = soup.select(css_selector)
-        result = [element.get_text(strip=True) for element in elements]
-        logger.info(f"Successfully scraped {len(result)} elements from {url}")
+        document = parse_html(
+            html, parser, [selector for selector, _ in selectors.values()]
+        )
+        result: dict[str, list[str]] = {}
+        for name, (selector, attribute) in selectors.items():
+            elements = document.select(selector)
+            if attribute is None:
+                result[name] = [document.text(element) for element in elements]
+            else:
+                values = (
+                    document.attribute(element, attribute) for element in elements
+                )
+                result[name] = [value for value in values if value is not None]
+        logger.info(
+            f"Successfully scraped {sum(map(len, result.values()))} values "
+            f"for {len(result)} fields from {url}"
+        )
         return result
+    except (ImportError, ValidationError):
+        raise
     except Exception as e:
         logger.error(f"Failed to parse content from {url}: {e}")
         raise ValidationError(f"Failed to parse HTML content: {e}") from e
+
+
+def _extract_text(
+    html: str, css_selector: str, url: str, parser: Optional[str] = None
+) -> list[str]:
+    """Return the text of elements in *html* matching *css_selector*."""
+    return _extract_fields(html, {"texts": css_selector}, url, parser)["texts"]
+
+
+def scrape_fields(
+    url: str,
+    fields: Mapping[str, FieldSpec],
+    timeout: Optional[int] = None,
+    parser: Optional[str] = None,
+) -> dict[str, list[str]]:
+    """Extract several fields from *url* with one request and one parse.
+
+    Example:
+        >>> scrape_fields(  # doctest: +SKIP
+        ...     "https://example.com/shop",
+        ...     {"title": "h1", "prices": "span.price", "links": ("a", "href")},
+        ... )
+        {'title': ['Shop'], 'prices': ['1.50', '3.00'], 'links': ['/p/1', '/p/2']}
+
+    Args:
+        url: The URL to scrape content from (must be HTTP/HTTPS)
+        fields: Mapping of field name to a CSS selector, whose matches
+            yield their text, or to a ``(selector, attribute)`` tuple, whose
+            matches yield that attribute (elements without it are skipped)
+        timeout: Request timeout in seconds (default: from config)
+        parser: HTML parser backend (default: ``Config.HTML_PARSER``, see
+            :func:`~gpt_fusion.html_backends.parse_html`)
+
+    Returns:
+        Dictionary mapping each field name to its values in document order
+
+    Raises:
+        ValidationError: If URL is invalid, *fields* is empty or malformed,
+            or the page cannot be parsed
+        RequestException: If the HTTP request fails
+    """
+    url = _validate_url(url)
+    _field_selectors(fields)  # Reject bad fields before making the request
+    response = _fetch(url, timeout)
+    return _extract_fields(response.text, fields, url, parser)
+
+
+def scrape(
+    url: str,
+    css_selector: str = "*",
+    timeout: Optional[int] = None,
+    parser: Optional[str] = None,
+) -> list[str]:
+    """Return text content of elements matching *css_selector* from *url*.
+
+    Use :func:`scrape_fields` to extract several selectors from one page.
+
+    Args:
+        url: The URL to scrape content from (must be HTTP/HTTPS)
+        css_selector: CSS selector for elements to extract (default: all elements)
+        timeout: Request timeout in seconds (default: from config)
+        parser: HTML parser backend (default: ``Config.HTML_PARSER``, see
+            :func:`~gpt_fusion.html_backends.parse_html`)
+
+    Returns:
+        List of text content from matching elements
+
+    Raises:
+        ValidationError: If URL is invalid or uses unsupported scheme
+        RequestException: If the HTTP request fails
+    """
+    return scrape_fields(url, {"texts": css_selector}, timeout, parser)["texts"]
+
+
+@dataclass
+class ScrapeResult:
+    """Outcome of scraping one URL with :func:`scrape_many`."""
+
+    url: str
+    texts: list[str] = field(default_factory=list)
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Return ``True`` if the page was fetched and parsed."""
+        return self.error is None
+
+
+async def scrape_many(
+    urls: Iterable[str],
+    css_selector: str = "*",
+    concurrency: int = 20,
+    per_host: int = 4,
+    timeout: Optional[int] = None,
+) -> AsyncIterator[ScrapeResult]:
+    """Scrape many URLs concurrently, yielding results as pages complete.
+
+    Each page is fetched and parsed exactly as by :func:`scrape`, using the
+    pooled session on a dedicated thread pool, so URL validation, timeouts
+    and connection settings come from the same place. At most *concurrency*
+    requests run at once and at most *per_host* per host; *urls* is
+    consumed lazily, so very long URL lists are not materialised.
+
+    Args:
+        urls: URLs to scrape (must be HTTP/HTTPS)
+        css_selector: CSS selector for elements to extract (default: all elements)
+        concurrency: Maximum number of requests in flight
+        per_host: Maximum number of concurrent requests to one host
+        timeout: Request timeout in seconds (default: from config)
+
+    Yields:
+        One :class:`ScrapeResult` per URL, in completion order. A failing
+        URL (invalid, HTTP error, unparsable) is reported through
+        :attr:`ScrapeResult.error` and does not stop the batch.
+
+    Raises:
+        ValueError: If *concurrency* or *per_host* is less than 1
+    """
+    if concurrency < 1 or per_host < 1:
+        raise ValueError("concurrency and per_host must be at least 1")
+
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(concurrency)
+    host_limits: dict[str, asyncio.Semaphore] = {}
+
+    def fetch_and_parse(url: str) -> list[str]:
+        return _extract_text(_fetch(url, timeout).text, css_selector, url)
+
+    async def run(url: str, executor: ThreadPoolExecutor) -> ScrapeResult:
+        try:
+            url = _validate_url(url)
+            host = urlparse(url).netloc.lower()
+            host_limit = host_limits.setdefault(host, asyncio.Semaphore(per_host))
+            async with host_limit, limit:
+                texts = await loop.run_in_executor(executor, fetch_and_parse, url)
+        except Exception as e:
+            return ScrapeResult(url=str(url), error=e)
+        return ScrapeResult(url=url, texts=texts)
+
+    # Queue a few tasks per slot so hosts at their limit don't idle the rest
+    window = concurrency * 4
+    pending: set[asyncio.Future[ScrapeResult]] = set()
+    url_iter = iter(urls)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        while True:
+            for url in url_iter:
+                pending.add(asyncio.ensure_future(run(url, executor)))
+                if len(pending) >= window:
+                    break
+            if not pending:
+                return
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        # Don't block the event loop on requests still in flight when the
+        # consumer stops early; they finish (or time out) in the background.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def scrape_many_sync(
+    urls: Iterable[str],
+    css_selector: str = "*",
+    concurrency: int = 20,
+    per_host: int = 4,
+    timeout: Optional[int] = None,
+) -> list[ScrapeResult]:
+    """Run :func:`scrape_many` to completion for non-async callers.
+
+    Returns:
+        Results in completion order; check :attr:`ScrapeResult.error`
+    """
+
+    async def collect() -> list[ScrapeResult]:
+        return [
+            result
+            async for result in scrape_many(
+                urls, css_selector, concurrency, per_host, timeout
+            )
+        ]
+
+    return asyncio.run(collect())
@@ -1,11 +1,34 @@
+import bz2
+import gzip
+import json
+import lzma
+import math
+import random
+import statistics
 from pathlib import Path
 import pytest
 
+from gpt_fusion import analysis
 from gpt_fusion.analysis import (
+    CSVGroup,
+    CSVHistogram,
+    CSVStats,
+    CSVTailAggregator,
+    aggregate_csvs,
     average_from_csv,
+    describe_csv,
+    group_by_csv,
+    histogram_from_csv,
+    iter_group_by_csv,
+    load_column_from_arrow,
+    load_columns_from_csv,
     load_numbers_from_csv,
     median_from_csv,
+    sketch_from_csv,
+    percentiles_from_csv,
 )
+from gpt_fusion.exceptions import DataError
+from gpt_fusion.sketches import QuantileSketch
 
 DATA_PATH = Path(__file__).resolve().parents[1] / "data" / "numbers.csv"
 
@@ -34,3 +57,527 @@ def test_load_numbers_from_csv_missing_file(tmp_path):
     missing_path = tmp_path / "nope.csv"
     with pytest.raises(FileNotFoundError):
         load_numbers_from_csv(missing_path)
+
+
+def test_describe_csv_single_pass(tmp_path):
+    csv_path = tmp_path / "nums.csv"
+    csv_path.write_text("value\n1\ninvalid\n2\n\n4\n8\n", encoding="utf-8")
+
+    stats = describe_csv(csv_path)
+    values = [1.0, 2.0, 4.0, 8.0]
+    assert stats.count == 4
+    assert stats.skipped == 1
+    assert stats.total == 15.0
+    assert stats.mean == 3.75
+    assert stats.minimum == 1.0
+    assert stats.maximum == 8.0
+    assert stats.variance == pytest.approx(statistics.variance(values))
+    assert stats.stddev == pytest.approx(statistics.stdev(values))
+
+
+def test_describe_csv_no_values(tmp_path):
+    csv_path = tmp_path / "nums.csv"
+    csv_path.write_text("value\nx\n", encoding="utf-8")
+    with pytest.raises(DataError):
+        describe_csv(csv_path)
+
+
+def test_csv_stats_merge_matches_single_pass():
+    values = [0.1 * i for i in range(1, 200)] + [1e16, 1.0, -1e16]
+    whole = CSVStats()
+    whole.add_many(values)
+
+    left, right = CSVStats(), CSVStats()
+    left.add_many(values[:57])
+    right.add_many(values[57:])
+    right.add_skipped(2)
+    merged = left.merge(right)
+
+    assert merged.count == whole.count
+    assert merged.total == whole.total == math.fsum(values)
+    assert merged.minimum == whole.minimum
+    assert merged.maximum == whole.maximum
+    assert merged.skipped == 2
+    assert merged.variance == pytest.approx(whole.variance)
+
+    restored = CSVStats.from_dict(json.loads(json.dumps(merged.to_dict())))
+    assert restored == merged
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_percentiles_from_csv_exact(tmp_path, monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(analysis, "_import_numpy", lambda: None)
+    values = [float((i * 7919) % 1000) for i in range(1001)] + [3.0, 3.0, 3.0]
+    csv_path = tmp_path / "nums.csv"
+    csv_path.write_text("value\n" + "".join(f"{v}\n" for v in values), encoding="utf-8")
+
+    expected = statistics.quantiles(values, n=4, method="inclusive")
+    assert percentiles_from_csv(csv_path, [25, 50, 75]) == expected
+    assert percentiles_from_csv(csv_path, [0, 100]) == [min(values), max(values)]
+    assert median_from_csv(csv_path) == statistics.median(values)
+
+
+def test_percentiles_from_csv_rejects_out_of_range():
+    with pytest.raises(ValueError):
+        percentiles_from_csv(DATA_PATH, [101])
+
+
+def test_describe_csv_parallel_matches_serial(tmp_path, monkeypatch):
+    monkeypatch.setattr(analysis, "_MIN_RANGE_BYTES", 64)
+    monkeypatch.setattr(analysis, "_RANGE_BLOCK_BYTES", 50)
+    csv_path = tmp_path / "nums.csv"
+    rows = [f"row{i},{(i * 37) % 101 / 7},x\n" for i in range(2000)]
+    rows[10] = "row10,bad,x\n"
+    rows[20] = "short\n"
+    csv_path.write_text("name,value,extra\n" + "".join(rows), encoding="utf-8")
+
+    serial = describe_csv(csv_path)
+    parallel = describe_csv(csv_path, parallel=True, workers=3)
+    assert parallel.count == serial.count == 1998
+    assert parallel.skipped == serial.skipped == 2
+    assert parallel.total == serial.total
+    assert parallel.minimum == serial.minimum
+    assert parallel.maximum == serial.maximum
+    assert parallel.variance == pytest.approx(serial.variance)
+    assert average_from_csv(csv_path, parallel=True) == pytest.approx(serial.mean)
+
+
+def test_describe_csv_parallel_falls_back_on_quoted_line_breaks(tmp_path, monkeypatch):
+    monkeypatch.setattr(analysis, "_MIN_RANGE_BYTES", 64)
+    monkeypatch.setattr(analysis, "_RANGE_BLOCK_BYTES", 50)
+    csv_path = tmp_path / "nums.csv"
+    rows = [
+        f'"note {i}\n{i},{i}\nmore",{i}\n' if i % 30 == 0 else f"n{i},{i}\n"
+        for i in range(300)
+    ]
+    csv_path.write_text("name,value\n" + "".join(rows), encoding="utf-8")
+
+    serial = describe_csv(csv_path)
+    parallel = describe_csv(csv_path, parallel=True, workers=3)
+    assert (parallel.count, parallel.skipped) == (serial.count, serial.skipped)
+    assert (parallel.count, parallel.skipped) == (300, 0)
+    assert parallel.total == serial.total
+
+
+def test_split_byte_ranges_aligns_to_lines(tmp_path):
+    csv_path = tmp_path / "nums.csv"
+    data = "value\n" + "".join(f"{i}\n" for i in range(500))
+    csv_path.write_text(data, encoding="utf-8")
+    raw = csv_path.read_bytes()
+
+    ranges = analysis._split_byte_ranges(csv_path, len("value\n"), 7)
+    assert ranges[0][0] == len("value\n")
+    assert ranges[-1][1] == len(raw)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert raw[start - 1 : start] == b"\n"
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "value\n1\n2\n3",
+        "id,value\r\n1,1.5\r\n2,bad\r\n\r\n3\r\n4, 4 \r\n",
+        "value,value\n1,2\n3,4\n",
+        'name,value\n"a, b",1\n"multi\nline",2\nc,"3"\n',
+        "name\nx\ny\n",
+        "value\n\u0661\n1_0\n",
+        "value\r1\r2\r",
+    ],
+)
+def test_fast_engine_matches_dict_engine(tmp_path, content):
+    csv_path = tmp_path / "nums.csv"
+    csv_path.write_bytes(content.encode("utf-8"))
+
+    expected = list(analysis._iter_csv_values(csv_path, engine="dict"))
+    assert list(analysis._iter_csv_values(csv_path, engine="fast")) == expected
+    assert load_numbers_from_csv(csv_path, engine="fast") == load_numbers_from_csv(
+        csv_path, engine="dict"
+    )
+
+
+def test_fast_engine_falls_back_on_later_quotes(tmp_path, monkeypatch):
+    monkeypatch.setattr(analysis, "_RANGE_BLOCK_BYTES", 16)
+    csv_path = tmp_path / "nums.csv"
+    rows = "".join(f"r{i},{i}\n" for i in range(20))
+    csv_path.write_text(f'name,value\n{rows}"x\ny",99\n', encoding="utf-8")
+
+    values = load_numbers_from_csv(csv_path, engine="fast")
+    assert values == [float(i) for i in range(20)] + [99.0]
+
+
+def test_unknown_engine_rejected():
+    with pytest.raises(ValueError, match="Unknown CSV engine"):
+        load_numbers_from_csv(DATA_PATH, engine="pandas")
+
+
+@pytest.mark.parametrize("engine", ["fast", "dict"])
+def test_load_columns_from_csv(tmp_path, engine):
+    csv_path = tmp_path / "metrics.csv"
+    csv_path.write_text(
+        'region,value,latency,note\nus,1,10,ok\neu,x,20,"a, b"\n\nus,3,,ok\nap,4\n',
+        encoding="utf-8",
+    )
+
+    loaded = load_columns_from_csv(csv_path, ["value", "latency", "missing"], engine)
+    assert loaded["value"].tolist() == [1.0, 3.0, 4.0]
+    assert loaded["latency"].tolist() == [10.0, 20.0]
+    assert loaded.invalid == {"value": 1, "latency": 2, "missing": 4}
+
+    numeric = load_columns_from_csv(csv_path, engine=engine)
+    assert numeric.columns == ["value", "latency"]
+
+
+def test_column_argument(tmp_path):
+    csv_path = tmp_path / "metrics.csv"
+    csv_path.write_text("value,latency\n1,10\n2,30\n3,20\n", encoding="utf-8")
+
+    assert average_from_csv(csv_path, column="latency") == 20.0
+    assert median_from_csv(csv_path, column="latency") == 20.0
+    assert describe_csv(csv_path, column="latency").maximum == 30.0
+    with pytest.raises(DataError):
+        average_from_csv(csv_path, column="missing")
+
+
+def test_tail_aggregator_processes_only_appended_rows(tmp_path):
+    csv_path = tmp_path / "metrics.csv"
+    csv_path.write_text("value\n1\n2\n3", encoding="utf-8")
+
+    aggregator = CSVTailAggregator(csv_path)
+    assert aggregator.update().count == 2  # "3" is still being written
+
+    with open(csv_path, "a", encoding="utf-8") as f:
+        f.write("\nbad\n4\n")
+    stats = aggregator.update()
+    assert (stats.count, stats.skipped, stats.total) == (4, 1, 10.0)
+    assert aggregator.sketch.quantile(0.5) == 2.5
+    assert aggregator.offset == csv_path.stat().st_size
+
+    state = tmp_path / "state.json"
+    aggregator.save(state)
+    with open(csv_path, "a", encoding="utf-8") as f:
+        f.write("5\n")
+    restored = CSVTailAggregator.load(state)
+    assert restored.update().total == 15.0
+    assert restored.restarts == 0
+
+
+def test_tail_aggregator_restarts_after_rotation(tmp_path):
+    csv_path = tmp_path / "metrics.csv"
+    csv_path.write_text("value\n10\n20\n", encoding="utf-8")
+    aggregator = CSVTailAggregator(csv_path, sketch_error=None)
+    aggregator.update()
+
+    csv_path.write_text("value\n7\n", encoding="utf-8")
+    stats = aggregator.update()
+    assert (stats.count, stats.total, aggregator.restarts) == (1, 7.0, 1)
+
+    # Same size as before but different content is also a new file
+    csv_path.write_text("value\n8\n", encoding="utf-8")
+    assert aggregator.update().total == 8.0
+    assert aggregator.restarts == 2
+
+
+def test_tail_aggregator_follow(tmp_path):
+    csv_path = tmp_path / "metrics.csv"
+    csv_path.write_text("value\n1\n", encoding="utf-8")
+    updates = CSVTailAggregator(csv_path).follow(poll_interval=0)
+
+    assert next(updates).count == 1
+    with open(csv_path, "a", encoding="utf-8") as f:
+        f.write("2\n")
+    assert next(updates).total == 3.0
+
+
+@pytest.mark.parametrize("engine", ["fast", "dict"])
+@pytest.mark.parametrize("content", [b"value\n1\n\xff\n2\n", b"id,value\n\xff,1\n"])
+def test_invalid_utf8_raises_for_every_engine(tmp_path, engine, content):
+    csv_path = tmp_path / "nums.csv"
+    csv_path.write_bytes(content)
+
+    with pytest.raises(UnicodeDecodeError):
+        load_numbers_from_csv(csv_path, engine=engine)
+    with pytest.raises(UnicodeDecodeError):
+        list(analysis._iter_csv_rows(csv_path, engine=engine))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_aggregate_csvs(tmp_path, workers):
+    shards = tmp_path / "shards"
+    shards.mkdir()
+    for day in range(4):
+        rows = "".join(f"{day * 10 + i}\n" for i in range(5))
+        (shards / f"day{day}.csv").write_text("value\n" + rows, encoding="utf-8")
+    (shards / "empty.csv").write_text("value\n", encoding="utf-8")
+    (shards / "broken.csv").write_bytes(b"value\n\xff\xfe\n")
+
+    seen = []
+    result = aggregate_csvs(
+        str(shards / "*.csv"),
+        workers=workers,
+        progress=lambda done, total, path: seen.append((done, total)),
+    )
+
+    assert result.total.count == 20
+    assert result.total.total == sum(d * 10 + i for d in range(4) for i in range(5))
+    assert result.files[str(shards / "day2.csv")].minimum == 20.0
+    assert result.files[str(shards / "empty.csv")].count == 0
+    assert list(result.errors) == [str(shards / "broken.csv")]
+    assert isinstance(result.errors[str(shards / "broken.csv")], UnicodeDecodeError)
+    assert seen[-1] == (6, 6)
+
+
+def test_aggregate_csvs_reports_missing_files(tmp_path):
+    result = aggregate_csvs([tmp_path / "missing.csv"], workers=1)
+    assert isinstance(result.errors[str(tmp_path / "missing.csv")], FileNotFoundError)
+    assert result.total.count == 0
+
+
+@pytest.mark.parametrize("compress", [gzip.compress, bz2.compress, lzma.compress])
+@pytest.mark.parametrize("engine", ["fast", "dict"])
+def test_compressed_csv_input(tmp_path, monkeypatch, compress, engine):
+    monkeypatch.setattr(analysis, "_RANGE_BLOCK_BYTES", 32)
+    rows = "".join(f"r{i},{i}\n" for i in range(50))
+    content = f'name,value\n{rows}"quoted\nname",50\n'
+    csv_path = tmp_path / "nums.csv.gz"
+    csv_path.write_bytes(compress(content.encode("utf-8")))
+
+    expected = [float(i) for i in range(51)]
+    assert load_numbers_from_csv(csv_path, engine=engine) == expected
+    stats = describe_csv(csv_path, parallel=True, workers=2, engine=engine)
+    assert stats.total == sum(expected)
+
+
+def test_zstd_csv_input(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    csv_path = tmp_path / "nums.csv.zst"
+    data = "value\n" + "".join(f"{i}\n" for i in range(100))
+    csv_path.write_bytes(zstandard.ZstdCompressor().compress(data.encode("utf-8")))
+
+    assert average_from_csv(csv_path) == 49.5
+
+
+def _write_grouped_csv(path, rows):
+    path.write_text(
+        "region,kind,value\n" + "".join(f"{r},{k},{v}\n" for r, k, v in rows),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.parametrize("engine", ["fast", "dict"])
+def test_group_by_csv(tmp_path, engine):
+    csv_path = tmp_path / "groups.csv"
+    _write_grouped_csv(
+        csv_path,
+        [("eu", "a", 1), ("us", "a", 2), ("eu", "b", 3), ("eu", "a", "x")],
+    )
+
+    groups = group_by_csv(csv_path, "region", engine=engine)
+    assert list(groups) == ["eu", "us"]
+    assert groups["eu"].stats.count == 2
+    assert groups["eu"].stats.skipped == 1
+    assert groups["eu"].stats.total == 4.0
+    assert groups["us"].stats.maximum == 2.0
+
+    composite = group_by_csv(csv_path, ["region", "kind"], engine=engine)
+    assert composite[("eu", "a")].stats.total == 1.0
+    assert composite[("eu", "b")].stats.total == 3.0
+
+
+def test_group_by_csv_spills_to_disk(tmp_path):
+    csv_path = tmp_path / "groups.csv"
+    rows = [(f"k{i % 37}", "a", i) for i in range(1_000)]
+    _write_grouped_csv(csv_path, rows)
+
+    spill_dir = tmp_path / "spill"
+    spill_dir.mkdir()
+    groups = dict(
+        iter_group_by_csv(
+            csv_path, "region", sketch_error=0.05, max_groups=4, spill_dir=spill_dir
+        )
+    )
+    assert len(groups) == 37
+    for key, group in groups.items():
+        expected = [float(v) for k, _, v in rows if k == key]
+        assert group.stats.count == len(expected)
+        assert group.stats.total == sum(expected)
+        assert group.sketch.count == len(expected)
+    assert list(spill_dir.iterdir()) == []
+
+
+def test_group_by_csv_repartitions_large_spills(tmp_path, monkeypatch):
+    csv_path = tmp_path / "groups.csv"
+    rows = [(f"k{i % 300}", "a", i) for i in range(1_200)]
+    _write_grouped_csv(csv_path, rows)
+
+    spilled = []
+    spill_groups = analysis._spill_groups
+
+    def spy(groups, spill_files, level=0):
+        spilled.append((level, len(groups)))
+        spill_groups(groups, spill_files, level)
+
+    monkeypatch.setattr(analysis, "_GROUP_SPILL_PARTITIONS", 2)
+    monkeypatch.setattr(analysis, "_spill_groups", spy)
+    groups = group_by_csv(csv_path, "region", max_groups=10)
+
+    assert len(groups) == 300
+    assert all(group.stats.count == 4 for group in groups.values())
+    assert max(level for level, _ in spilled) > 1
+    assert max(size for _, size in spilled) <= 10
+    with pytest.raises(ValueError):
+        group_by_csv(csv_path, "region", max_groups=0)
+
+
+def test_csv_group_merge_leaves_inputs_unchanged():
+    left, right = CSVGroup(sketch=QuantileSketch()), CSVGroup(sketch=QuantileSketch())
+    for group, value in ((left, 1.0), (right, 2.0)):
+        group.stats.add(value)
+        group.sketch.update(value)
+
+    merged = left.merge(right)
+    assert (merged.stats.count, merged.sketch.count) == (2, 2)
+    for group in (left, right):
+        assert (group.stats.count, group.sketch.count) == (1, 1)
+
+
+def test_group_by_csv_missing_key_column(tmp_path):
+    csv_path = tmp_path / "groups.csv"
+    _write_grouped_csv(csv_path, [("eu", "a", 1)])
+    with pytest.raises(DataError):
+        group_by_csv(csv_path, "country")
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_external_quantiles_match_in_memory(tmp_path, monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(analysis, "_import_numpy", lambda: None)
+    sort_dir = tmp_path / "sort"
+    sort_dir.mkdir()
+    config = analysis.get_config()
+    monkeypatch.setattr(config, "CSV_SORT_MEMORY_BYTES", 8 * 1024)
+    monkeypatch.setattr(config, "CSV_SORT_TEMP_DIR", str(sort_dir))
+
+    rng = random.Random(3)
+    values = [rng.randint(-500, 500) / 4 for _ in range(5_000)]
+    csv_path = tmp_path / "nums.csv"
+    csv_path.write_text("value\n" + "".join(f"{v}\n" for v in values), encoding="utf-8")
+
+    percentiles = [0, 10, 50, 99.9, 100]
+    assert percentiles_from_csv(
+        csv_path, percentiles, external=True
+    ) == percentiles_from_csv(csv_path, percentiles)
+    assert median_from_csv(csv_path, external=True) == statistics.median(values)
+    assert list(sort_dir.iterdir()) == []
+
+    # A single in-memory run uses NumPy selection when it is available
+    if use_numpy:
+        monkeypatch.setattr(analysis, "_select_ranks", None)
+    small_path = tmp_path / "small.csv"
+    small_path.write_text("value\n" + "".join(f"{v}\n" for v in values[:100]))
+    assert median_from_csv(small_path, external=True) == statistics.median(values[:100])
+
+
+def test_external_quantiles_empty_file(tmp_path):
+    csv_path = tmp_path / "nums.csv"
+    csv_path.write_text("value\nx\n", encoding="utf-8")
+    with pytest.raises(DataError):
+        median_from_csv(csv_path, external=True)
+
+
+def test_histogram_from_csv_linear(tmp_path):
+    csv_path = tmp_path / "nums.csv"
+    csv_path.write_text(
+        "value\n" + "".join(f"{i}\n" for i in range(100)) + "-5\n100\n150\nnan\n",
+        encoding="utf-8",
+    )
+
+    hist = histogram_from_csv(csv_path, bins=4, binning="linear", bounds=(0, 100))
+    assert hist.edges == [0, 25, 50, 75, 100]
+    assert hist.counts == [25, 25, 25, 26]
+    assert (hist.underflow, hist.overflow) == (1, 1)
+    assert hist.total == 103
+
+
+def test_histogram_from_csv_auto_and_log(tmp_path):
+    csv_path = tmp_path / "nums.csv"
+    csv_path.write_text("value\n1\n10\n100\n1000\n10000\n", encoding="utf-8")
+
+    hist = histogram_from_csv(csv_path, bins=4)
+    assert hist.scale == "log"
+    assert hist.counts == [1, 1, 1, 2]
+    assert hist.edges[1] == pytest.approx(10)
+
+    hist = histogram_from_csv(csv_path, bins=2, binning="linear", sample_size=2)
+    assert (hist.low, hist.high) == (1, 10)
+    assert hist.overflow == 3
+
+
+def test_histogram_merge_and_serialise(tmp_path):
+    first, second = tmp_path / "a.csv", tmp_path / "b.csv"
+    first.write_text("value\n1\n2\n", encoding="utf-8")
+    second.write_text("value\n3\n9\n", encoding="utf-8")
+
+    left = histogram_from_csv(first, bins=3, bounds=(0, 9))
+    right = histogram_from_csv(second, bins=3, bounds=(0, 9))
+    merged = left.merge(CSVHistogram.from_dict(json.loads(json.dumps(right.to_dict()))))
+    assert merged.counts == [2, 1, 1]
+
+    with pytest.raises(ValueError):
+        left.merge(CSVHistogram.empty(0, 9, bins=4))
+
+
+def _write_arrow_table(path, values):
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table({"name": [f"r{i}" for i in range(len(values))], "value": values})
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, path, row_group_size=4)
+    else:
+        with pa.ipc.new_file(path, table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=4):
+                writer.write_batch(batch)
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_arrow_inputs(tmp_path, monkeypatch, suffix, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(analysis, "_import_numpy", lambda: None)
+    path = tmp_path / f"nums{suffix}"
+    values = [3.0, None, 1.0, 4.0, 1.5, 9.0, 2.0, 6.0, 5.0, 3.5]
+    _write_arrow_table(path, values)
+    present = [v for v in values if v is not None]
+
+    assert list(load_column_from_arrow(path)) == present
+    assert list(load_column_from_arrow(path, row_groups=[1])) == [1.5, 9.0, 2.0, 6.0]
+    assert average_from_csv(path) == pytest.approx(statistics.mean(present))
+    assert median_from_csv(path) == statistics.median(present)
+    assert median_from_csv(path, external=True) == statistics.median(present)
+    assert median_from_csv(path, approximate=True) == statistics.median_low(present)
+    assert percentiles_from_csv(path, [0, 100], approximate=True) == [1.0, 9.0]
+    assert sketch_from_csv(path).count == len(present)
+    assert histogram_from_csv(path, bins=4).total == len(present)
+    assert load_numbers_from_csv(path) == present
+    assert load_numbers_from_csv(path, use_streaming=True, chunk_size=3) == present
+
+    stats = describe_csv(path)
+    assert stats.count == len(present)
+    assert stats.total == sum(present)
+    assert stats.variance == pytest.approx(statistics.variance(present))
+    assert (stats.minimum, stats.maximum) == (1.0, 9.0)
+
+
+def test_arrow_input_rejects_missing_or_text_column(tmp_path):
+    path = tmp_path / "nums.parquet"
+    _write_arrow_table(path, [1.0, 2.0])
+    with pytest.raises(DataError):
+        load_column_from_arrow(path, column="missing")
+    with pytest.raises(DataError):
+        load_column_from_arrow(path, column="name")
+    with pytest.raises(DataError):
+        group_by_csv(path, "name")
@@ -0,0 +1,120 @@
+import os
+
+import pytest
+
+from gpt_fusion import analysis
+from gpt_fusion.analysis import (
+    average_from_csv,
+    load_numbers_from_csv,
+    median_from_csv,
+)
+from gpt_fusion.config import get_config
+from gpt_fusion.csv_cache import (
+    clear_csv_cache,
+    load_cached_values,
+    store_cached_values,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "cache"
+    monkeypatch.setattr(get_config(), "CSV_CACHE_DIR", str(directory))
+    return directory
+
+
+def _write_csv(path, values):
+    path.write_text("value\n" + "".join(f"{v}\n" for v in values), encoding="utf-8")
+
+
+def test_cached_load_matches_parse(tmp_path, cache_dir):
+    csv_path = tmp_path / "nums.csv"
+    csv_path.write_text("value\n1\ninvalid\n2.5\n\n3\n", encoding="utf-8")
+
+    assert load_numbers_from_csv(csv_path, use_cache=True) == [1.0, 2.5, 3.0]
+    assert len(list(cache_dir.glob("*.f64"))) == 1
+
+    # Second call is served from the memory-mapped entry
+    cached = load_cached_values(csv_path.resolve())
+    assert cached is not None
+    assert cached.tolist() == [1.0, 2.5, 3.0]
+    assert average_from_csv(csv_path, use_cache=True) == pytest.approx(6.5 / 3)
+    assert median_from_csv(csv_path, use_cache=True) == 2.5
+
+
+def test_cache_invalidated_when_file_changes(tmp_path, cache_dir):
+    csv_path = tmp_path / "nums.csv"
+    _write_csv(csv_path, [1, 2, 3])
+    assert average_from_csv(csv_path, use_cache=True) == 2.0
+
+    _write_csv(csv_path, [10, 20, 30, 40])
+    stat = csv_path.stat()
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert load_cached_values(csv_path.resolve()) is None
+    assert average_from_csv(csv_path, use_cache=True) == 25.0
+
+
+def test_cache_evicts_least_recently_used(tmp_path, cache_dir):
+    first = tmp_path / "first.csv"
+    second = tmp_path / "second.csv"
+    _write_csv(first, range(10))
+    _write_csv(second, range(10))
+
+    # Room for one 10-value entry (32-byte header + 80 bytes of payload)
+    assert store_cached_values(first.resolve(), range(10), max_bytes=150)
+    (entry,) = cache_dir.glob("*.f64")
+    os.utime(entry, ns=(0, 0))
+    assert store_cached_values(second.resolve(), range(10), max_bytes=150)
+
+    assert load_cached_values(first.resolve()) is None
+    assert load_cached_values(second.resolve()) is not None
+
+
+def test_cache_skips_entries_larger_than_limit(tmp_path, cache_dir):
+    csv_path = tmp_path / "nums.csv"
+    _write_csv(csv_path, range(100))
+
+    assert not store_cached_values(csv_path.resolve(), range(100), max_bytes=64)
+    assert load_cached_values(csv_path.resolve()) is None
+
+
+def test_clear_csv_cache(tmp_path, cache_dir):
+    csv_path = tmp_path / "nums.csv"
+    _write_csv(csv_path, [1, 2])
+    load_numbers_from_csv(csv_path, use_cache=True)
+
+    clear_csv_cache()
+    assert list(cache_dir.glob("*.f64")) == []
+
+
+def test_unwritable_cache_falls_back_to_parsed_values(tmp_path, monkeypatch, caplog):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+    monkeypatch.setattr(get_config(), "CSV_CACHE_DIR", str(blocker / "cache"))
+    csv_path = tmp_path / "nums.csv"
+    _write_csv(csv_path, [1, 2])
+
+    assert load_numbers_from_csv(csv_path, use_cache=True) == [1.0, 2.0]
+    assert "Could not write CSV cache" in caplog.text
+
+
+def test_append_during_parse_is_not_cached_as_current(tmp_path, cache_dir, monkeypatch):
+    csv_path = tmp_path / "nums.csv"
+    _write_csv(csv_path, [1, 2])
+    stream = analysis.load_numbers_from_csv_stream
+
+    def appending_stream(path, *args, **kwargs):
+        values = list(stream(path, *args, **kwargs))
+        with open(csv_path, "a", encoding="utf-8") as f:
+            f.write("100\n")
+        stat = csv_path.stat()
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        yield from values
+
+    monkeypatch.setattr(analysis, "load_numbers_from_csv_stream", appending_stream)
+    assert load_numbers_from_csv(csv_path, use_cache=True) == [1.0, 2.0]
+    monkeypatch.setattr(analysis, "load_numbers_from_csv_stream", stream)
+
+    assert load_cached_values(csv_path.resolve()) is None
+    assert load_numbers_from_csv(csv_path, use_cache=True) == [1.0, 2.0, 100.0]
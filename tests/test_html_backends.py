@@ -0,0 +1,79 @@
+"""HTML parser backend tests requiring BeautifulSoup."""
+
+import pytest
+
+pytest.importorskip("bs4")
+
+from gpt_fusion.exceptions import ValidationError  # noqa: E402
+from gpt_fusion.html_backends import (  # noqa: E402
+    HTML_PARSERS,
+    HTMLDocument,
+    _strainer_for,
+    parse_html,
+)
+
+PAGE = """
+<html><head><title> Shop </title></head><body>
+<div id="main">
+  <p class="msg">Hello <b>big</b> world</p>
+  <p class="msg other">Second</p>
+  <p>Plain</p>
+  <a href="/one" class="link">One</a>
+  <a href="/two">Two</a>
+</div>
+</body></html>
+"""
+
+
+def _backend(parser):
+    if parser == "lxml":
+        pytest.importorskip("lxml")
+    elif parser == "html5lib":
+        pytest.importorskip("html5lib")
+    elif parser == "selectolax":
+        pytest.importorskip("selectolax")
+    return parser
+
+
+@pytest.mark.parametrize("parser", HTML_PARSERS)
+@pytest.mark.parametrize("strain", [True, False])
+def test_backends_agree(parser, strain):
+    parser = _backend(parser)
+    selectors = ["p.msg", "a[href]", "title"]
+    document = parse_html(PAGE, parser, selectors if strain else None)
+
+    texts = [document.text(el) for el in document.select("p.msg")]
+    assert texts == ["Hellobigworld", "Second"]
+    links = document.select("a[href]")
+    assert [document.attribute(el, "href") for el in links] == ["/one", "/two"]
+    assert document.attribute(links[1], "class") is None
+    assert [document.text(el) for el in document.select("title")] == ["Shop"]
+
+
+def test_strainer_only_for_simple_selectors():
+    assert _strainer_for(("p.msg", "a[href], title")) is not None
+    assert _strainer_for(("div p",)) is None
+    assert _strainer_for(("li:nth-child(2)",)) is None
+    assert _strainer_for(("*",)) is None
+
+
+def test_strainers_are_cached_per_selector_tuple():
+    _strainer_for.cache_clear()
+    for _ in range(3):
+        parse_html(PAGE, "html.parser", ["p.msg", "title"]).select("p.msg")
+    assert _strainer_for.cache_info().hits == 2
+    assert _strainer_for(("p.msg", "title")) is _strainer_for(("p.msg", "title"))
+
+
+def test_incomplete_backend_fails_on_creation():
+    class SelectOnly(HTMLDocument):
+        def select(self, css_selector):
+            return []
+
+    with pytest.raises(TypeError):
+        SelectOnly()
+
+
+def test_unknown_parser_rejected():
+    with pytest.raises(ValidationError):
+        parse_html(PAGE, "regex")
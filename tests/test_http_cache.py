@@ -0,0 +1,109 @@
+"""HTTP response cache tests requiring requests."""
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from requests.adapters import HTTPAdapter  # noqa: E402
+from unittest.mock import patch  # noqa: E402
+
+from gpt_fusion.http_cache import CachingAdapter, ResponseCache  # noqa: E402
+
+URL = "http://example.com/page"
+
+
+class FakeServer:
+    """Stand-in for the network answering with ETag-based revalidation."""
+
+    def __init__(self, body=b"<p>hello</p>", headers=None):
+        self.body = body
+        # A header given as None removes the default ETag
+        headers = {"ETag": '"v1"', **(headers or {})}
+        self.headers = {k: v for k, v in headers.items() if v is not None}
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(dict(request.headers))
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        response.headers = requests.structures.CaseInsensitiveDict(self.headers)
+        etag = self.headers.get("ETag")
+        if etag and request.headers.get("If-None-Match") == etag:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = self.body
+        return response
+
+
+def _session(cache):
+    session = requests.Session()
+    session.mount("http://", CachingAdapter(cache))
+    return session
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(tmp_path / "http", max_bytes=10_000, memory_bytes=1_000)
+
+
+def test_revalidates_with_etag_and_serves_304_from_cache(cache):
+    server = FakeServer()
+    with patch.object(HTTPAdapter, "send", server.send):
+        session = _session(cache)
+        assert session.get(URL).text == "<p>hello</p>"
+        second = session.get(URL)
+
+    assert second.status_code == 200
+    assert second.text == "<p>hello</p>"
+    assert second.from_cache
+    assert server.requests[1]["If-None-Match"] == '"v1"'
+    assert cache.stats == {"hits": 0, "revalidations": 1, "misses": 1}
+
+
+def test_fresh_responses_skip_the_network(cache, tmp_path):
+    server = FakeServer(headers={"Cache-Control": "public, max-age=60"})
+    with patch.object(HTTPAdapter, "send", server.send):
+        _session(cache).get(URL)
+        # A new cache over the same directory reads the entry from disk
+        disk_cache = ResponseCache(tmp_path / "http")
+        assert _session(disk_cache).get(URL).text == "<p>hello</p>"
+
+    assert len(server.requests) == 1
+    assert disk_cache.hits == 1
+
+
+def test_no_store_responses_are_not_cached(cache):
+    server = FakeServer(headers={"Cache-Control": "no-store"})
+    with patch.object(HTTPAdapter, "send", server.send):
+        session = _session(cache)
+        session.get(URL)
+        session.get(URL)
+
+    assert "If-None-Match" not in server.requests[1]
+    assert cache.misses == 2
+
+
+def test_responses_without_validator_or_max_age_are_not_stored(cache, tmp_path):
+    server = FakeServer(headers={"ETag": None, "Cache-Control": "max-age=0"})
+    with patch.object(HTTPAdapter, "send", server.send):
+        _session(cache).get(URL)
+
+    assert cache.get(URL) is None
+    assert list((tmp_path / "http").glob("*.http")) == []
+
+
+def test_cache_evicts_by_total_size(tmp_path):
+    cache = ResponseCache(tmp_path / "http", max_bytes=1_500, memory_bytes=0)
+    server = FakeServer(body=b"x" * 1_000)
+    with patch.object(HTTPAdapter, "send", server.send):
+        session = _session(cache)
+        session.get(URL + "1")
+        session.get(URL + "2")
+
+    assert len(list((tmp_path / "http").glob("*.http"))) == 1
+    assert cache.get(URL + "2") is not None
+    cache.clear()
+    assert cache.get(URL + "2") is None
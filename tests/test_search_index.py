@@ -0,0 +1,86 @@
+import pytest
+
+from gpt_fusion.exceptions import DataError
+from gpt_fusion.search_index import InvertedIndex, tokenize
+
+DOCS = [
+    "The quick brown fox jumps over the lazy dog.",
+    "A quick brown dog outpaces a quick red fox!",
+    "Lazy afternoons: the dog sleeps, the fox waits.",
+    "Nothing to see here",
+]
+
+
+@pytest.fixture
+def index():
+    index = InvertedIndex()
+    for i, doc in enumerate(DOCS):
+        index.add(doc, key=f"doc{i}")
+    return index
+
+
+def test_tokenize_strips_punctuation_and_case():
+    assert tokenize("Hello, World! hello") == ["hello", "world", "hello"]
+
+
+def test_term_and_phrase_queries(index):
+    assert index.term_query("fox") == [0, 1, 2]
+    assert index.term_query("quick DOG") == [0, 1]
+    assert index.term_query("fox missing") == []
+    assert index.phrase_query("quick brown") == [0, 1]
+    assert index.phrase_query("brown fox") == [0]
+    assert index.phrase_query("the dog sleeps") == [2]
+    assert index.phrase_query("") == []
+    assert index.key(1) == "doc1"
+
+
+@pytest.mark.parametrize("method", ["bm25", "tfidf"])
+def test_search_ranks_documents(index, method):
+    results = index.search("quick fox", k=2, method=method)
+    assert [doc_id for doc_id, _ in results] == [1, 0]
+    assert results[0][1] > results[1][1] > 0
+    assert index.search("unknown", method=method) == []
+
+
+def test_search_rejects_unknown_method(index):
+    with pytest.raises(ValueError):
+        index.search("fox", method="cosine")
+
+
+def test_save_load_and_incremental_add(tmp_path, index):
+    path = tmp_path / "index.gfx"
+    index.save(path)
+
+    with InvertedIndex.load(path) as loaded:
+        assert len(loaded) == len(DOCS)
+        assert loaded.search("quick fox") == index.search("quick fox")
+        assert loaded.phrase_query("lazy dog") == [0]
+
+        assert loaded.add("the fox returns", key="late") == 4
+        assert loaded.term_query("fox") == [0, 1, 2, 4]
+        loaded.save(path)
+
+    reloaded = InvertedIndex.load(path)
+    assert reloaded.term_query("fox") == [0, 1, 2, 4]
+    assert reloaded.key(4) == "late"
+    reloaded.materialize()
+    assert reloaded.phrase_query("fox returns") == [4]
+
+
+def test_close_releases_map_without_copying(tmp_path, index):
+    path = tmp_path / "index.gfx"
+    index.save(path)
+
+    with InvertedIndex.load(path) as loaded:
+        loaded.add("a brand new term")
+    assert loaded._postings.keys() == {"a", "brand", "new", "term"}
+    assert loaded.term_query("brand") == [4]
+    with pytest.raises(ValueError):
+        loaded.term_query("fox")
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "bogus.gfx"
+    path.write_bytes(b"not an index")
+    with pytest.raises(DataError):
+        InvertedIndex.load(path)
@@ -0,0 +1,149 @@
+import json
+import random
+import statistics
+
+import pytest
+
+from gpt_fusion import sketches
+from gpt_fusion.analysis import median_from_csv, sketch_from_csv
+from gpt_fusion.sketches import HeavyHitters, HyperLogLog, QuantileSketch
+
+
+def _rank_error(values, estimate, q):
+    rank = sum(1 for v in values if v <= estimate) / len(values)
+    return abs(rank - q)
+
+
+def test_quantile_sketch_exact_for_small_streams():
+    sketch = QuantileSketch()
+    sketch.update_many([5.0, 1.0, 4.0, 2.0])
+    assert sketch.quantile(0.5) == statistics.median([5.0, 1.0, 4.0, 2.0])
+    assert sketch.quantiles([0, 1]) == [1.0, 5.0]
+
+
+def test_quantile_sketch_bounded_memory_and_error():
+    rng = random.Random(42)
+    values = [rng.random() for _ in range(50_000)]
+    sketch = QuantileSketch(k=200)
+    sketch.update_many(values)
+
+    stored = sum(len(level) for level in sketch._levels)
+    assert stored < 4 * sketch.k
+    for q in (0.1, 0.5, 0.9):
+        assert _rank_error(values, sketch.quantile(q), q) < sketch.rank_error
+
+
+def test_quantile_sketch_merge_and_serialise():
+    rng = random.Random(7)
+    values = [rng.gauss(0, 1) for _ in range(20_000)]
+    left, right = QuantileSketch(k=100), QuantileSketch(k=100)
+    left.update_many(values[:8_000])
+    right.update_many(values[8_000:])
+
+    restored = QuantileSketch.from_dict(json.loads(json.dumps(right.to_dict())))
+    merged = left.merge(restored)
+    assert merged.count == len(values)
+    assert merged.minimum == min(values)
+    assert merged.maximum == max(values)
+    assert _rank_error(values, merged.quantile(0.5), 0.5) < merged.rank_error
+
+
+def test_quantile_sketch_rejects_bad_input():
+    with pytest.raises(ValueError):
+        QuantileSketch().quantile(0.5)
+    with pytest.raises(ValueError):
+        QuantileSketch.with_error(0)
+
+
+def test_median_from_csv_approximate(tmp_path):
+    csv_path = tmp_path / "nums.csv"
+    csv_path.write_text(
+        "value\n" + "".join(f"{i}\n" for i in range(10_001)), encoding="utf-8"
+    )
+
+    estimate = median_from_csv(csv_path, approximate=True, error=0.01)
+    assert abs(estimate - 5_000) <= 0.01 * 10_001
+    sketch = sketch_from_csv(csv_path, error=0.05)
+    assert sketch.count == 10_001
+
+
+def test_heavy_hitters_exact_and_merge():
+    left, right = HeavyHitters(), HeavyHitters()
+    left.update_many("a b a c".split())
+    right.update_many("c c d".split())
+    right.update("a", 2)
+
+    merged = left.merge(HeavyHitters.from_dict(json.loads(json.dumps(right.to_dict()))))
+    assert merged.total == 9
+    assert merged.top(3) == [("a", 4), ("c", 3), ("b", 1)]
+    assert merged.error("a") == 0
+
+
+def test_heavy_hitters_bounded_error():
+    rng = random.Random(11)
+    stream = ["heavy"] * 3_000 + [f"x{rng.randrange(5_000)}" for _ in range(7_000)]
+    rng.shuffle(stream)
+    halves = HeavyHitters(capacity=100), HeavyHitters(capacity=100)
+    for summary, part in zip(halves, (stream[:5_000], stream[5_000:])):
+        for start in range(0, len(part), 250):
+            summary.update_many(part[start : start + 250])
+
+    merged = halves[0].merge(halves[1])
+    assert len(merged) <= 100
+    assert merged.top(1)[0][0] == "heavy"
+    count, error = merged.count("heavy"), merged.error("heavy")
+    assert count - error <= 3_000 <= count
+    assert error <= merged.total / 100 * 2
+
+
+def test_heavy_hitters_merge_exact_into_bounded():
+    exact, bounded = HeavyHitters(), HeavyHitters(capacity=2)
+    exact.update_counts({"a": 3, "b": 3})
+    bounded.update("x", 10)
+
+    merged = exact.merge(bounded)
+    assert merged.capacity == 2
+    assert merged.count("x") == 10
+    assert merged.error("x") == 0
+    assert merged.total == 16
+
+
+def test_heavy_hitters_rejects_bad_capacity():
+    with pytest.raises(ValueError):
+        HeavyHitters(capacity=0)
+
+
+def test_hyperloglog_estimate_within_error():
+    sketch = HyperLogLog(precision=12)
+    sketch.update_many(f"item{i}" for i in range(50_000))
+    sketch.update_many(f"item{i}" for i in range(10_000))
+    assert abs(sketch.estimate() - 50_000) <= 3 * sketch.relative_error * 50_000
+
+    small = HyperLogLog()
+    small.update_many(["a", "b", "a", "c"])
+    assert small.estimate() == 3
+
+
+def test_hyperloglog_update_many_matches_update_across_batches(monkeypatch):
+    monkeypatch.setattr(sketches, "_HLL_BATCH", 7)
+    items = [f"w{i % 40}" for i in range(500)]
+    batched, single = HyperLogLog(precision=8), HyperLogLog(precision=8)
+    batched.update_many(iter(items))
+    for item in items:
+        single.update(item)
+    assert batched.to_dict() == single.to_dict()
+
+
+def test_hyperloglog_merge_and_serialise():
+    left, right = HyperLogLog(precision=10), HyperLogLog(precision=10)
+    left.update_many(str(i) for i in range(0, 6_000))
+    right.update_many(str(i) for i in range(4_000, 10_000))
+
+    restored = HyperLogLog.from_dict(json.loads(json.dumps(right.to_dict())))
+    merged = left.merge(restored)
+    assert abs(merged.estimate() - 10_000) <= 3 * merged.relative_error * 10_000
+
+    with pytest.raises(ValueError):
+        left.merge(HyperLogLog(precision=11))
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=3)
@@ -1,12 +1,30 @@
+import io
+from collections import Counter
+from concurrent.futures import Future
+
+import pytest
+
+from gpt_fusion import text_utils
 from gpt_fusion.text_utils import (
+    TextStats,
+    analyze_text,
     count_characters,
+    count_characters_batch,
     is_palindrome,
+    iter_words,
     most_common_word,
+    most_common_word_batch,
     remove_punctuation,
     reverse_words,
+    stream_top_words,
     to_title_case,
+    top_words,
     unique_words,
+    unique_words_batch,
+    unique_words_sketch,
     word_count,
+    word_count_batch,
+    word_frequencies,
 )
 
 
@@ -40,3 +58,180 @@ def test_to_title_case():
 
 def test_is_palindrome():
     assert is_palindrome("A man, a plan, a canal: Panama")
+
+
+DOCUMENTS = ["a b a", "", "Hello hello world", "  spaced   out  ", "x"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_functions_match_single_calls(workers):
+    docs = iter(DOCUMENTS)
+    assert word_count_batch(docs, workers=workers, chunk_size=2) == [
+        word_count(doc) for doc in DOCUMENTS
+    ]
+    assert unique_words_batch(DOCUMENTS, workers=workers, chunk_size=2) == [
+        unique_words(doc) for doc in DOCUMENTS
+    ]
+    assert most_common_word_batch(
+        DOCUMENTS, case_sensitive=False, workers=workers, chunk_size=2
+    ) == [most_common_word(doc, case_sensitive=False) for doc in DOCUMENTS]
+    assert count_characters_batch(DOCUMENTS, workers=workers) == [
+        count_characters(doc) for doc in DOCUMENTS
+    ]
+
+
+class _InlinePool:
+    """Executor stand-in running chunks eagerly and tracking chunks in flight."""
+
+    def __init__(self, max_workers):
+        self.in_flight = self.peak = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def submit(self, fn, *args):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        future = Future()
+        future.set_result(fn(*args))
+        result = future.result
+
+        def collect(timeout=None):
+            self.in_flight -= 1
+            return result(timeout)
+
+        future.result = collect
+        return future
+
+
+def test_batch_keeps_a_bounded_window_of_chunks(monkeypatch):
+    pools = []
+    monkeypatch.setattr(
+        text_utils,
+        "ProcessPoolExecutor",
+        lambda max_workers: pools.append(_InlinePool(max_workers)) or pools[-1],
+    )
+    docs = (f"doc {i} " * i for i in range(50))
+
+    counts = word_count_batch(docs, workers=2, chunk_size=3)
+    assert counts == [2 * i for i in range(50)]
+    assert pools[0].peak <= 4
+
+
+def test_batch_rejects_bad_chunk_size():
+    with pytest.raises(ValueError):
+        word_count_batch(DOCUMENTS, chunk_size=0)
+
+
+@pytest.mark.parametrize(
+    "text", ["", "   ", "b a B b A a", "The the THE cat", "tie\tbreak tie break\n"]
+)
+def test_text_stats_matches_functions(text):
+    stats = analyze_text(text)
+    assert stats.word_count == word_count(text)
+    assert stats.unique_words == unique_words(text)
+    assert stats.char_count == count_characters(text)
+    for case_sensitive in (True, False):
+        assert stats.most_common_word(case_sensitive) == most_common_word(
+            text, case_sensitive=case_sensitive
+        )
+
+
+def test_text_stats_tokenizes_once():
+    stats = TextStats("a b a")
+    assert stats.frequencies == {"a": 2, "b": 1}
+    words = stats.words
+    stats.unique_words, stats.most_common_word(False)
+    assert stats.words is words
+
+
+CORPUS = "the cat  sat on\tthe mat\nThe cat ate the rat "
+
+
+def test_iter_words_keeps_words_across_chunks(tmp_path):
+    path = tmp_path / "corpus.txt"
+    path.write_text(CORPUS, encoding="utf-8")
+
+    assert list(iter_words(path, chunk_size=3)) == CORPUS.split()
+    assert list(iter_words(io.StringIO(CORPUS), chunk_size=5)) == CORPUS.split()
+    assert list(iter_words(CORPUS, chunk_size=4)) == CORPUS.split()
+    chunks = ["the c", "at", " s", "", "at"]
+    assert list(iter_words(chunks, case_sensitive=False)) == ["the", "cat", "sat"]
+
+
+def test_stream_top_words_exact(tmp_path):
+    path = tmp_path / "corpus.txt"
+    path.write_text(CORPUS, encoding="utf-8")
+
+    expected = Counter(CORPUS.lower().split())
+    summary = word_frequencies(path, case_sensitive=False, chunk_size=4)
+    assert summary.total == sum(expected.values())
+    assert {w: summary.count(w) for w in expected} == expected
+    assert stream_top_words(path, k=2, chunk_size=4) == [("the", 3), ("cat", 2)]
+
+
+def test_stream_top_words_approximate():
+    text = " ".join(["hot"] * 500 + ["warm"] * 200 + [f"w{i}" for i in range(2000)])
+    chunks = [text[i : i + 97] for i in range(0, len(text), 97)]
+
+    top = stream_top_words(chunks, k=2, capacity=50)
+    assert [word for word, _ in top] == ["hot", "warm"]
+    summary = word_frequencies(chunks, capacity=50)
+    assert len(summary) <= 50
+    assert summary.count("hot") - summary.error("hot") <= 500 <= summary.count("hot")
+
+
+def test_top_words_orders_by_count_then_alphabetically():
+    text = "b a c b a d B"
+    assert top_words(text, 3) == [("a", 2), ("b", 2), ("B", 1)]
+    assert top_words(text, 2, case_sensitive=False) == [("b", 3), ("a", 2)]
+    assert top_words(text, 1) == [("a", 2)]
+    assert top_words(text, 0) == []
+    assert top_words("", 3) == []
+    assert top_words(text, 10) == sorted(
+        Counter(text.split()).items(), key=lambda item: (-item[1], item[0])
+    )
+
+
+def test_unique_words_sketch_accepts_text_and_chunks(tmp_path):
+    text = " ".join(f"w{i % 300}" for i in range(2_000)) + " W1"
+    assert abs(unique_words_sketch(text).estimate() - 301) <= 3
+    path = tmp_path / "corpus.txt"
+    path.write_text(text, encoding="utf-8")
+    assert (
+        unique_words_sketch(text, chunk_size=5).to_dict()
+        == unique_words_sketch(path).to_dict()
+        == unique_words_sketch(text).to_dict()
+    )
+    chunks = [text[i : i + 7] for i in range(0, len(text), 7)]
+    assert (
+        unique_words_sketch(chunks, case_sensitive=False).to_dict()
+        == unique_words_sketch(text.lower()).to_dict()
+    )
+
+
+def test_split_at_whitespace_never_cuts_words():
+    text = "alpha beta\u2003gamma\tdelta  epsilon"
+    for parts in range(1, 8):
+        pieces = text_utils._split_at_whitespace(text, parts)
+        assert "".join(pieces) == text
+        assert sum(len(piece.split()) for piece in pieces) == len(text.split())
+
+
+def test_parallel_text_functions_match_serial(monkeypatch):
+    monkeypatch.setattr(text_utils, "_PARALLEL_MIN_CHARS", 0)
+    text = " ".join(["Hello,", "world!", "hello", "WORLD\u3000x"] * 50) + " tail"
+
+    assert word_count(text, workers=3) == word_count(text)
+    assert remove_punctuation(text, workers=3) == remove_punctuation(text)
+    for case_sensitive in (True, False):
+        assert most_common_word(
+            text, case_sensitive=case_sensitive, workers=3
+        ) == most_common_word(text, case_sensitive=case_sensitive)
+        assert top_words(text, 3, case_sensitive, workers=2) == top_words(
+            text, 3, case_sensitive
+        )
+    assert word_count("", workers=2) == 0
@@ -1,4 +1,8 @@
+import asyncio
+import threading
+import time
 from unittest.mock import Mock, patch
+from urllib.parse import urlparse
 
 """Web scraper tests requiring requests and BeautifulSoup."""
 
@@ -9,7 +13,14 @@ pytest.importorskip("bs4")
 
 import requests  # noqa: E402
 
-from gpt_fusion.web_scraper import scrape  # noqa: E402
+from gpt_fusion.exceptions import ValidationError  # noqa: E402
+from gpt_fusion.html_backends import parse_html  # noqa: E402
+from gpt_fusion.web_scraper import (  # noqa: E402
+    scrape,
+    scrape_fields,
+    scrape_many,
+    scrape_many_sync,
+)
 
 
 def test_scrape_parses_text():
@@ -38,6 +49,47 @@ def test_scrape_parses_text():
     assert result == ["Hello", "World"]
 
 
+def test_scrape_fields_uses_one_request_and_one_parse():
+    html = (
+        "<html><head><title>Shop</title></head><body>"
+        "<a href='/p/1'><span class='price'>1.50</span></a>"
+        "<a href='/p/2'><span class='price'>3.00</span></a>"
+        "<a>No link</a>"
+        "</body></html>"
+    )
+
+    with (
+        patch("gpt_fusion.web_scraper._get_session") as mock_get_session,
+        patch("gpt_fusion.web_scraper.parse_html", wraps=parse_html) as mock_parse,
+    ):
+        mock_session = Mock()
+        mock_get_session.return_value = mock_session
+        mock_response = Mock()
+        mock_response.text = html
+        mock_session.get.return_value = mock_response
+
+        result = scrape_fields(
+            "http://example.com",
+            {"title": "title", "prices": "span.price", "links": ("a", "href")},
+        )
+        mock_session.get.assert_called_once()
+        mock_parse.assert_called_once()
+
+    assert result == {
+        "title": ["Shop"],
+        "prices": ["1.50", "3.00"],
+        "links": ["/p/1", "/p/2"],
+    }
+
+
+@pytest.mark.parametrize("fields", [{}, {"x": ("a",)}, {"x": 3}])
+def test_scrape_fields_rejects_bad_fields_before_fetching(fields):
+    with patch("gpt_fusion.web_scraper._get_session") as mock_get_session:
+        with pytest.raises(ValidationError):
+            scrape_fields("http://example.com", fields)
+        mock_get_session.assert_not_called()
+
+
 def test_scrape_connection_error_raises_exception():
     with patch("gpt_fusion.web_scraper._get_session") as mock_get_session:
         mock_session = Mock()
@@ -50,3 +102,115 @@ def test_scrape_connection_error_raises_exception():
             "http://example.com",
             timeout=10,
         )
+
+
+def _fake_session(pages, delay=0.0, active=None):
+    """Return a mock session serving *pages* and tracking per-host overlap."""
+    lock = threading.Lock()
+
+    def get(url, timeout):
+        host = urlparse(url).netloc
+        with lock:
+            active[host] = active.get(host, 0) + 1
+            active["max:" + host] = max(active.get("max:" + host, 0), active[host])
+        try:
+            time.sleep(delay)
+            if url not in pages:
+                raise requests.exceptions.HTTPError(f"404 for {url}")
+            response = Mock()
+            response.text = pages[url]
+            response.raise_for_status = Mock()
+            return response
+        finally:
+            with lock:
+                active[host] -= 1
+
+    session = Mock()
+    session.get.side_effect = get
+    return session
+
+
+def test_scrape_many_reports_errors_without_cancelling():
+    pages = {f"http://a.example/{i}": f"<p class='msg'>page {i}</p>" for i in range(10)}
+    urls = list(pages) + ["ftp://bad.example/x", "http://a.example/missing"]
+    active = {}
+    with patch("gpt_fusion.web_scraper._get_session") as mock_get_session:
+        mock_get_session.return_value = _fake_session(pages, 0.01, active)
+        results = scrape_many_sync(urls, "p.msg", concurrency=8, per_host=2)
+
+    by_url = {result.url: result for result in results}
+    assert len(results) == len(urls)
+    assert by_url["http://a.example/3"].texts == ["page 3"]
+    assert by_url["http://a.example/3"].ok
+    assert isinstance(by_url["ftp://bad.example/x"].error, ValidationError)
+    assert isinstance(
+        by_url["http://a.example/missing"].error, requests.exceptions.HTTPError
+    )
+    assert active["max:a.example"] <= 2
+
+
+def test_scrape_many_streams_results_async():
+    pages = {f"http://h{i}.example/": f"<b>{i}</b>" for i in range(5)}
+
+    async def first_two():
+        results = []
+        async for result in scrape_many(pages, "b", concurrency=5, timeout=3):
+            results.append(result)
+            if len(results) == 2:
+                break
+        return results
+
+    with patch("gpt_fusion.web_scraper._get_session") as mock_get_session:
+        mock_get_session.return_value = _fake_session(pages, active={})
+        results = asyncio.run(first_two())
+
+    assert len(results) == 2
+    assert all(result.ok and result.texts for result in results)
+
+
+def test_scrape_many_close_does_not_wait_for_requests_in_flight():
+    release = threading.Event()
+
+    def get(url, timeout):
+        if "slow" in url:
+            release.wait(5)
+        response = Mock()
+        response.text = "<b>done</b>"
+        return response
+
+    async def first_then_close():
+        results = scrape_many(
+            ["http://fast.example/"] + [f"http://slow{i}.example/" for i in range(3)]
+        )
+        first = await results.__anext__()
+        start = time.perf_counter()
+        await results.aclose()
+        return first, time.perf_counter() - start
+
+    with patch("gpt_fusion.web_scraper._get_session") as mock_get_session:
+        mock_get_session.return_value = Mock(get=Mock(side_effect=get))
+        try:
+            first, elapsed = asyncio.run(first_then_close())
+        finally:
+            release.set()
+
+    assert first.url == "http://fast.example/"
+    assert elapsed < 1
+
+
+def test_session_uses_response_cache_when_enabled(tmp_path, monkeypatch):
+    from gpt_fusion import web_scraper
+    from gpt_fusion.config import get_config
+    from gpt_fusion.http_cache import CachingAdapter
+
+    monkeypatch.setattr(get_config(), "HTTP_CACHE_ENABLED", True)
+    monkeypatch.setattr(get_config(), "HTTP_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(web_scraper, "_session", None)
+    monkeypatch.setattr(web_scraper, "_response_cache", None)
+
+    session = web_scraper._get_session()
+    adapter = session.get_adapter("https://example.com")
+    assert isinstance(adapter, CachingAdapter)
+    assert adapter.cache is web_scraper.get_response_cache()
+    assert adapter.cache.cache_dir == tmp_path
+    web_scraper.close_session()